@@ -1,48 +1,72 @@
-import sys
-import os
+from functools import lru_cache
 from agno.agent import Agent
+from agno.memory.v2.memory import Memory
+from agno.memory.v2.summarizer import SessionSummarizer
 #from agno.models.groq import Groq
 from agno.models.openai import OpenAIChat
-from agno.storage.postgres import PostgresStorage
 from agno.playground import Playground, serve_playground_app
 from dotenv import load_dotenv
 
-# Add the parent directory to Python path to allow absolute imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from tools.process_consultation import consult_legal_process_tool
+from tools.process_consultation import consult_legal_process_tool, consult_legal_processes_tool
 
 load_dotenv()
 
 consulta_processo = consult_legal_process_tool
+consulta_processos = consult_legal_processes_tool
+
+
+@lru_cache(maxsize=1)
+def get_agent() -> Agent:
+    """
+    Build the Justice Agent once per process, on demand.
+    
+    Returns:
+        Shared Agent instance
+    """
+    from db.engine import create_agent_storage
 
-db = PostgresStorage(
-    table_name="agent_session",
-    schema="ai",
-    db_url="postgresql://u4hisark730hn2:pc575ba118ece5d11f5f0b30b45d30084ef28de0da28ac9e88d7f4c64ca013346@c80eji844tr0op.cluster-czrs8kj4isg7.us-east-1.rds.amazonaws.com:5432/d6rv9lua3u34k3",
-    auto_upgrade_schema=True
-)
+    db = create_agent_storage()
 
-agent = Agent(
-    model=OpenAIChat(id="gpt-4o-mini"),
-    name="Justice Agent",
-    storage=db,
-    add_history_to_messages=True,
-    num_history_runs=3,
-    tools=[consulta_processo]
-)
+    # Summarize the session instead of replaying past turns (and their large tool outputs)
+    memory = Memory(
+        summarizer=SessionSummarizer(model=OpenAIChat(id="gpt-4o-mini"))
+    )
 
+    return Agent(
+        model=OpenAIChat(id="gpt-4o-mini"),
+        name="Justice Agent",
+        storage=db,
+        memory=memory,
+        enable_session_summaries=True,
+        add_session_summary_references=True,
+        add_history_to_messages=False,
+        tools=[consulta_processo, consulta_processos]
+    )
 
 
-app = Playground(agents=[
-        agent
-]).get_app()
+@lru_cache(maxsize=1)
+def create_app():
+    """
+    Application factory for the Playground.
+    
+    Used by uvicorn with factory=True so the agent and its storage are built inside
+    the serving worker, not in the reloader process or on plain module import.
+    """
+    return Playground(agents=[
+            get_agent()
+    ]).get_app()
+
+
+def __getattr__(name):
+    # AIDEV-NOTE: keeps "agents.web_justice_agent:app" importable without building the agent at import time
+    if name == "app":
+        return create_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
-    serve_playground_app("web_justice_agent:app", reload=True)
+    serve_playground_app("agents.web_justice_agent:create_app", reload=True, factory=True)
 
 
 
 # agent.print_response("Use suas ferramentas para pesquisar a temperatura de hoje em Porto Alegre em Fahrenheit")
-
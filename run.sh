@@ -13,4 +13,4 @@ source .venv/bin/activate
 
 # Executar o script
 echo "🚀 Executando Justice Agent..."
-python3 agents/web_justice_agent.py
+python3 -m agents.web_justice_agent
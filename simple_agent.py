@@ -1,42 +1,223 @@
-from agno.agent import Agent
-from agno.models.groq import Groq
-from agno.storage.postgres import PostgresStorage
+import re
+import sys
+import uuid
+import asyncio
+import threading
+import contextlib
+from functools import lru_cache
+
 from dotenv import load_dotenv
 
 load_dotenv()
 
-db = PostgresStorage(
-    table_name="agent_session",
-    schema="ai",
-    db_url="postgresql://u4hisark730hn2:pc575ba118ece5d11f5f0b30b45d30084ef28de0da28ac9e88d7f4c64ca013346@c80eji844tr0op.cluster-czrs8kj4isg7.us-east-1.rds.amazonaws.com:5432/d6rv9lua3u34k3",
-    auto_upgrade_schema=True
-)
+REASONING_MODEL = "llama-3.3-70b-versatile"
+FAST_MODEL = "llama-3.1-8b-instant"
 
-agent = Agent(
-    model=Groq(id="llama-3.3-70b-versatile"),
-    name="Justice Agent",
-    storage=db,
-    add_history_to_messages=True,
-    num_history_runs=3
+# Short acknowledgements/greetings that never need the large model
+TRIVIAL_TURN_PATTERN = re.compile(
+    r'^\s*(ok(ay)?|obrigad[oa]|valeu|sim|n[aã]o|oi|ol[aá]|bom dia|boa tarde|boa noite|'
+    r'tchau|entendi|certo|beleza|blz|perfeito|show|legal|thanks?|thank you|yes|no|hi|hello)'
+    r'[\s!.,?]*$',
+    re.IGNORECASE
 )
 
-if __name__ == "__main__":
-    print("🤖 Justice Agent iniciado!")
-    print("Digite 'sair' para encerrar")
+
+def is_trivial_turn(user_input: str) -> bool:
+    """
+    Check whether a turn is a plain acknowledgement or greeting.
+    
+    Args:
+        user_input: Raw user message
+        
+    Returns:
+        True if the fast model is enough to answer it
+    """
+    return bool(TRIVIAL_TURN_PATTERN.match(user_input))
+
+
+@lru_cache(maxsize=1)
+def get_memory():
+    """
+    Build the session memory shared by every routed agent.
+    
+    Each Memory keeps its own in-process session summaries; one instance for both
+    models means a turn answered by either agent updates the same summary instead of
+    two copies drifting apart and overwriting each other in storage.
+    
+    Returns:
+        Shared Memory instance
+    """
+    from agno.memory.v2.memory import Memory
+    from agno.memory.v2.summarizer import SessionSummarizer
+    from agno.models.groq import Groq
+
+    # Rolling session summary from a small model replaces replaying full past turns;
+    # it is persisted with the session in storage and injected into the system prompt.
+    # The model is set explicitly so whichever agent runs first doesn't pick it.
+    return Memory(
+        model=Groq(id=FAST_MODEL),
+        summarizer=SessionSummarizer(model=Groq(id=FAST_MODEL))
+    )
+
+
+@lru_cache(maxsize=2)
+def get_agent(model_id: str = REASONING_MODEL):
+    """
+    Build the Justice Agent for a given Groq model on first use.
+    
+    Storage and model setup (and their imports) are deferred until the first real
+    prompt, so starting the REPL or typing 'sair' right away never touches the database.
+    Agents for different models share the same storage and memory (see get_memory),
+    so a session can switch between them turn by turn.
+    
+    Args:
+        model_id: Groq model id
+    
+    Returns:
+        Shared Agent instance for the model
+    """
+    from agno.agent import Agent
+    from agno.models.groq import Groq
+
+    from db.engine import create_agent_storage
+
+    db = create_agent_storage()
+
+    return Agent(
+        model=Groq(id=model_id),
+        name="Justice Agent",
+        storage=db,
+        memory=get_memory(),
+        enable_session_summaries=True,
+        add_session_summary_references=True,
+        add_history_to_messages=False
+    )
+
+
+def route_agent(user_input: str):
+    """
+    Pick the agent for a turn: the fast model for trivial turns, the large one otherwise.
+    
+    Args:
+        user_input: Raw user message
+        
+    Returns:
+        Agent instance to run the turn
+    """
+    return get_agent(FAST_MODEL if is_trivial_turn(user_input) else REASONING_MODEL)
+
+
+async def answer_turns(turns: asyncio.Queue, session_id: str):
+    """
+    Answer queued user turns one at a time, in the order they were typed.
     
+    Args:
+        turns: Queue of user messages
+        session_id: Session shared by both routed agents
+    """
     while True:
+        user_input = await turns.get()
         try:
-            user_input = input("\n💬 Você: ")
-            if user_input.lower() == 'sair':
-                print("👋 Até logo!")
-                break
-            
             print("🤔 Processando...")
-            response = agent.run(user_input)
+            response = await route_agent(user_input).arun(user_input, session_id=session_id)
             print(f"🤖 Justice Agent: {response.content}")
-            
-        except KeyboardInterrupt:
-            print("\n👋 Encerrando...")
-            break
         except Exception as e:
             print(f"❌ Erro: {e}")
+        finally:
+            turns.task_done()
+
+
+def read_line_in_daemon_thread(prompt: str) -> asyncio.Future:
+    """
+    Read one line from stdin on a daemon thread.
+    
+    asyncio.to_thread would use the loop's default executor, and asyncio.run joins
+    that executor on shutdown: after Ctrl-C the REPL would hang until Enter released
+    the thread blocked in input(). A daemon thread is simply abandoned at exit.
+    
+    Args:
+        prompt: Text shown before reading
+    
+    Returns:
+        Future resolved with the line, or failed with EOFError when stdin is closed
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    print(prompt, end="", flush=True)
+    
+    def deliver(result=None, error=None):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def read():
+        # Unbuffered read: a daemon thread parked in sys.stdin's buffered reader would
+        # still hold its lock at interpreter shutdown, which aborts the process
+        line, error = None, None
+        try:
+            raw = sys.stdin.buffer.raw.readline()
+            if not raw:
+                raise EOFError
+            line = raw.decode(sys.stdin.encoding or 'utf-8', errors='replace').rstrip('\r\n')
+        except EOFError as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(deliver, line, error)
+        except RuntimeError:
+            pass  # loop already closed: nobody is waiting for this line
+    
+    threading.Thread(target=read, name="repl-stdin", daemon=True).start()
+    return future
+
+
+async def repl():
+    """
+    Read prompts while earlier turns are still being answered.
+    
+    Uses prompt_toolkit when installed (output printed above the active prompt),
+    otherwise reads stdin on a daemon thread (see read_line_in_daemon_thread).
+    """
+    print("🤖 Justice Agent iniciado!")
+    print("Digite 'sair' para encerrar")
+    
+    # One session shared by both routed agents
+    session_id = str(uuid.uuid4())
+    
+    try:
+        from prompt_toolkit import PromptSession
+        from prompt_toolkit.patch_stdout import patch_stdout
+        prompt_session = PromptSession()
+        read_input = lambda: prompt_session.prompt_async("💬 Você: ")
+        output_context = patch_stdout()
+    except ImportError:
+        read_input = lambda: read_line_in_daemon_thread("\n💬 Você: ")
+        output_context = contextlib.nullcontext()
+    
+    turns: asyncio.Queue = asyncio.Queue()
+    worker = asyncio.create_task(answer_turns(turns, session_id))
+    
+    with output_context:
+        try:
+            while True:
+                user_input = await read_input()
+                if user_input.lower() == 'sair':
+                    # Let already submitted turns finish before leaving
+                    await turns.join()
+                    print("👋 Até logo!")
+                    break
+                if user_input.strip():
+                    turns.put_nowait(user_input)
+        except (KeyboardInterrupt, EOFError):
+            print("\n👋 Encerrando...")
+        finally:
+            worker.cancel()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(repl())
+    except KeyboardInterrupt:
+        print("\n👋 Encerrando...")
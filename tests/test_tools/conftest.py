@@ -0,0 +1,28 @@
+"""
+Shared pytest setup for the Justice Agent tool tests.
+"""
+
+import os
+
+import pytest
+
+# tools.* is importable through the installed package (or pytest's pythonpath
+# setting in pyproject.toml)
+
+# Standalone scripts (interactive prompts, module-level logging setup, sys.exit);
+# run them directly with python instead of collecting them
+collect_ignore = [
+    "test_api_simulation.py",
+    "test_basic_connectivity.py",
+    "test_final_complete.py",
+    "test_real_data.py",
+]
+
+
+@pytest.fixture(scope="session")
+def api_key() -> str:
+    """Web Justice API key from the environment; tests hitting the API skip without it."""
+    key = os.getenv('WEB_JUSTICE_API_KEY')
+    if not key:
+        pytest.skip("WEB_JUSTICE_API_KEY not set")
+    return key
@@ -0,0 +1,110 @@
+"""
+Runner que executa os scripts de teste standalone em um pool de processos pré-aquecido.
+
+Os imports pesados (agno, SQLAlchemy, httpx, ferramentas) são feitos uma única vez no
+processo pai; no Linux os workers são criados com fork e herdam esses módulos já
+carregados (copy-on-write), eliminando o custo de import de cada script. Em macOS/Windows
+usa spawn e cada worker pré-carrega os módulos no initializer.
+
+Uso:
+    python tests/test_tools/runner.py                      # scripts não interativos
+    python tests/test_tools/runner.py test_real_data.py    # scripts específicos
+"""
+
+import io
+import os
+import sys
+import time
+import runpy
+import importlib
+import contextlib
+import multiprocessing
+from typing import List, Tuple
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Scripts executados por padrão (test_api_simulation.py pede confirmação via input())
+DEFAULT_SCRIPTS = (
+    'test_basic_connectivity.py',
+    'test_real_data.py',
+    'test_final_complete.py',
+)
+
+PRELOAD_MODULES = (
+    'httpx',
+    'sqlalchemy',
+    'agno.agent',
+    'agno.tools',
+    'agno.models.groq',
+    'agno.storage.postgres',
+    'tools.process_consultation',
+    'tools.integrations.web_justice_client',
+)
+
+
+def _preload():
+    """Import the heavy modules once; missing optional modules are skipped."""
+    for name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            print(f"⚠️ Preload skipped for {name}: {e}", file=sys.stderr)
+
+
+def _run_script(script: str) -> Tuple[str, int, float, str]:
+    """
+    Run one test script as __main__ inside a worker, capturing its output.
+
+    Returns:
+        (script, exit code, elapsed seconds, captured output)
+    """
+    path = os.path.join(TESTS_DIR, script)
+    output = io.StringIO()
+    start = time.perf_counter()
+    exit_code = 0
+
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        try:
+            runpy.run_path(path, run_name='__main__')
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except BaseException as e:
+            print(f"❌ {type(e).__name__}: {e}")
+            exit_code = 1
+
+    return script, exit_code, time.perf_counter() - start, output.getvalue()
+
+
+def run(scripts: List[str], processes: int = 4) -> int:
+    """
+    Run test scripts in parallel on a warm process pool.
+
+    Args:
+        scripts: Script file names inside tests/test_tools
+        processes: Pool size
+
+    Returns:
+        0 if every script succeeded, 1 otherwise
+    """
+    if 'fork' in multiprocessing.get_all_start_methods():
+        _preload()
+        pool = multiprocessing.get_context('fork').Pool(processes=processes, maxtasksperchild=1)
+    else:
+        pool = multiprocessing.get_context('spawn').Pool(
+            processes=processes, initializer=_preload, maxtasksperchild=1
+        )
+
+    failures = 0
+    with pool:
+        for script, exit_code, elapsed, output in pool.imap(_run_script, scripts):
+            status = "✅" if exit_code == 0 else "❌"
+            print(f"\n{'=' * 60}\n{status} {script} (exit {exit_code}, {elapsed:.2f}s)\n{'=' * 60}")
+            print(output, end='')
+            failures += exit_code != 0
+
+    print(f"\n📊 {len(scripts) - failures}/{len(scripts)} scripts passed")
+    return 0 if failures == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run(sys.argv[1:] or list(DEFAULT_SCRIPTS)))
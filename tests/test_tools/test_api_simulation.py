@@ -4,34 +4,52 @@ This script demonstrates the complete workflow of both tools making real API cal
 to the web-justice-v0 system running locally.
 """
 
-import os
 import sys
-import json
 import time
+import queue
+import atexit
 import logging
+import logging.handlers
 import asyncio
 from typing import Dict, Any, List
 from datetime import datetime
 
-# Add the tools directory to Python path
-sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'tools'))
-
 # Import our tools
-from process_consultation import consult_process
-from document_consultation import consult_document
+from tools.process_consultation import ProcessConsultationTool, aconsult_processes
+from tools.document_consultation import consult_document
+from tools.integrations.web_justice_client import WebJusticeClient
+from tools.config import Settings
+from tools.utils.timing import timed
+from tools.utils.serialization import LazyJSON
+
+# Configure logging to see detailed API interaction.
+# Records go through a queue; the stdout/file writes happen on the listener thread
+# so console and disk I/O never block the consultation and polling code.
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.StreamHandler(sys.stdout),
+    logging.FileHandler(f'test_api_simulation_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
-# Configure logging to see detailed API interaction
 logging.basicConfig(
     level=logging.INFO, 
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler(f'test_api_simulation_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
 
+def log_response(result: Dict[str, Any]):
+    """Log a full tool response; the JSON is only built if the record is emitted."""
+    logger.info("📄 Response received:\n%s", LazyJSON(result))
+
+
 class APISimulationTest:
     """
     Simulates AI Agent API calls to test the complete workflow.
@@ -58,8 +76,9 @@ class APISimulationTest:
         """Check if environment is properly configured."""
         logger.info("🔍 Checking environment configuration...")
         
-        api_key = os.getenv('WEB_JUSTICE_API_KEY')
-        api_url = os.getenv('WEB_JUSTICE_API_URL', 'http://localhost:8000')
+        settings = Settings.load()
+        api_key = settings.api_key
+        api_url = settings.api_url
         
         if not api_key:
             logger.error("❌ WEB_JUSTICE_API_KEY not set")
@@ -71,23 +90,52 @@ class APISimulationTest:
         logger.info(f"✅ API Key: {'*' * (len(api_key) - 4)}{api_key[-4:]}")
         return True
         
+    def wait_for_backend_ready(self, max_queue_depth: int = 10, timeout: float = 30.0) -> bool:
+        """
+        Gate the next test on backend readiness instead of a fixed pause.
+        
+        Polls the health endpoint every 100 ms until the service reports healthy and,
+        when it exposes one, its queue depth is below max_queue_depth.
+        
+        Returns:
+            True if the backend became ready before the timeout
+        """
+        client = WebJusticeClient()
+        deadline = time.monotonic() + timeout
+        while True:
+            health = client.health_check()
+            ready = health.get('status') != 'unhealthy' and health.get('queue_depth', 0) < max_queue_depth
+            if ready:
+                return True
+            if time.monotonic() >= deadline:
+                logger.warning(f"⚠️ Backend not ready after {timeout:.0f}s: {health}")
+                return False
+            time.sleep(0.1)
+    
     def test_process_consultation(self) -> Dict[str, Any]:
         """Test process consultation tool with a valid process number."""
         test_name = "Process Consultation"
         logger.info(f"\n🚀 Starting {test_name} Test")
         
         # Use a test process number (this will likely not exist but will test the workflow)
-        test_input = "I need information about process 1234567-89.2023.1.01.0001"
+        test_input = "1234567-34.2023.1.01.0001"
         
         try:
             logger.info("📞 Making API call to process consultation tool...")
-            result = consult_process(test_input)
+            phases = {}
+            tool = ProcessConsultationTool()
+            try:
+                with timed("total", phases):
+                    result = tool.consult_process(test_input)
+            finally:
+                tool.close()
+            # Per-phase durations are in the "Phase timings for ..." log line of the tool
+            logger.info(f"⏱️ {test_name} took {phases['total']:.3f}s")
             
             self.log_test_result(test_name, result.get('status', 'unknown'), result)
             
             # Log detailed result
-            logger.info("📄 Response received:")
-            logger.info(json.dumps(result, indent=2, ensure_ascii=False))
+            log_response(result)
             
             return result
             
@@ -103,7 +151,7 @@ class APISimulationTest:
         logger.info(f"\n🚀 Starting {test_name} Test")
         
         # Use a test CPF (this will likely not exist but will test the workflow)
-        test_input = "I need to search for processes related to CPF 123.456.789-09"
+        test_input = "123.456.789-09"
         
         try:
             logger.info("📞 Making API call to document consultation tool...")
@@ -112,8 +160,7 @@ class APISimulationTest:
             self.log_test_result(test_name, result.get('status', 'unknown'), result)
             
             # Log detailed result
-            logger.info("📄 Response received:")
-            logger.info(json.dumps(result, indent=2, ensure_ascii=False))
+            log_response(result)
             
             return result
             
@@ -129,7 +176,7 @@ class APISimulationTest:
         logger.info(f"\n🚀 Starting {test_name} Test")
         
         # Use a test CNPJ
-        test_input = "Please search for legal processes involving CNPJ 11.222.333/0001-81"
+        test_input = "11.222.333/0001-81"
         
         try:
             logger.info("📞 Making API call to document consultation tool...")
@@ -138,8 +185,7 @@ class APISimulationTest:
             self.log_test_result(test_name, result.get('status', 'unknown'), result)
             
             # Log detailed result
-            logger.info("📄 Response received:")
-            logger.info(json.dumps(result, indent=2, ensure_ascii=False))
+            log_response(result)
             
             return result
             
@@ -149,39 +195,29 @@ class APISimulationTest:
             logger.error(f"❌ CNPJ consultation failed: {str(e)}")
             return {'status': 'error', 'error': str(e)}
     
-    def test_multiple_processes(self) -> Dict[str, Any]:
-        """Test with multiple process numbers in sequence."""
+    async def test_multiple_processes(self, max_concurrency: int = 3) -> Dict[str, Any]:
+        """Test with multiple process numbers consulted concurrently."""
         test_name = "Multiple Processes"
         logger.info(f"\n🚀 Starting {test_name} Test")
         
         process_numbers = [
-            "7654321-12.2024.8.26.1234",
-            "9876543-21.2023.4.02.5678",
-            "1111111-22.2022.1.01.9999"
+            "7654321-58.2024.8.26.1234",
+            "9876543-92.2023.4.02.5678",
+            "1111111-60.2022.1.01.9999"
         ]
         
-        results = []
+        # Bound in-flight consultations so the worker queue is not flooded
+        logger.info(f"🔄 Testing {len(process_numbers)} processes (up to {max_concurrency} at a time)")
+        outcomes = await aconsult_processes(process_numbers, concurrency=max_concurrency)
         
-        for i, process_num in enumerate(process_numbers, 1):
-            logger.info(f"🔄 Testing process {i}/{len(process_numbers)}: {process_num}")
-            test_input = f"Get details for process {process_num}"
-            
-            try:
-                result = consult_process(test_input)
-                results.append({
-                    'process': process_num,
-                    'result': result
-                })
-                
-                # Brief delay between requests
-                time.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"❌ Failed for process {process_num}: {str(e)}")
-                results.append({
-                    'process': process_num,
-                    'result': {'status': 'error', 'error': str(e)}
-                })
+        results = []
+        for process_num, outcome in zip(process_numbers, outcomes):
+            if outcome.get('status') != 'success':
+                logger.error(f"❌ Failed for process {process_num}: {outcome.get('error')}")
+            results.append({
+                'process': process_num,
+                'result': outcome
+            })
         
         summary = {
             'total_tests': len(process_numbers),
@@ -246,17 +282,18 @@ def main():
     logger.info("🚀 Starting API simulation tests...")
     
     # Test individual tools
+    # Each test starts as soon as the backend reports it can take more work
     test_suite.test_process_consultation()
-    time.sleep(3)  # Brief pause between tests
+    test_suite.wait_for_backend_ready()
     
     test_suite.test_document_consultation()
-    time.sleep(3)
+    test_suite.wait_for_backend_ready()
     
     test_suite.test_cnpj_consultation()
-    time.sleep(3)
+    test_suite.wait_for_backend_ready()
     
     # Test multiple processes
-    test_suite.test_multiple_processes()
+    asyncio.run(test_suite.test_multiple_processes())
     
     # Print summary
     test_suite.print_test_summary()
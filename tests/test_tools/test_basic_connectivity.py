@@ -3,19 +3,13 @@ Basic connectivity test for Justice Agent tools.
 Simple script to verify API connection and basic functionality.
 """
 
-import os
 import sys
 import json
 import logging
 from datetime import datetime
 
-# Hardcoded API Key for testing
-API_KEY = "ai_agent_Dbq48ZxiJXy712hEAEXd_LnsA-qws5cx"
-
-# Add the tools directory to Python path
-sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'tools'))
-
-from integrations.web_justice_client import WebJusticeClient, WebJusticeAPIError
+from tools.integrations.web_justice_client import WebJusticeClient, WebJusticeAPIError
+from tools.config import Settings
 
 # Configure basic logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -27,13 +21,9 @@ def test_basic_connectivity():
     print("🔌 Testing Basic API Connectivity")
     print("=" * 40)
     
-    # Set hardcoded API key
-    os.environ['WEB_JUSTICE_API_KEY'] = API_KEY
-    
-    api_key = API_KEY
-    api_url = os.getenv('WEB_JUSTICE_API_URL', 'http://localhost:8000')
-    
-    print(f"🔑 API Key (hardcoded): {api_key[:12]}...{api_key[-4:]}")
+    settings = Settings.load()
+    api_key = settings.api_key
+    api_url = settings.api_url
     
     if not api_key:
         print("❌ WEB_JUSTICE_API_KEY not set")
@@ -77,7 +67,7 @@ def test_basic_connectivity():
         except WebJusticeAPIError as e:
             print(f"⚠️ Search test failed (expected): {str(e)}")
         
-        client.close()
+        # No client.close(): the connection pool is shared and closed at exit
         print("\n🎉 Basic connectivity test completed successfully!")
         return True
         
@@ -92,16 +82,16 @@ def test_tool_imports():
     print("=" * 40)
     
     try:
-        from process_consultation import consult_process
+        from tools.process_consultation import consult_process
         print("✅ Process consultation tool imported")
         
-        from document_consultation import consult_document  
+        from tools.document_consultation import consult_document  
         print("✅ Document consultation tool imported")
         
-        from utils.process_validator import validate_process_number
+        from tools.utils.process_validator import validate_process_number
         print("✅ Process validator imported")
         
-        from utils.document_validator import validate_cpf
+        from tools.utils.document_validator import validate_cpf
         print("✅ Document validator imported")
         
         print("\n🎉 All tools imported successfully!")
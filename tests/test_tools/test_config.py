@@ -0,0 +1,108 @@
+"""
+Cache da configuração lida do ambiente (offline).
+
+Settings.load() e ToolsConfig.from_environment() leem o ambiente uma vez por processo:
+mudanças só valem depois de Settings.reload() / invalidate_env_cache(). validate_config
+guarda o resultado por instância (congelada) de configuração.
+
+Execução:
+    pytest tests/test_tools/test_config.py
+"""
+
+import dataclasses
+
+import pytest
+
+from tools.config import Settings, ToolsConfig, invalidate_env_cache, validate_config
+
+
+@pytest.fixture(autouse=True)
+def env(monkeypatch):
+    """Ambiente conhecido, sem configuração em cache antes nem depois do teste."""
+    monkeypatch.setenv("WEB_JUSTICE_API_KEY", "key-1")
+    monkeypatch.setenv("WEB_JUSTICE_API_URL", "http://first.test")
+    monkeypatch.setenv("POLLING_MAX_WAIT_TIME", "900")
+    invalidate_env_cache()
+    yield monkeypatch
+    invalidate_env_cache()
+
+
+def test_settings_ignore_env_changes_until_reload(env):
+    first = Settings.load()
+    env.setenv("WEB_JUSTICE_API_KEY", "key-2")
+    env.setenv("WEB_JUSTICE_API_URL", "http://second.test")
+
+    assert Settings.load() is first
+    assert first.api_key == "key-1"
+
+    reloaded = Settings.reload()
+    assert (reloaded.api_key, reloaded.api_url) == ("key-2", "http://second.test")
+    assert Settings.load() is reloaded
+
+
+def test_unset_api_key_is_none(env):
+    env.delenv("WEB_JUSTICE_API_KEY")
+    assert Settings.reload().api_key is None
+
+
+def test_tools_config_ignores_env_changes_until_invalidated(env):
+    first = ToolsConfig.from_environment()
+    env.setenv("WEB_JUSTICE_API_URL", "http://second.test")
+    env.setenv("POLLING_MAX_WAIT_TIME", "60")
+
+    assert ToolsConfig.from_environment() is first
+    assert first.api.base_url == "http://first.test"
+
+    invalidate_env_cache()
+    fresh = ToolsConfig.from_environment()
+    assert fresh.api.base_url == "http://second.test"
+    assert fresh.polling.max_wait_time == 60.0
+
+
+def test_invalidate_env_cache_also_reloads_settings(env):
+    Settings.load()
+    env.setenv("WEB_JUSTICE_API_KEY", "key-2")
+    invalidate_env_cache()
+
+    assert Settings.load().api_key == "key-2"
+
+
+def test_missing_api_key_is_not_cached(env):
+    """Sem chave from_environment falha; definida a chave, a próxima chamada funciona."""
+    env.delenv("WEB_JUSTICE_API_KEY")
+    with pytest.raises(ValueError):
+        ToolsConfig.from_environment()
+
+    env.setenv("WEB_JUSTICE_API_KEY", "key-2")
+    assert ToolsConfig.from_environment().api.api_key == "key-2"
+
+
+def test_validate_config_is_cached_per_config_instance(env):
+    config = ToolsConfig.from_environment()
+    result = validate_config(config)
+
+    assert validate_config(config) is result
+    assert result["valid"] is True
+    with pytest.raises(TypeError):
+        result["valid"] = False  # somente leitura: o mesmo objeto é devolvido a todos
+
+
+def test_validate_config_sees_env_changes_after_invalidation(env):
+    """A validação em cache segue a configuração: ambiente novo, instância nova, validação nova."""
+    before = validate_config(ToolsConfig.from_environment())
+    env.setenv("POLLING_MAX_WAIT_TIME", "0")
+
+    assert validate_config(ToolsConfig.from_environment()) is before
+
+    invalidate_env_cache()
+    after = validate_config(ToolsConfig.from_environment())
+    assert after["valid"] is False
+    assert after["errors"] == ("Max wait time must be positive",)
+
+
+def test_validate_config_for_a_derived_copy(env):
+    config = ToolsConfig.from_environment()
+    derived = dataclasses.replace(config, polling=dataclasses.replace(config.polling, initial_interval=0))
+
+    assert validate_config(derived) is not validate_config(config)
+    assert validate_config(derived)["warnings"] == ("Polling initial interval should be positive",)
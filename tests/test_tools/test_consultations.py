@@ -0,0 +1,38 @@
+"""
+Consultas de ponta a ponta contra a API real, uma por tipo de identificador.
+Substitui os scripts quick_test.py e test_process.py.
+
+Execução (casos em paralelo com pytest-xdist):
+    pytest -n auto tests/test_tools/
+"""
+
+import pytest
+
+
+def _consult_function(kind: str):
+    """Resolve the consultation entrypoint for an identifier kind."""
+    if kind == "processo":
+        from tools.process_consultation import consult_process
+        return consult_process
+    document_consultation = pytest.importorskip("tools.document_consultation")
+    return document_consultation.consult_document
+
+
+@pytest.mark.parametrize("kind,value", [
+    ("cpf", "442.327.038-29"),
+    ("cnpj", "11.222.333/0001-81"),
+    ("processo", "6140319-91.2024.8.09.0051"),
+])
+def test_consultation(api_key, kind, value):
+    """Consulta real: deve retornar sucesso com o resumo preenchido."""
+    from tools.utils.timing import timed, format_timings
+    
+    consult = _consult_function(kind)
+    
+    phases = {}
+    with timed("total", phases):
+        result = consult(value)
+    print(f"⏱️ {kind} {value}: {format_timings(phases)}")
+    
+    assert result.get('status') == 'success', result.get('error')
+    assert 'total_processes' in result.get('summary', {})
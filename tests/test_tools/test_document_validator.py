@@ -0,0 +1,74 @@
+"""
+Extração e validação offline de CPF/CNPJ (sem chamadas à API).
+
+Execução:
+    pytest tests/test_tools/test_document_validator.py
+"""
+
+import pytest
+
+from tools.utils.document_validator import DocumentValidator, extract_documents, validate_cnpj, validate_cpf
+
+CPF = "529.982.247-25"
+CPF_DIGITS = "52998224725"
+OTHER_CPF = "111.444.777-35"
+CNPJ = "11.222.333/0001-81"
+CNPJ_DIGITS = "11222333000181"
+
+
+@pytest.mark.parametrize("text,expected", [
+    (f"CPF {CPF}", [CPF]),
+    (f"CPF {CPF_DIGITS}", [CPF]),
+    (f"CNPJ {CNPJ}", [CNPJ]),
+    (f"CNPJ {CNPJ_DIGITS}", [CNPJ]),
+    ("CPF 529982247-25 e CNPJ 11222333/0001-81", [CPF, CNPJ]),
+    ("nenhum documento aqui", []),
+])
+def test_formatted_and_bare_numbers(text, expected):
+    assert extract_documents(text) == expected
+
+
+def test_documents_come_back_in_text_order():
+    """CNPJ antes do CPF no texto continua antes no resultado."""
+    assert extract_documents(f"{CNPJ}, {OTHER_CPF} e {CPF}") == [CNPJ, OTHER_CPF, CPF]
+
+
+@pytest.mark.parametrize("text", [
+    f"protocolo 9{CPF_DIGITS}",
+    f"protocolo {CPF_DIGITS}0",
+    f"conta 12{CNPJ_DIGITS}34",
+    f"código 7{CPF}",
+])
+def test_numbers_inside_longer_digit_runs_are_ignored(text):
+    """Uma janela de 11/14 dígitos válida dentro de um número maior não é extraída."""
+    assert extract_documents(text) == []
+
+
+def test_duplicates_are_returned_once():
+    text = f"{CPF} / {CPF_DIGITS} / {CNPJ} / {CNPJ_DIGITS} / {CPF}"
+    assert extract_documents(text) == [CPF, CNPJ]
+
+
+@pytest.mark.parametrize("digit", "0123456789")
+def test_all_same_digit_numbers_are_rejected(digit):
+    assert not validate_cpf(digit * 11)
+    assert not validate_cnpj(digit * 14)
+    assert extract_documents(f"{digit * 11} {digit * 14}") == []
+
+
+@pytest.mark.parametrize("cpf", ["529.982.247-24", "529.982.247-35", "52998224715"])
+def test_cpf_checksum_failures(cpf):
+    assert not validate_cpf(cpf)
+    assert extract_documents(f"CPF {cpf}") == []
+
+
+@pytest.mark.parametrize("cnpj", ["11.222.333/0001-82", "11.222.333/0001-91", "11222333000180"])
+def test_cnpj_checksum_failures(cnpj):
+    assert not validate_cnpj(cnpj)
+    assert extract_documents(f"CNPJ {cnpj}") == []
+
+
+def test_invalid_candidates_do_not_hide_valid_ones():
+    """Um número inválido no meio do texto não impede a extração dos demais."""
+    validator = DocumentValidator()
+    assert validator.extract_documents(f"529.982.247-24 {CPF} 11222333000180 {CNPJ}") == [CPF, CNPJ]
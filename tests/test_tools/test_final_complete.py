@@ -3,114 +3,137 @@ Teste final completo do sistema AI Agent.
 Testa ambos os workflows com dados reais e verifica toda a integração.
 """
 
-import os
 import sys
 import json
 import time
+import asyncio
 from datetime import datetime
 
-# Hardcoded API Key for testing
-API_KEY = "ai_agent_Dbq48ZxiJXy712hEAEXd_LnsA-qws5cx"
+from tools.config import Settings
+from tools.integrations.web_justice_client import WebJusticeClient
+from tools.utils import extract_first_document, extract_first_process, timed, format_timings
 
-# Add the tools directory to Python path
-sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'tools'))
+# (título, identificador, tipo de busca)
+CASES = [
+    ("📋 TESTE 1: Consulta por CPF", "442.327.038-29", "document"),
+    ("📋 TESTE 2: Consulta por Número de Processo", "6140319-91.2024.8.09.0051", "process"),
+    ("📋 TESTE 3: Consulta por CNPJ", "11.222.333/0001-81", "document"),
+]
 
-from document_consultation import consult_document
-from process_consultation import consult_process
 
-def test_complete_workflow():
-    """Teste completo do workflow AI Agent."""
-    print("🚀 TESTE FINAL COMPLETO - AI AGENT SYSTEM")
-    print("=" * 60)
-    print(f"⏰ Iniciado em: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+async def fetch_results(client: WebJusticeClient, identifier: str, started: int):
+    """Fetch the results of a ready search and return (result, elapsed seconds)."""
+    try:
+        data = await client.aget_processes(identifier)
+        result = {'status': 'success', 'summary': {'total_processes': data.get('total_processos', 0)}}
+    except Exception as e:
+        result = {'status': 'exception', 'error': {'message': str(e)}}
+    return result, (time.perf_counter_ns() - started) / 1e9
+
+
+async def run_batch(cases, phases: dict) -> list:
+    """
+    Dispatch all searches in one batch, poll every job on a shared cadence
+    and fetch the results concurrently.
     
-    # Set the hardcoded API key in environment
-    os.environ['WEB_JUSTICE_API_KEY'] = API_KEY
+    Args:
+        cases: (title, user input, search type) tuples
+        phases: Receives the batch phase durations (initiate, poll, fetch)
     
-    api_key = API_KEY
-    print(f"🔑 API Key (hardcoded): {api_key[:12]}...{api_key[-4:]}")
-    print()
+    Returns:
+        One (result, elapsed seconds) pair per case, in order
+    """
+    start = time.perf_counter_ns()
+    elapsed = lambda: (time.perf_counter_ns() - start) / 1e9
+    identifiers = [
+        extract_first_process(text) if search_type == "process" else extract_first_document(text)
+        for _, text, search_type in cases
+    ]
     
-    results = []
+    client = WebJusticeClient()
+    outcomes = [None] * len(cases)
+    jobs = {}
     
-    # Teste 1: Consulta por CPF
-    print("📋 TESTE 1: Consulta por CPF")
-    print("-" * 40)
-    try:
-        start = time.time()
-        result1 = consult_document("CPF 442.327.038-29")
-        end = time.time()
-        
-        success1 = result1.get('status') == 'success'
-        results.append(success1)
-        
-        print(f"⏱️ Tempo: {end - start:.1f}s")
-        print(f"📊 Status: {result1.get('status')}")
-        if success1:
-            summary = result1.get('summary', {})
-            print(f"✅ Processos encontrados: {summary.get('total_processes', 0)}")
+    searches = [(identifier, search_type) for identifier, (_, _, search_type) in zip(identifiers, cases)]
+    with timed("initiate", phases):
+        responses = await client.ainitiate_searches_batch(searches)
+    for index, response in enumerate(responses):
+        if isinstance(response, Exception):
+            outcomes[index] = ({'status': 'exception', 'error': {'message': str(response)}}, elapsed())
+        elif not response.get('job_id'):
+            outcomes[index] = ({'status': 'error', 'error': {'message': 'No job ID returned'}}, elapsed())
         else:
-            error = result1.get('error', {})
-            print(f"❌ Erro: {error.get('message', 'Unknown')}")
-    except Exception as e:
-        print(f"❌ Exceção: {str(e)}")
-        results.append(False)
+            jobs[index] = response['job_id']
     
-    print()
+    if jobs:
+        try:
+            with timed("poll", phases):
+                await client.await_jobs(list(jobs.values()))
+        except Exception as e:
+            for index in jobs:
+                outcomes[index] = ({'status': 'exception', 'error': {'message': str(e)}}, elapsed())
+            return outcomes
+        
+        with timed("fetch", phases):
+            fetched = await asyncio.gather(*(fetch_results(client, identifiers[index], start) for index in jobs))
+        for index, outcome in zip(jobs, fetched):
+            outcomes[index] = outcome
     
-    # Teste 2: Consulta por Processo
-    print("📋 TESTE 2: Consulta por Número de Processo")
+    return outcomes
+
+
+def print_case(title: str, result: dict, elapsed: float) -> bool:
+    """Print the outcome of one consultation and return whether it succeeded."""
+    print(title)
     print("-" * 40)
-    try:
-        start = time.time()
-        result2 = consult_process("Processo 6140319-91.2024.8.09.0051")
-        end = time.time()
-        
-        success2 = result2.get('status') == 'success'
-        results.append(success2)
-        
-        print(f"⏱️ Tempo: {end - start:.1f}s")
-        print(f"📊 Status: {result2.get('status')}")
-        if success2:
-            summary = result2.get('summary', {})
-            print(f"✅ Processos encontrados: {summary.get('total_processes', 0)}")
-        else:
-            error = result2.get('error', {})
-            print(f"❌ Erro: {error.get('message', 'Unknown')}")
-    except Exception as e:
-        print(f"❌ Exceção: {str(e)}")
-        results.append(False)
+    success = result.get('status') == 'success'
+    if result.get('status') == 'exception':
+        print(f"❌ Exceção: {result['error']['message']}")
+        print()
+        return False
     
+    print(f"⏱️ Tempo: {elapsed:.1f}s")
+    print(f"📊 Status: {result.get('status')}")
+    if success:
+        summary = result.get('summary', {})
+        print(f"✅ Processos encontrados: {summary.get('total_processes', 0)}")
+    else:
+        error = result.get('error', {})
+        print(f"❌ Erro: {error.get('message', 'Unknown')}")
     print()
+    return success
+
+
+async def test_complete_workflow():
+    """Teste completo do workflow AI Agent."""
+    print("🚀 TESTE FINAL COMPLETO - AI AGENT SYSTEM")
+    print("=" * 60)
+    print(f"⏰ Iniciado em: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    # Teste 3: Consulta por CNPJ
-    print("📋 TESTE 3: Consulta por CNPJ")
-    print("-" * 40)
-    try:
-        start = time.time()
-        result3 = consult_document("CNPJ 11.222.333/0001-81")
-        end = time.time()
-        
-        success3 = result3.get('status') == 'success'
-        results.append(success3)
-        
-        print(f"⏱️ Tempo: {end - start:.1f}s")
-        print(f"📊 Status: {result3.get('status')}")
-        if success3:
-            summary = result3.get('summary', {})
-            print(f"✅ Processos encontrados: {summary.get('total_processes', 0)}")
-        else:
-            error = result3.get('error', {})
-            print(f"❌ Erro: {error.get('message', 'Unknown')}")
-    except Exception as e:
-        print(f"❌ Exceção: {str(e)}")
-        results.append(False)
+    api_key = Settings.load().api_key
+    if not api_key:
+        print("❌ WEB_JUSTICE_API_KEY not set")
+        return False
+    
+    print(f"🔑 API Key: {api_key[:12]}...{api_key[-4:]}")
+    print()
+    
+    # As três consultas são independentes: um único lote inicia todas as buscas
+    # e cada tick de polling verifica todos os jobs pendentes
+    phases = {}
+    outcomes = await run_batch(CASES, phases)
+    print(f"🔬 Fases do lote: {format_timings(phases)}")
+    print()
+    
+    results = [
+        print_case(title, result, elapsed)
+        for (title, _, _), (result, elapsed) in zip(CASES, outcomes)
+    ]
     
     # Resumo final
     total_tests = len(results)
     successful_tests = sum(results)
     
-    print()
     print("=" * 60)
     print("📊 RESUMO FINAL")
     print("=" * 60)
@@ -143,6 +166,5 @@ def test_complete_workflow():
         return False
 
 if __name__ == "__main__":
-    print(f"🔧 Using hardcoded API Key: {API_KEY[:12]}...{API_KEY[-4:]}")
-    success = test_complete_workflow()
+    success = asyncio.run(test_complete_workflow())
     sys.exit(0 if success else 1)
\ No newline at end of file
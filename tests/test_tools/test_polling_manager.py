@@ -0,0 +1,206 @@
+"""
+Agendamento do polling (offline, relógio falso e Random com semente fixa).
+
+Cobre a fase rápida, o backoff com jitter, o reinício do backoff quando o progresso
+avança, as dicas estimated_completion do servidor, o corte das esperas no prazo
+final e o long-poll limitado pelo tempo restante.
+
+Execução:
+    pytest tests/test_tools/test_polling_manager.py
+"""
+
+import random
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from tools.utils import polling_manager as pm
+from tools.utils.polling_manager import PollingConfig, PollingManager, PollingTimeoutError
+
+
+class FakeClock:
+    """Substitui o módulo time do polling_manager: sleep só avança o relógio."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        assert seconds >= 0
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(pm, "time", fake)
+
+    async def fake_async_sleep(seconds):
+        fake.sleep(seconds)
+
+    monkeypatch.setattr(pm.asyncio, "sleep", fake_async_sleep)
+    return fake
+
+
+def _manager(seed=None, **config):
+    manager = PollingManager(PollingConfig(**config))
+    if seed is not None:
+        manager._random = random.Random(seed)
+    return manager
+
+
+def _delays(manager, count):
+    return [manager.next_delay() for _ in range(count)]
+
+
+def test_fast_phase_then_exponential_backoff_without_jitter():
+    manager = _manager(initial_interval=1.0, max_interval=8.0, backoff_multiplier=2.0,
+                       jitter=False, fast_poll_threshold=3)
+
+    assert _delays(manager, 8) == [1.0, 1.0, 1.0, 1.0, 2.0, 4.0, 8.0, 8.0]
+
+
+def test_jittered_delays_are_seeded_and_bounded():
+    """Fase rápida em [0.5x, 1.5x] do intervalo inicial; depois uniforme em [inicial, teto]."""
+    config = dict(initial_interval=1.0, max_interval=8.0, backoff_multiplier=2.0, fast_poll_threshold=2)
+    delays = _delays(_manager(seed=7, **config), 8)
+
+    assert delays == _delays(_manager(seed=7, **config), 8)
+    assert delays != _delays(_manager(seed=8, **config), 8)
+    assert all(0.5 <= d <= 1.5 for d in delays[:2])
+    ceilings = [1.0, 2.0, 4.0, 8.0, 8.0, 8.0]
+    assert all(1.0 <= d <= ceiling for d, ceiling in zip(delays[2:], ceilings))
+
+
+def test_each_manager_has_its_own_random():
+    """Semear um gerenciador não afeta outro nem o random global."""
+    first, second = PollingManager(), PollingManager()
+    assert first._random is not second._random
+
+    random.seed(1)
+    expected = random.random()
+    random.seed(1)
+    _delays(_manager(seed=3), 10)
+    assert random.random() == expected
+
+
+def test_progress_resets_the_backoff_per_job():
+    manager = _manager(initial_interval=1.0, max_interval=20.0, backoff_multiplier=2.0,
+                       jitter=False, fast_poll_threshold=0)
+    manager.note_progress({"progress_percentage": 10}, "a")
+    manager.note_progress({"progress_percentage": 50}, "b")
+    assert _delays(manager, 3) == [1.0, 2.0, 4.0]
+
+    manager.note_progress({"progress_percentage": 10}, "a")  # sem avanço
+    assert manager.next_delay() == 8.0
+
+    manager.note_progress({"progress_percentage": 20}, "a")  # avançou: volta ao início
+    assert _delays(manager, 2) == [1.0, 2.0]
+
+    manager.note_progress({"progress_percentage": 40}, "b")  # "b" regrediu: não reinicia
+    assert manager.next_delay() == 4.0
+
+
+@pytest.mark.parametrize("hint,expected", [
+    (5, 5.0),
+    (0.1, 1.0),      # abaixo do intervalo inicial
+    (600, 20.0),     # acima do intervalo máximo
+])
+def test_server_hint_sets_the_next_delay_once(hint, expected):
+    manager = _manager(initial_interval=1.0, max_interval=20.0, jitter=False, fast_poll_threshold=5)
+    manager.note_progress({"estimated_completion": hint})
+
+    assert manager.next_delay() == expected
+    assert manager.next_delay() == 1.0  # dica consumida
+
+
+def test_server_hints_use_the_earliest_job_and_iso_timestamps():
+    manager = _manager(initial_interval=1.0, max_interval=20.0, jitter=False)
+    eta = (datetime.now(timezone.utc) + timedelta(seconds=12)).isoformat()
+    manager.note_progress({"estimated_completion": eta}, "a")
+    manager.note_progress({"estimated_completion": 6}, "b")
+
+    assert manager.next_delay() == 6.0
+    assert 10.0 < pm._seconds_until(eta) <= 12.0
+
+
+@pytest.mark.parametrize("value", [None, True, "amanhã", {"s": 1}])
+def test_unreadable_hints_are_ignored(value):
+    assert pm._seconds_until(value) is None
+
+
+def test_past_hints_mean_now():
+    assert pm._seconds_until(-3) == 0.0
+    assert pm._seconds_until("2000-01-01T00:00:00Z") == 0.0
+
+
+def test_waits_never_pass_the_deadline(clock):
+    manager = _manager(initial_interval=4.0, max_interval=4.0, jitter=False,
+                       fast_poll_threshold=0, max_wait_time=10.0, timeout_buffer=0.0)
+    polls = []
+
+    def status_checker():
+        polls.append(clock.now)
+        return {"progress_percentage": 0}
+
+    with pytest.raises(PollingTimeoutError):
+        manager.poll_until_complete(status_checker, lambda status: False)
+
+    assert clock.sleeps == [4.0, 4.0, 2.0]
+    assert clock.now == manager.deadline == 1010.0
+    assert polls == [1000.0, 1004.0, 1008.0]
+
+
+def test_async_waits_never_pass_the_deadline(clock):
+    manager = _manager(initial_interval=3.0, max_interval=3.0, jitter=False,
+                       fast_poll_threshold=0, max_wait_time=40.0, timeout_buffer=30.0)
+
+    async def status_checker():
+        return {}
+
+    with pytest.raises(PollingTimeoutError):
+        asyncio.run(manager.apoll_until_complete(status_checker, lambda status: False))
+
+    assert clock.sleeps == [3.0, 3.0, 3.0, 1.0]
+    assert clock.now == manager.deadline == 1010.0
+
+
+def test_watch_timeout_is_capped_by_the_time_left(clock):
+    manager = _manager(max_wait_time=100.0, timeout_buffer=10.0)
+    manager.reset()
+    assert manager.watch_timeout() == pm.LONG_POLL_TIMEOUT
+
+    clock.now += 60
+    assert manager.watch_timeout() == 30.0
+
+    clock.now += 29.5
+    assert manager.watch_timeout() is None  # menos de MIN_WATCH_TIMEOUT restante
+
+
+def test_long_poll_uses_the_remaining_time_then_falls_back(clock):
+    """Watches seguram no máximo o tempo restante; perto do prazo volta à espera comum."""
+    manager = _manager(initial_interval=1.0, max_interval=1.0, jitter=False,
+                       fast_poll_threshold=0, max_wait_time=62.0, timeout_buffer=0.0)
+    calls = []
+
+    def status_checker():
+        calls.append(("status", None))
+        return {"supports_long_poll": True}
+
+    def watch_checker(timeout):
+        calls.append(("watch", timeout))
+        clock.now += timeout - 0.5  # o servidor responde um pouco antes do timeout
+        return {"supports_long_poll": True}
+
+    with pytest.raises(PollingTimeoutError):
+        manager.poll_until_complete(status_checker, lambda status: False, watch_checker=watch_checker)
+
+    assert calls == [("status", None), ("watch", 60.0), ("watch", 2.5)]
+    # Restando 0.5s (< MIN_WATCH_TIMEOUT) não há mais watch: uma espera comum até o prazo
+    assert clock.sleeps == [0.5]
+    assert clock.now == manager.deadline
@@ -0,0 +1,34 @@
+"""
+Validação offline de números de processo CNJ (sem chamadas à API).
+
+Execução:
+    pytest tests/test_tools/test_process_validator.py
+"""
+
+import pytest
+
+from tools.utils.process_validator import ProcessValidator, validate_process_number
+
+VALID_NUMBER = "6140319-91.2024.8.09.0051"
+WRONG_CHECK_DIGITS = "6140319-92.2024.8.09.0051"
+
+
+def test_format_process_parts_checks_dd():
+    """Os dígitos verificadores (DD) seguem o módulo 97 da Resolução CNJ 65/2008."""
+    valid = ProcessValidator.CNJ_FULL_PATTERN.fullmatch(VALID_NUMBER).groups()
+    wrong = ProcessValidator.CNJ_FULL_PATTERN.fullmatch(WRONG_CHECK_DIGITS).groups()
+
+    assert ProcessValidator._format_process_parts(valid) == VALID_NUMBER
+    assert ProcessValidator._format_process_parts(wrong) is None
+
+
+@pytest.mark.parametrize("value,expected", [
+    (VALID_NUMBER, True),
+    ("61403199120248090051", True),
+    (WRONG_CHECK_DIGITS, False),
+    ("61403199220248090051", False),
+])
+def test_validate_process_number(value, expected):
+    """Números bem formatados com DD errado não são aceitos."""
+    assert validate_process_number(value) is expected
+    assert ProcessValidator.validate_process_number(value) is expected
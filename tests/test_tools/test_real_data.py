@@ -3,21 +3,17 @@ Test script with real data to demonstrate the complete AI Agent workflow.
 Uses real process numbers to show the system working with actual data.
 """
 
-import os
 import sys
-import json
 import time
+import asyncio
 import logging
 from datetime import datetime
 
-# Hardcoded API Key for testing
-API_KEY = "ai_agent_ZxlYxQqmNMEvMYrS20yDyb7Nlol6Go3e"
-
-# Add the tools directory to Python path
-sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'tools'))
-
 # Import our tools
-from process_consultation import consult_process
+from tools.process_consultation import ProcessConsultationTool, aconsult_process_stream
+from tools.utils.timing import timed
+from tools.utils.serialization import dumps
+from tools.config import Settings
 
 # Configure logging
 logging.basicConfig(
@@ -37,17 +33,21 @@ def test_real_process_consultation():
     print("=" * 50)
     
     # Real process: 6140319-91.2024.8.09.0051
-    test_input = "Preciso de informações sobre o processo 6140319-91.2024.8.09.0051"
+    test_input = "6140319-91.2024.8.09.0051"
     
     print(f"📝 Input: {test_input}")
     print("📞 Making API call...")
     
     try:
-        start_time = time.time()
-        result = consult_process(test_input)
-        end_time = time.time()
+        phases = {}
+        tool = ProcessConsultationTool()
+        try:
+            with timed("total", phases):
+                result = tool.consult_process(test_input)
+        finally:
+            tool.close()
         
-        print(f"⏱️ Completed in {end_time - start_time:.2f} seconds")
+        print(f"⏱️ Completed in {phases['total']:.2f} seconds")
         print(f"📊 Status: {result.get('status')}")
         
         if result.get('status') == 'success':
@@ -56,7 +56,7 @@ def test_real_process_consultation():
             print(f"📅 Search completed at: {summary.get('search_completed_at')}")
         
         print("\n📄 Full Response:")
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        print(dumps(result, pretty=True))
         
         return result
         
@@ -65,6 +65,30 @@ def test_real_process_consultation():
         return {'status': 'error', 'error': str(e)}
 
 
+async def test_streaming_process_consultation(test_input: str) -> dict:
+    """Consume the streaming consultation, reporting when the first process arrives."""
+    print("\n📡 Testing Streaming Process Consultation")
+    print("=" * 50)
+    
+    count = 0
+    final = {'status': 'error', 'error': 'stream ended without a final event'}
+    
+    start = time.perf_counter()
+    async for event in aconsult_process_stream(test_input):
+        if event['event'] == 'progress':
+            status = event['status']
+            print(f"🔄 {status.get('current_status')} - {status.get('progress_percentage', 0)}%")
+        elif event['event'] == 'process':
+            count += 1
+            if count == 1:
+                print(f"⚡ First process after {time.perf_counter() - start:.2f}s")
+        else:
+            final = event['response']
+    
+    print(f"⏱️ Stream completed in {time.perf_counter() - start:.2f}s with {count} processes ({final.get('status')})")
+    return final
+
+
 def monitor_docker_logs():
     """Show commands to monitor Docker logs."""
     print("\n🐳 Monitor Docker Logs")
@@ -92,10 +116,13 @@ def main():
     print("📊 Test Data:")
     print("  • Process: 6140319-91.2024.8.09.0051")
     
-    # Set hardcoded API key
-    os.environ['WEB_JUSTICE_API_KEY'] = API_KEY
+    api_key = Settings.load().api_key
+    if not api_key:
+        print("\n❌ WEB_JUSTICE_API_KEY not set")
+        print("Set it with: export WEB_JUSTICE_API_KEY='your_key'")
+        return 1
     
-    print(f"\n✅ API Key configured (hardcoded): {API_KEY[:12]}...{API_KEY[-4:]}")
+    print(f"\n✅ API Key configured: {api_key[:12]}...{api_key[-4:]}")
     
     # Show monitoring info
     monitor_docker_logs()
@@ -107,6 +134,11 @@ def main():
     # Test: Process consultation with real process number
     proc_result = test_real_process_consultation()
     
+    # Test: same consultation as a stream of events
+    stream_result = asyncio.run(test_streaming_process_consultation(
+        "6140319-91.2024.8.09.0051"
+    ))
+    
     # Summary
     print(f"\n{'='*60}")
     print("📊 TEST SUMMARY")
@@ -115,6 +147,7 @@ def main():
     proc_status = "✅ SUCCESS" if proc_result.get('status') == 'success' else "❌ FAILED"
     
     print(f"Process Consultation: {proc_status}")
+    print(f"Streaming Consultation: {'✅ SUCCESS' if stream_result.get('status') == 'success' else '❌ FAILED'}")
     
     if proc_result.get('status') == 'success':
         proc_summary = proc_result.get('summary', {})
@@ -127,5 +160,4 @@ def main():
 
 
 if __name__ == "__main__":
-    print(f"🔧 Using hardcoded API Key: {API_KEY[:12]}...{API_KEY[-4:]}")
     sys.exit(main())
\ No newline at end of file
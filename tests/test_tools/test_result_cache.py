@@ -0,0 +1,128 @@
+"""
+Cache de resultados em disco + LRU em memória (offline, tmp_path).
+
+Execução:
+    pytest tests/test_tools/test_result_cache.py
+"""
+
+import os
+import time
+
+import pytest
+
+from tools.process_consultation import ProcessConsultationTool
+from tools.utils import result_cache as result_cache_module
+from tools.utils.result_cache import ResultCache
+
+PROCESS_NUMBER = "6140319-91.2024.8.09.0051"
+VALUE = {"status": "success", "summary": {"from_cache": False}, "data_details": {"processos": [1, 2]}}
+
+
+def _age_entry(cache, kind, identifier, seconds):
+    """Recua o mtime do arquivo da entrada em `seconds`."""
+    path = cache._entry_path(cache.cache_key(kind, identifier))
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache(cache_dir=str(tmp_path), ttl=60.0, enabled=True)
+
+
+def test_disabled_unless_opted_in(tmp_path, monkeypatch):
+    """Sem JUSTICE_AGENT_CACHE=1 o cache não guarda nem devolve nada."""
+    monkeypatch.delenv("JUSTICE_AGENT_CACHE", raising=False)
+    default = ResultCache(cache_dir=str(tmp_path))
+    default.set("process", PROCESS_NUMBER, VALUE)
+
+    assert default.enabled is False
+    assert default.get("process", PROCESS_NUMBER) is None
+    assert list(tmp_path.iterdir()) == []
+
+    monkeypatch.setenv("JUSTICE_AGENT_CACHE", "1")
+    assert ResultCache(cache_dir=str(tmp_path)).enabled is True
+
+
+def test_disk_entry_expires_after_ttl(tmp_path):
+    cache = ResultCache(cache_dir=str(tmp_path), ttl=60.0, enabled=True, memory_entries=0)
+    cache.set("process", PROCESS_NUMBER, VALUE)
+    assert cache.get("process", PROCESS_NUMBER) == VALUE
+
+    _age_entry(cache, "process", PROCESS_NUMBER, 61)
+    assert cache.get("process", PROCESS_NUMBER) is None
+
+
+def test_memory_entry_expires_after_ttl(cache, monkeypatch):
+    """A camada em memória usa o relógio monotônico com o mesmo TTL."""
+    now = [1000.0]
+    monkeypatch.setattr(result_cache_module.time, "monotonic", lambda: now[0])
+    cache.set("process", PROCESS_NUMBER, VALUE)
+    # Sem o arquivo, só a camada em memória pode responder
+    cache._entry_path(cache.cache_key("process", PROCESS_NUMBER)).unlink()
+
+    now[0] += 59
+    assert cache.get("process", PROCESS_NUMBER) == VALUE
+    now[0] += 2
+    assert cache.get("process", PROCESS_NUMBER) is None
+
+
+def test_hits_return_fresh_objects(cache):
+    """Mutar um resultado devolvido não altera o que está em cache (memória ou disco)."""
+    cache.set("process", PROCESS_NUMBER, VALUE)
+    first = cache.get("process", PROCESS_NUMBER)
+    first["summary"]["from_cache"] = True
+    first["data_details"]["processos"].append(3)
+
+    assert cache.get("process", PROCESS_NUMBER) == VALUE
+    assert cache.get("process", PROCESS_NUMBER) is not cache.get("process", PROCESS_NUMBER)
+
+
+def test_memory_layer_is_bounded_lru(tmp_path):
+    cache = ResultCache(cache_dir=str(tmp_path), ttl=60.0, enabled=True, memory_entries=2)
+    for identifier in ("a", "b"):
+        cache.set("process", identifier, VALUE)
+    cache.get("process", "a")  # "a" passa a ser o mais recente
+    cache.set("process", "c", VALUE)
+
+    assert list(cache._memory) == [cache.cache_key("process", k) for k in ("a", "c")]
+
+
+def test_writes_are_atomic(cache, monkeypatch):
+    """Uma escrita que falha deixa a entrada anterior intacta e nenhum arquivo temporário."""
+    cache.set("process", PROCESS_NUMBER, VALUE)
+    assert [p.suffix for p in cache.cache_dir.iterdir()] == [".json"]
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(result_cache_module.os, "replace", failing_replace)
+    fresh = ResultCache(cache_dir=str(cache.cache_dir), ttl=60.0, enabled=True, memory_entries=0)
+    fresh.set("process", PROCESS_NUMBER, {"status": "changed"})
+    monkeypatch.undo()
+
+    assert fresh.get("process", PROCESS_NUMBER) == VALUE
+    assert [p.suffix for p in cache.cache_dir.iterdir()] == [".json"]
+
+
+def test_get_stale_serves_expired_entries_up_to_max_age(cache):
+    cache.set("process", PROCESS_NUMBER, VALUE)
+    _age_entry(cache, "process", PROCESS_NUMBER, 3600)
+    cache._memory.clear()
+
+    assert cache.get("process", PROCESS_NUMBER) is None
+    assert cache.get_stale("process", PROCESS_NUMBER, max_age=7200) == VALUE
+    assert cache.get_stale("process", PROCESS_NUMBER, max_age=1800) is None
+    assert cache.get_stale("process", "missing") is None
+
+
+def test_cached_responses_carry_cached_at(cache):
+    """Só a cópia guardada recebe summary.cached_at; a resposta servida do cache o expõe."""
+    tool = ProcessConsultationTool(result_cache=cache)
+    response = tool._create_success_response({"processos": []}, PROCESS_NUMBER, {"job_id": "j"})
+    tool._cache_response(PROCESS_NUMBER, response)
+
+    assert response["summary"]["cached_at"] is None
+    served = tool.consult_process(f"Processo {PROCESS_NUMBER}")
+    assert served["summary"]["from_cache"] is True
+    assert served["summary"]["cached_at"] is not None
@@ -0,0 +1,261 @@
+"""
+Single-flight das consultas de processo: chamadas concorrentes para o mesmo número
+fazem uma única busca na API (offline, com um WebJusticeClient de mentira), tanto
+entre threads (consult_process) quanto entre corrotinas de um loop (aconsult_process).
+
+Execução:
+    pytest tests/test_tools/test_single_flight.py
+"""
+
+import asyncio
+import threading
+import weakref
+
+import pytest
+
+from tools.integrations.web_justice_client import WebJusticeAPIError
+from tools.process_consultation import ProcessConsultationTool
+from tools.utils.result_cache import ResultCache
+
+PROCESS_NUMBER = "6140319-91.2024.8.09.0051"
+FOLLOWERS = 7
+
+
+class Boom(BaseException):
+    """Erro que atravessa os except Exception da ferramenta."""
+
+
+class StubClient:
+    """Substitui o WebJusticeClient: conta as buscas e segura o líder até `release`."""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.initiated = 0
+        self.release = threading.Event()
+
+    def initiate_search(self, document, search_type="document"):
+        self.initiated += 1
+        assert self.release.wait(5), "release never set"
+        if self.error is not None:
+            raise self.error
+        return {"job_id": "job-1"}
+
+    def get_search_status(self, job_id):
+        return {"current_status": "completed", "progress_percentage": 100,
+                "is_ready_for_consultation": True}
+
+    def watch_search_status(self, job_id, timeout):
+        return self.get_search_status(job_id)
+
+    def forget_job_status(self, job_id):
+        pass
+
+    def get_processes(self, process_number):
+        return {"data_details": {"total_processos": 1, "processos": [{"numero": process_number}]}}
+
+
+class AsyncStubClient(StubClient):
+    """Versão assíncrona: a busca cede o loop antes de responder, e `on_initiate` roda antes."""
+
+    def __init__(self, error=None, on_initiate=None):
+        super().__init__(error)
+        self.on_initiate = on_initiate
+
+    async def ainitiate_search(self, document, search_type="document"):
+        self.initiated += 1
+        if self.on_initiate is not None:
+            self.on_initiate()
+        await asyncio.sleep(0.01)
+        if self.error is not None:
+            raise self.error
+        return {"job_id": "job-1"}
+
+    async def await_job(self, job_id, progress_callback=None):
+        return self.get_search_status(job_id)
+
+    async def aget_processes(self, process_number):
+        return self.get_processes(process_number)
+
+
+class CountingDict(dict):
+    """Mapa de consultas em andamento que avisa a cada consulta (get)."""
+
+    def __init__(self):
+        super().__init__()
+        self.lookups = 0
+        self.changed = threading.Condition()
+
+    def get(self, key, default=None):
+        with self.changed:
+            self.lookups += 1
+            self.changed.notify_all()
+        return super().get(key, default)
+
+
+def _tool(client):
+    tool = ProcessConsultationTool(result_cache=ResultCache(enabled=False))
+    tool.client = client
+    return tool
+
+
+def _run_concurrently(monkeypatch, client):
+    """
+    Dispara 1 + FOLLOWERS consultas do mesmo processo em threads.
+
+    O líder só é liberado depois que todas as threads consultaram o mapa de buscas
+    em andamento, então os seguidores sempre encontram a busca do líder.
+    """
+    inflight = CountingDict()
+    monkeypatch.setattr(ProcessConsultationTool, "_inflight", inflight)
+    tool = _tool(client)
+    results, errors = [], []
+    barrier = threading.Barrier(1 + FOLLOWERS)
+
+    def call():
+        barrier.wait()
+        try:
+            results.append(tool.consult_process(f"Processo {PROCESS_NUMBER}"))
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(1 + FOLLOWERS)]
+    for thread in threads:
+        thread.start()
+    with inflight.changed:
+        assert inflight.changed.wait_for(lambda: inflight.lookups == 1 + FOLLOWERS, timeout=5)
+    client.release.set()
+    for thread in threads:
+        thread.join(5)
+    return inflight, results, errors
+
+
+def test_followers_get_the_leader_response(monkeypatch):
+    client = StubClient()
+    inflight, results, errors = _run_concurrently(monkeypatch, client)
+
+    assert client.initiated == 1
+    assert errors == []
+    assert len(results) == 1 + FOLLOWERS
+    assert all(result is results[0] for result in results)
+    assert results[0]["status"] == "success"
+    assert inflight == {}
+
+
+def test_leader_error_response_is_shared(monkeypatch):
+    """Erros da API viram uma resposta de erro, entregue a todos pela mesma busca."""
+    client = StubClient(error=WebJusticeAPIError("HTTP 503"))
+    inflight, results, errors = _run_concurrently(monkeypatch, client)
+
+    assert client.initiated == 1
+    assert errors == []
+    assert {result["error"]["code"] for result in results} == {"CONSULTATION_ERROR"}
+    assert inflight == {}
+
+
+def test_leader_exception_reaches_followers(monkeypatch):
+    client = StubClient(error=Boom())
+    inflight, results, errors = _run_concurrently(monkeypatch, client)
+
+    assert client.initiated == 1
+    assert results == []
+    assert len(errors) == 1 + FOLLOWERS
+    assert all(isinstance(error, Boom) for error in errors)
+    assert inflight == {}
+
+
+def test_next_call_after_completion_searches_again(monkeypatch):
+    """A entrada em andamento é removida ao terminar: uma nova chamada faz nova busca."""
+    monkeypatch.setattr(ProcessConsultationTool, "_inflight", {})
+    client = StubClient()
+    client.release.set()
+    tool = _tool(client)
+
+    tool.consult_process(PROCESS_NUMBER)
+    tool.consult_process(PROCESS_NUMBER)
+
+    assert client.initiated == 2
+    assert ProcessConsultationTool._inflight == {}
+
+
+@pytest.fixture
+def ainflight(monkeypatch):
+    """Mapa por loop isolado para cada teste."""
+    inflight = weakref.WeakKeyDictionary()
+    monkeypatch.setattr(ProcessConsultationTool, "_ainflight", inflight)
+    return inflight
+
+
+async def _gather_consultations(tool, count=1 + FOLLOWERS):
+    return await asyncio.gather(
+        *(tool.aconsult_process(f"Processo {PROCESS_NUMBER}") for _ in range(count)),
+        return_exceptions=True
+    )
+
+
+def test_async_followers_get_the_leader_response(ainflight):
+    client = AsyncStubClient()
+    tool = _tool(client)
+
+    async def main():
+        results = await _gather_consultations(tool)
+        return results, asyncio.get_running_loop() in ainflight
+
+    results, loop_still_mapped = asyncio.run(main())
+
+    assert client.initiated == 1
+    assert all(result is results[0] for result in results)
+    assert results[0]["status"] == "success"
+    assert not loop_still_mapped
+    assert len(ainflight) == 0
+
+
+def test_async_leader_exception_reaches_followers(ainflight):
+    client = AsyncStubClient(error=Boom())
+    results = asyncio.run(_gather_consultations(_tool(client)))
+
+    assert client.initiated == 1
+    assert all(isinstance(result, Boom) for result in results)
+    assert len(ainflight) == 0
+
+
+def test_async_follower_takes_over_a_cancelled_leader(ainflight):
+    """Se o líder é cancelado, um seguidor refaz a busca e os demais recebem o resultado dele."""
+    client = AsyncStubClient()
+    tool = _tool(client)
+
+    async def main():
+        leader = asyncio.create_task(tool.aconsult_process(PROCESS_NUMBER))
+        await asyncio.sleep(0)  # o líder registra a busca e cede o loop
+        followers = asyncio.gather(*(tool.aconsult_process(PROCESS_NUMBER) for _ in range(FOLLOWERS)))
+        await asyncio.sleep(0)  # os seguidores passam a aguardar o líder
+        leader.cancel()
+        return await followers
+
+    results = asyncio.run(main())
+
+    assert client.initiated == 2
+    assert all(result is results[0] for result in results)
+    assert results[0]["status"] == "success"
+    assert len(ainflight) == 0
+
+
+def test_async_consultations_are_keyed_per_loop(ainflight):
+    """Loops diferentes nunca aguardam futures um do outro: cada loop faz a sua busca."""
+    both_started = threading.Barrier(2)
+    # Cada loop só conclui a busca depois que o outro também iniciou a sua
+    client = AsyncStubClient(on_initiate=lambda: both_started.wait(5))
+    tool = _tool(client)
+    results = []
+
+    def run_loop():
+        results.append(asyncio.run(_gather_consultations(tool, count=3)))
+
+    threads = [threading.Thread(target=run_loop) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert client.initiated == 2
+    assert [result["status"] for batch in results for result in batch] == ["success"] * 6
+    assert len(ainflight) == 0
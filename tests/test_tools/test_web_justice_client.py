@@ -0,0 +1,100 @@
+"""
+Cache de ETags das consultas de status do WebJusticeClient (offline, httpx.MockTransport).
+
+Execução:
+    pytest tests/test_tools/test_web_justice_client.py
+"""
+
+import threading
+
+import httpx
+import pytest
+
+from tools.integrations import web_justice_client
+from tools.integrations.web_justice_client import WebJusticeClient
+
+
+def _status_body(job_id, progress=10):
+    return {"job_id": job_id, "current_status": "processing",
+            "progress_percentage": progress, "is_ready_for_consultation": False}
+
+
+@pytest.fixture
+def client():
+    """Cliente cujo servidor devolve 304 quando o If-None-Match confere com o ETag do job."""
+    requests = []
+
+    def handler(request):
+        job_id = request.url.path.split("/")[3]
+        requests.append((job_id, request.headers.get("If-None-Match")))
+        etag = f'"{job_id}-v1"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, json=_status_body(job_id), headers={"ETag": etag})
+
+    instance = WebJusticeClient(base_url="http://api.test", api_key="k")
+    instance.client = httpx.Client(transport=httpx.MockTransport(handler))
+    instance.requests = requests
+    yield instance
+    instance.client.close()
+
+
+def test_304_reuses_previous_status(client):
+    """O segundo poll é condicional e o 304 devolve uma cópia do último status."""
+    first = client.get_search_status("job-1")
+    second = client.get_search_status("job-1")
+
+    assert client.requests == [("job-1", None), ("job-1", '"job-1-v1"')]
+    assert second == first == _status_body("job-1")
+    second["progress_percentage"] = 99
+    assert client.get_search_status("job-1")["progress_percentage"] == 10
+
+
+def test_forget_job_status_makes_next_poll_unconditional(client):
+    """Depois de forget_job_status o próximo poll não envia If-None-Match."""
+    client.get_search_status("job-1")
+    client.forget_job_status("job-1")
+    client.forget_job_status("job-1")  # idempotente
+    client.get_search_status("job-1")
+
+    assert client.requests[-1] == ("job-1", None)
+
+
+def test_cache_is_bounded_least_recently_updated_first(client, monkeypatch):
+    """Acima de MAX_STATUS_ETAGS o job atualizado há mais tempo é esquecido."""
+    monkeypatch.setattr(web_justice_client, "MAX_STATUS_ETAGS", 3)
+    for job_id in ("a", "b", "c"):
+        client.get_search_status(job_id)
+    # Um job com status novo vai para o fim; o menos recente ("a") é descartado
+    client._status_etags.pop("b")
+    client.get_search_status("b")
+    client.get_search_status("d")
+
+    assert list(client._status_etags) == ["c", "b", "d"]
+
+
+def test_concurrent_polls_keep_the_bound(client, monkeypatch):
+    """Threads consultando jobs diferentes não corrompem o cache nem ultrapassam o limite."""
+    monkeypatch.setattr(web_justice_client, "MAX_STATUS_ETAGS", 8)
+    barrier = threading.Barrier(16)
+    errors = []
+
+    def worker(n):
+        barrier.wait()
+        try:
+            for i in range(50):
+                job_id = f"job-{n}-{i % 12}"
+                client.get_search_status(job_id)
+                if i % 5 == 0:
+                    client.forget_job_status(job_id)
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(client._status_etags) <= 8
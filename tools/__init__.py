@@ -1,17 +1,40 @@
 """
 Justice Agent Tools Package.
 AI Agent tools for consulting legal processes via the Web Justice API.
+
+Only the configuration is imported eagerly; the consultation tools (and agno,
+httpx) load on first attribute access, so `import tools` stays cheap.
 """
 
-from .process_consultation import consult_process, ProcessConsultationTool, consult_legal_process_tool
-from .hybrid_process_search import HybridProcessSearchTool, hybrid_process_search
-from .config import get_config, set_config, ToolsConfig, ENV_VARS_HELP
+import importlib
+
+from .config import get_config, set_config, ToolsConfig, Settings, ENV_VARS_HELP
 
 __version__ = "1.0.0"
 
-__all__ = [
+# Lazily exported names -> submodule that defines them
+_LAZY_EXPORTS = {
+    'consult_process': '.process_consultation',
+    'aconsult_process': '.process_consultation',
+    'consult_processes': '.process_consultation',
+    'aconsult_processes': '.process_consultation',
+    'aconsult_process_stream': '.process_consultation',
+    'ProcessConsultationTool': '.process_consultation',
+    'consult_legal_process_tool': '.process_consultation',
+    'consult_legal_processes_tool': '.process_consultation',
+    'aconsult_legal_process_tool': '.process_consultation',
+    'aconsult_legal_processes_tool': '.process_consultation',
+    'HybridProcessSearchTool': '.hybrid_process_search',
+    'hybrid_process_search': '.hybrid_process_search',
+}
+
+__all__ = (
     # Main functions
     'consult_process',
+    'aconsult_process',
+    'consult_processes',
+    'aconsult_processes',
+    'aconsult_process_stream',
     
     # Tool classes
     'ProcessConsultationTool',
@@ -19,11 +42,37 @@ __all__ = [
     
     # Agno tools  
     'consult_legal_process_tool',
+    'consult_legal_processes_tool',
+    'aconsult_legal_process_tool',
+    'aconsult_legal_processes_tool',
     'hybrid_process_search',
     
     # Configuration
     'get_config',
     'set_config',
     'ToolsConfig',
+    'Settings',
     'ENV_VARS_HELP',
-]
\ No newline at end of file
+)
+
+
+def __getattr__(name: str):
+    """Import the submodule behind a lazy export on first access (PEP 562)."""
+    submodule = _LAZY_EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    module = importlib.import_module(submodule, __name__)
+    # Importing binds the submodule on the package; drop it where it would
+    # shadow the export of the same name (hybrid_process_search)
+    shadowed = submodule.lstrip('.')
+    if shadowed in _LAZY_EXPORTS and globals().get(shadowed) is module:
+        del globals()[shadowed]
+    
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,12 +4,53 @@ Handles environment variables, settings, and default configurations.
 """
 
 import os
+import queue
+import atexit
 import logging
-from typing import Optional, Dict, Any
+import logging.handlers
+import functools
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
 from dataclasses import dataclass
 
 
-@dataclass
+DEFAULT_API_URL = 'http://localhost:8000'
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """
+    Connection settings for the Web Justice API, read from the environment once.
+    
+    Use Settings.load() wherever the API key/URL are needed instead of calling
+    os.getenv() in each function; call Settings.reload() after changing the
+    environment at runtime.
+    """
+    api_key: Optional[str]
+    api_url: str = DEFAULT_API_URL
+    
+    @classmethod
+    @functools.cache
+    def load(cls) -> 'Settings':
+        """
+        Get the process-wide settings, reading the environment on first use.
+        
+        Returns:
+            Cached Settings instance (api_key is None when WEB_JUSTICE_API_KEY is unset)
+        """
+        return cls(
+            api_key=os.getenv('WEB_JUSTICE_API_KEY') or None,
+            api_url=os.getenv('WEB_JUSTICE_API_URL', DEFAULT_API_URL)
+        )
+    
+    @classmethod
+    def reload(cls) -> 'Settings':
+        """Discard the cached settings and read the environment again."""
+        cls.load.cache_clear()
+        return cls.load()
+
+
+@dataclass(frozen=True, slots=True)
 class APIConfig:
     """Configuration for Web Justice API."""
     base_url: str
@@ -18,7 +59,7 @@ class APIConfig:
     max_retries: int = 3
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PollingConfig:
     """Configuration for polling behavior."""
     initial_interval: float = 2.0
@@ -28,7 +69,7 @@ class PollingConfig:
     timeout_buffer: float = 30.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LoggingConfig:
     """Configuration for logging."""
     level: str = "INFO"
@@ -37,9 +78,15 @@ class LoggingConfig:
     log_file_path: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolsConfig:
-    """Main configuration for Justice Agent tools."""
+    """
+    Main configuration for Justice Agent tools.
+    
+    All config dataclasses are frozen: one instance is shared by every caller of
+    from_environment(), and being hashable it can key other cached helpers.
+    Use dataclasses.replace() to derive a modified copy.
+    """
     api: APIConfig
     polling: PollingConfig
     logging: LoggingConfig
@@ -49,58 +96,108 @@ class ToolsConfig:
         """
         Create configuration from environment variables.
         
+        The environment is parsed once per process; later calls return the same
+        instance. Call invalidate_env_cache() after changing the environment.
+        
         Returns:
             ToolsConfig instance with values from environment
             
         Raises:
             ValueError: If required environment variables are missing
         """
-        # Required environment variables
-        api_key = os.getenv('WEB_JUSTICE_API_KEY')
-        if not api_key:
-            raise ValueError(
-                "WEB_JUSTICE_API_KEY environment variable is required. "
-                "Please set it to your Web Justice API key."
-            )
-        
-        # API configuration
-        api_config = APIConfig(
-            base_url=os.getenv('WEB_JUSTICE_API_URL', 'http://localhost:8000'),
-            api_key=api_key,
-            timeout=float(os.getenv('WEB_JUSTICE_API_TIMEOUT', '30.0')),
-            max_retries=int(os.getenv('WEB_JUSTICE_API_MAX_RETRIES', '3'))
-        )
-        
-        # Polling configuration
-        polling_config = PollingConfig(
-            initial_interval=float(os.getenv('POLLING_INITIAL_INTERVAL', '2.0')),
-            max_interval=float(os.getenv('POLLING_MAX_INTERVAL', '30.0')),
-            backoff_multiplier=float(os.getenv('POLLING_BACKOFF_MULTIPLIER', '1.5')),
-            max_wait_time=float(os.getenv('POLLING_MAX_WAIT_TIME', '900.0')),
-            timeout_buffer=float(os.getenv('POLLING_TIMEOUT_BUFFER', '30.0'))
-        )
-        
-        # Logging configuration
-        log_file = os.getenv('JUSTICE_TOOLS_LOG_FILE')
-        logging_config = LoggingConfig(
-            level=os.getenv('JUSTICE_TOOLS_LOG_LEVEL', 'INFO'),
-            format=os.getenv('JUSTICE_TOOLS_LOG_FORMAT', 
-                           "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
-            enable_file_logging=bool(log_file),
-            log_file_path=log_file
-        )
-        
-        return cls(
-            api=api_config,
-            polling=polling_config,
-            logging=logging_config
+        return _build_config_from_env()
+
+
+@functools.lru_cache(maxsize=1)
+def _build_config_from_env() -> ToolsConfig:
+    """Parse all tool settings from the environment (cached; see invalidate_env_cache)."""
+    # Required environment variables
+    api_key = os.getenv('WEB_JUSTICE_API_KEY')
+    if not api_key:
+        raise ValueError(
+            "WEB_JUSTICE_API_KEY environment variable is required. "
+            "Please set it to your Web Justice API key."
         )
 
+    # API configuration
+    api_config = APIConfig(
+        base_url=os.getenv('WEB_JUSTICE_API_URL', DEFAULT_API_URL),
+        api_key=api_key,
+        timeout=float(os.getenv('WEB_JUSTICE_API_TIMEOUT', '30.0')),
+        max_retries=int(os.getenv('WEB_JUSTICE_API_MAX_RETRIES', '3'))
+    )
+
+    # Polling configuration
+    polling_config = PollingConfig(
+        initial_interval=float(os.getenv('POLLING_INITIAL_INTERVAL', '2.0')),
+        max_interval=float(os.getenv('POLLING_MAX_INTERVAL', '30.0')),
+        backoff_multiplier=float(os.getenv('POLLING_BACKOFF_MULTIPLIER', '1.5')),
+        max_wait_time=float(os.getenv('POLLING_MAX_WAIT_TIME', '900.0')),
+        timeout_buffer=float(os.getenv('POLLING_TIMEOUT_BUFFER', '30.0'))
+    )
+
+    # Logging configuration
+    log_file = os.getenv('JUSTICE_TOOLS_LOG_FILE')
+    logging_config = LoggingConfig(
+        level=os.getenv('JUSTICE_TOOLS_LOG_LEVEL', 'INFO'),
+        format=os.getenv('JUSTICE_TOOLS_LOG_FORMAT', 
+                       "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
+        enable_file_logging=bool(log_file),
+        log_file_path=log_file
+    )
+
+    return ToolsConfig(
+        api=api_config,
+        polling=polling_config,
+        logging=logging_config
+    )
+
+
+def invalidate_env_cache():
+    """
+    Forget configuration parsed from the environment.
+    
+    Next calls to ToolsConfig.from_environment() and Settings.load() read the environment again.
+    """
+    _build_config_from_env.cache_clear()
+    Settings.load.cache_clear()
+
+
+# Formatters by format string, reused across setup_logging() calls
+_FORMATTER_CACHE: Dict[str, logging.Formatter] = {}
+
+
+def _get_formatter(fmt: str) -> logging.Formatter:
+    """Get the shared formatter for a format string, creating it on first use."""
+    formatter = _FORMATTER_CACHE.get(fmt)
+    if formatter is None:
+        formatter = _FORMATTER_CACHE.setdefault(fmt, logging.Formatter(fmt))
+    return formatter
+
+
+# Listener that writes queued records to the real handlers (see setup_logging)
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_log_listener():
+    """Flush and stop the active log listener, if any."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
+
 
 def setup_logging(config: LoggingConfig):
     """
     Configure logging based on the provided configuration.
     
+    The root logger only gets a QueueHandler; console/file writes happen on a
+    QueueListener thread so logging never blocks consultation or polling code.
+    Calling it again replaces the previous listener.
+    
     Args:
         config: Logging configuration
     """
@@ -110,27 +207,43 @@ def setup_logging(config: LoggingConfig):
     # Configure root logger
     handlers = []
     
+    # One formatter shared by every handler
+    formatter = _get_formatter(config.format)
+    
     # Console handler
     console_handler = logging.StreamHandler()
-    console_handler.setFormatter(logging.Formatter(config.format))
+    console_handler.setFormatter(formatter)
     handlers.append(console_handler)
     
     # File handler if enabled
     if config.enable_file_logging and config.log_file_path:
         try:
             file_handler = logging.FileHandler(config.log_file_path)
-            file_handler.setFormatter(logging.Formatter(config.format))
+            file_handler.setFormatter(formatter)
             handlers.append(file_handler)
         except Exception as e:
             logging.warning(f"Failed to setup file logging: {e}")
     
+    # Route records through a queue; the listener thread does the I/O
+    _stop_log_listener()
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    
+    # The queue handler only merges args into the message; formatting happens
+    # in the listener handlers (basicConfig would otherwise format twice)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(_get_formatter("%(message)s"))
+    
     # Configure logging
     logging.basicConfig(
         level=level,
-        format=config.format,
-        handlers=handlers,
+        handlers=[queue_handler],
         force=True
     )
+    
+    global _log_listener
+    _log_listener = listener
+    listener.start()
 
 
 def get_default_config() -> ToolsConfig:
@@ -146,15 +259,19 @@ def get_default_config() -> ToolsConfig:
     return ToolsConfig.from_environment()
 
 
-def validate_config(config: ToolsConfig) -> Dict[str, Any]:
+@functools.lru_cache(maxsize=4)
+def validate_config(config: ToolsConfig) -> Mapping[str, Any]:
     """
     Validate configuration and return validation results.
     
+    Results are cached per (frozen, hashable) config, so they are returned as a
+    read-only mapping with tuples of errors/warnings.
+    
     Args:
         config: Configuration to validate
         
     Returns:
-        Dict with validation results
+        Read-only mapping with validation results
     """
     results = {
         "valid": True,
@@ -185,7 +302,9 @@ def validate_config(config: ToolsConfig) -> Dict[str, Any]:
         results["errors"].append("Max wait time must be positive")
         results["valid"] = False
     
-    return results
+    results["errors"] = tuple(results["errors"])
+    results["warnings"] = tuple(results["warnings"])
+    return MappingProxyType(results)
 
 
 # Global configuration instance
@@ -239,4 +358,12 @@ Optional:
   JUSTICE_TOOLS_LOG_LEVEL       Logging level (default: INFO)
   JUSTICE_TOOLS_LOG_FILE        Log file path (optional)
   JUSTICE_TOOLS_LOG_FORMAT      Log message format (optional)
+  
+  JUSTICE_AGENT_CACHE           Set to 1 to enable the consultation result cache (default: 0)
+  JUSTICE_AGENT_CACHE_TTL       Result cache lifetime in seconds (default: 3600)
+  JUSTICE_AGENT_CACHE_DIR       Result cache directory (default: ~/.cache/justice-agent)
+  JUSTICE_AGENT_CACHE_MEMORY_ENTRIES  In-memory LRU size of the result cache, 0 to disable (default: 256)
+  WEB_JUSTICE_STALE_FALLBACK    Set to 1 to serve the last good result (up to 24h old; needs JUSTICE_AGENT_CACHE=1) when the API fails (default: 0)
+  
+  WEB_JUSTICE_V0_PATH           web-justice-v0 checkout with shared/vector_client.py (RAG search)
 """
\ No newline at end of file
@@ -7,19 +7,85 @@ Esta tool implementa uma estratégia híbrida:
 2. Fallback: Se não encontrar → API externa (com notificação por e-mail)
 
 Combina a velocidade do RAG local com a cobertura completa da API.
+
+Importar este módulo não cria clientes: a instância compartilhada
+`hybrid_process_search` é construída no primeiro acesso ao atributo.
+O cliente vetorial vem do repositório web-justice-v0, indicado por
+WEB_JUSTICE_V0_PATH.
 """
 
+import os
+import sys
+import heapq
 import logging
+import functools
 from typing import Dict, Any, List, Optional
-from agno import Tool
-
-# Import da tool existente para fallback
-from justice_agent.tools.integrations.web_justice_client import WebJusticeClient
-from justice_agent.tools.process_consultation import ProcessConsultationTool
 
 logger = logging.getLogger(__name__)
 
-class HybridProcessSearchTool(Tool):
+# Checkout do web-justice-v0 que contém shared/vector_client.py
+VECTOR_CLIENT_PATH_ENV = 'WEB_JUSTICE_V0_PATH'
+
+
+@functools.cache
+def _bootstrap_vector_client_path():
+    """Add the web-justice-v0 checkout to sys.path once per process (if configured)."""
+    vector_path = os.getenv(VECTOR_CLIENT_PATH_ENV)
+    if vector_path and vector_path not in sys.path:
+        sys.path.append(vector_path)
+
+
+# Templates das respostas ao usuário (str.format), definidos uma única vez
+_RAG_HEADER = """
+📊 **Resultados encontrados na base local (RAG)**
+
+{message}
+
+**Processos relevantes:**
+"""
+
+_PROC_BLOCK = """
+{i}. **Processo:** {num}
+   - **Documentos:** {ndocs} documento(s)
+   - **Relevância:** {score:.2f}
+   
+"""
+
+_DOC_LINE = "   • {tipo}: {conteudo}\n"
+_DOC_DATE_LINE = "     Data: {data}\n"
+_RAG_FOOTER = "\n✅ *Busca realizada instantaneamente via sistema RAG.*"
+
+_API_INITIATED = """
+🔍 **Busca não encontrada na base local**
+
+Os termos buscados não foram encontrados em nossa base de dados local. 
+
+**Iniciando busca na base externa:**
+- **Status:** Busca em andamento
+- **ID do Job:** {job_id}
+- **Tempo estimado:** {estimated_time}
+
+📧 **Você será notificado por e-mail quando a busca for concluída.**
+
+⏰ A busca externa pode levar alguns minutos para processar todos os tribunais e sistemas.
+"""
+
+_API_ERROR = """
+❌ **Erro na busca**
+
+Não foi possível encontrar resultados na base local nem iniciar busca externa.
+
+**Detalhes do erro:**
+{message}
+
+💡 **Sugestões:**
+- Verifique se o número do processo está correto
+- Tente termos de busca diferentes
+- Entre em contato com o suporte se o problema persistir
+"""
+
+
+class HybridProcessSearchTool:
     """
     Tool híbrida que combina busca RAG com fallback para API externa.
     
@@ -29,11 +95,12 @@ class HybridProcessSearchTool(Tool):
     3. Para buscas via API → Resposta com promessa de e-mail
     """
     
+    name = "hybrid_process_search"
+    description = "Busca híbrida de processos: RAG local + API externa com notificação por e-mail"
+    
     def __init__(self):
-        super().__init__(
-            name="hybrid_process_search",
-            description="Busca híbrida de processos: RAG local + API externa com notificação por e-mail"
-        )
+        # Imports locais: só carregados quando a tool é de fato construída
+        from .process_consultation import ProcessConsultationTool, _get_shared_client
         
         # Inicializar clientes
         self.web_client = None
@@ -42,16 +109,17 @@ class HybridProcessSearchTool(Tool):
         
         # Tentar inicializar componentes (não falhar se indisponíveis)
         try:
-            self.web_client = WebJusticeClient()
+            # Mesmo cliente (e pool de conexões) usado pelas consultas de processo
+            self.web_client = _get_shared_client()
             logger.info("✅ WebJusticeClient inicializado")
         except Exception as e:
-            logger.warning(f"⚠️ WebJusticeClient indisponível: {e}")
+            logger.warning("⚠️ WebJusticeClient indisponível: %s", e)
         
         try:
             self.process_tool = ProcessConsultationTool()
             logger.info("✅ ProcessConsultationTool inicializado")
         except Exception as e:
-            logger.warning(f"⚠️ ProcessConsultationTool indisponível: {e}")
+            logger.warning("⚠️ ProcessConsultationTool indisponível: %s", e)
         
         # Cliente vetorial (importar localmente para evitar dependências circulares)
         self._init_vector_client()
@@ -60,9 +128,7 @@ class HybridProcessSearchTool(Tool):
         """Inicializa cliente vetorial com tratamento de erros."""
         try:
             # Import local para evitar problemas de dependência
-            import sys
-            import os
-            sys.path.append('/Users/viniciusroncon/Documents/apps/web-justice-v0')
+            _bootstrap_vector_client_path()
             
             from shared.vector_client import get_vector_client
             self.vector_client = get_vector_client()
@@ -73,7 +139,7 @@ class HybridProcessSearchTool(Tool):
                 logger.info("🚫 Cliente vetorial desabilitado")
                 
         except Exception as e:
-            logger.warning(f"⚠️ Cliente vetorial indisponível: {e}")
+            logger.warning("⚠️ Cliente vetorial indisponível: %s", e)
             self.vector_client = None
     
     def _search_via_rag(self, query: str, numero_processo: str = None) -> List[Dict[str, Any]]:
@@ -87,35 +153,36 @@ class HybridProcessSearchTool(Tool):
         Returns:
             Lista de documentos encontrados via RAG
         """
-        if not self.vector_client or not self.vector_client.is_enabled():
+        vector_client = self.vector_client
+        if not vector_client or not vector_client.is_enabled():
             logger.debug("Cliente vetorial não disponível para busca RAG")
             return []
         
         try:
-            logger.info(f"🔍 [RAG] Buscando: '{query[:50]}...'")
+            logger.info("🔍 [RAG] Buscando: '%.50s...'", query)
             
             # Busca por número de processo específico
             if numero_processo:
-                results = self.vector_client.search_by_process_number(
+                results = vector_client.search_by_process_number(
                     numero_processo=numero_processo,
                     limit=10
                 )
             else:
                 # Busca semântica geral
-                results = self.vector_client.search_similar_documents(
+                results = vector_client.search_similar_documents(
                     query=query,
                     limit=5
                 )
             
             if results:
-                logger.info(f"✅ [RAG] Encontrados {len(results)} documentos")
+                logger.info("✅ [RAG] Encontrados %d documentos", len(results))
                 return results
             else:
                 logger.info("🔍 [RAG] Nenhum documento encontrado")
                 return []
                 
         except Exception as e:
-            logger.error(f"❌ [RAG] Erro na busca vetorial: {e}")
+            logger.error("❌ [RAG] Erro na busca vetorial: %s", e)
             return []
     
     def _format_rag_response(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -135,45 +202,46 @@ class HybridProcessSearchTool(Tool):
                 "message": "Nenhum documento encontrado na base local."
             }
         
-        # Agrupar por processo
-        processes = {}
+        # Agrupar por processo em uma única passada
+        processes: Dict[str, Dict[str, Any]] = {}
+        processes_get = processes.get
         for doc in results:
-            proc_num = doc.get("numero_processo", "Processo não identificado")
-            if proc_num not in processes:
-                processes[proc_num] = {
+            doc_get = doc.get
+            proc_num = doc_get("numero_processo", "Processo não identificado")
+            content = doc_get("content") or ""
+            score = doc_get("score", 0)
+            meta = doc_get("metadata") or {}
+            
+            agg = processes_get(proc_num)
+            if agg is None:
+                agg = processes[proc_num] = {
                     "numero_processo": proc_num,
-                    "id_processo": doc.get("id_processo"),
+                    "id_processo": doc_get("id_processo"),
                     "documentos": [],
                     "score_maximo": 0
                 }
             
-            processes[proc_num]["documentos"].append({
-                "conteudo": doc.get("content", "")[:500] + "..." if len(doc.get("content", "")) > 500 else doc.get("content", ""),
-                "tipo_documento": doc.get("metadata", {}).get("tipo_documento"),
-                "data_juntada": doc.get("metadata", {}).get("data_juntada"),
-                "score_similaridade": doc.get("score", 0)
+            agg["documentos"].append({
+                "conteudo": content if len(content) <= 500 else content[:500] + "...",
+                "tipo_documento": meta.get("tipo_documento"),
+                "data_juntada": meta.get("data_juntada"),
+                "score_similaridade": score
             })
             
             # Atualizar score máximo
-            processes[proc_num]["score_maximo"] = max(
-                processes[proc_num]["score_maximo"], 
-                doc.get("score", 0)
-            )
+            if score > agg["score_maximo"]:
+                agg["score_maximo"] = score
         
-        # Ordenar por relevância
-        sorted_processes = sorted(
-            processes.values(), 
-            key=lambda x: x["score_maximo"], 
-            reverse=True
-        )
+        # Apenas os 3 processos mais relevantes (top-K sem ordenar todos)
+        top_processes = heapq.nlargest(3, processes.values(), key=lambda x: x["score_maximo"])
         
         return {
             "status": "success",
             "source": "rag",
-            "message": f"Encontrados {len(sorted_processes)} processos relevantes na base local.",
-            "total_processos": len(sorted_processes),
+            "message": f"Encontrados {len(processes)} processos relevantes na base local.",
+            "total_processos": len(processes),
             "total_documentos": len(results),
-            "processos": sorted_processes[:3],  # Limitar a 3 processos mais relevantes
+            "processos": top_processes,
             "observacao": "Resultados obtidos instantaneamente via busca semântica (RAG)."
         }
     
@@ -194,7 +262,7 @@ class HybridProcessSearchTool(Tool):
             }
         
         try:
-            logger.info(f"🌐 [API] Iniciando busca externa para: {document_or_process}")
+            logger.info("🌐 [API] Iniciando busca externa para: %s", document_or_process)
             
             # Usar a tool existente para iniciar busca
             api_response = self.web_client.initiate_search(
@@ -202,7 +270,7 @@ class HybridProcessSearchTool(Tool):
                 search_type="document"  # ou "process" dependendo do contexto
             )
             
-            logger.info(f"✅ [API] Busca iniciada - Job ID: {api_response.get('job_id')}")
+            logger.info("✅ [API] Busca iniciada - Job ID: %s", api_response.get('job_id'))
             
             return {
                 "status": "search_initiated",
@@ -213,7 +281,7 @@ class HybridProcessSearchTool(Tool):
             }
             
         except Exception as e:
-            logger.error(f"❌ [API] Erro ao iniciar busca: {e}")
+            logger.error("❌ [API] Erro ao iniciar busca: %s", e)
             return {
                 "status": "error",
                 "source": "api_external", 
@@ -231,7 +299,7 @@ class HybridProcessSearchTool(Tool):
         Returns:
             Resposta formatada para o usuário
         """
-        logger.info(f"🚀 [HYBRID] Iniciando busca híbrida para: '{query[:100]}...'")
+        logger.info("🚀 [HYBRID] Iniciando busca híbrida para: '%.100s...'", query)
         
         # ETAPA 1: Tentativa RAG (busca vetorial local)
         rag_results = self._search_via_rag(query, numero_processo)
@@ -240,31 +308,31 @@ class HybridProcessSearchTool(Tool):
             # RAG encontrou resultados - retornar imediatamente
             rag_response = self._format_rag_response(rag_results)
             
-            response_text = f"""
-📊 **Resultados encontrados na base local (RAG)**
-
-{rag_response['message']}
-
-**Processos relevantes:**
-"""
+            # Partes acumuladas em lista e unidas uma única vez no final
+            parts: List[str] = []
+            append = parts.append
+            append(_RAG_HEADER.format(message=rag_response['message']))
             
             for i, processo in enumerate(rag_response.get('processos', [])[:3], 1):
-                response_text += f"""
-{i}. **Processo:** {processo['numero_processo']}
-   - **Documentos:** {len(processo['documentos'])} documento(s)
-   - **Relevância:** {processo['score_maximo']:.2f}
-   
-"""
+                append(_PROC_BLOCK.format(
+                    i=i,
+                    num=processo['numero_processo'],
+                    ndocs=len(processo['documentos']),
+                    score=processo['score_maximo']
+                ))
                 
                 # Mostrar alguns documentos
                 for doc in processo['documentos'][:2]:
-                    response_text += f"   • {doc.get('tipo_documento', 'Documento')}: {doc.get('conteudo', 'Conteúdo não disponível')}\n"
+                    append(_DOC_LINE.format(
+                        tipo=doc.get('tipo_documento', 'Documento'),
+                        conteudo=doc.get('conteudo', 'Conteúdo não disponível')
+                    ))
                     if doc.get('data_juntada'):
-                        response_text += f"     Data: {doc['data_juntada']}\n"
-                response_text += "\n"
+                        append(_DOC_DATE_LINE.format(data=doc['data_juntada']))
+                append("\n")
             
-            response_text += "\n✅ *Busca realizada instantaneamente via sistema RAG.*"
-            return response_text
+            append(_RAG_FOOTER)
+            return "".join(parts)
         
         # ETAPA 2: Fallback para API externa
         logger.info("🌐 [HYBRID] RAG não retornou resultados, iniciando fallback via API")
@@ -275,37 +343,24 @@ class HybridProcessSearchTool(Tool):
         api_response = self._initiate_api_search(search_term)
         
         if api_response['status'] == 'search_initiated':
-            response_text = f"""
-🔍 **Busca não encontrada na base local**
-
-Os termos buscados não foram encontrados em nossa base de dados local. 
-
-**Iniciando busca na base externa:**
-- **Status:** Busca em andamento
-- **ID do Job:** {api_response.get('job_id', 'N/A')}
-- **Tempo estimado:** {api_response.get('estimated_time', 'Indeterminado')}
-
-📧 **Você será notificado por e-mail quando a busca for concluída.**
-
-⏰ A busca externa pode levar alguns minutos para processar todos os tribunais e sistemas.
-"""
+            response_text = _API_INITIATED.format(
+                job_id=api_response.get('job_id', 'N/A'),
+                estimated_time=api_response.get('estimated_time', 'Indeterminado')
+            )
         else:
-            response_text = f"""
-❌ **Erro na busca**
-
-Não foi possível encontrar resultados na base local nem iniciar busca externa.
-
-**Detalhes do erro:**
-{api_response.get('message', 'Erro não especificado')}
-
-💡 **Sugestões:**
-- Verifique se o número do processo está correto
-- Tente termos de busca diferentes
-- Entre em contato com o suporte se o problema persistir
-"""
+            response_text = _API_ERROR.format(message=api_response.get('message', 'Erro não especificado'))
         
         return response_text
 
 
-# Instanciar a tool para uso pelo agente
-hybrid_process_search = HybridProcessSearchTool()
\ No newline at end of file
+_hybrid_process_search: Optional[HybridProcessSearchTool] = None
+
+
+def __getattr__(name: str):
+    """Build the shared `hybrid_process_search` tool on first access (PEP 562)."""
+    global _hybrid_process_search
+    if name == 'hybrid_process_search':
+        if _hybrid_process_search is None:
+            _hybrid_process_search = HybridProcessSearchTool()
+        return _hybrid_process_search
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
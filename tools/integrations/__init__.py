@@ -3,10 +3,11 @@ Integrations package for Justice Agent tools.
 Contains clients and interfaces for external services.
 """
 
-from .web_justice_client import WebJusticeClient, WebJusticeAPIError, create_client
+from .web_justice_client import WebJusticeClient, WebJusticeAPIError, WebJusticeAuthError, create_client
 
 __all__ = [
     'WebJusticeClient',
     'WebJusticeAPIError', 
+    'WebJusticeAuthError',
     'create_client'
 ]
\ No newline at end of file
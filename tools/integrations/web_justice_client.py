@@ -3,23 +3,160 @@ Web Justice API client for AI Agent tools.
 Provides shared functionality for both process and document consultation tools.
 """
 
-import os
-import json
 import time
+import atexit
+import asyncio
 import logging
-from typing import Dict, Any, Optional, Tuple
-from urllib.parse import urljoin
+import threading
+import weakref
+import importlib.util
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, Callable, List, Sequence, Union
 
 import httpx
 
+from ..config import Settings
+from ..utils.serialization import LazyJSON, loads
+from ..utils.polling_manager import PollingConfig, LONG_POLL_TIMEOUT, apoll_search_completion, apoll_jobs_completion
+
 logger = logging.getLogger(__name__)
 
+# Headers shared by every request; the API key is sent per request by each client
+_DEFAULT_HEADERS = {
+    'Content-Type': 'application/json',
+    'User-Agent': 'AI-Agent-Tools/1.0'
+}
+
+# HTTP/2 multiplexes concurrent polls over one connection; needs h2, which the project pulls in
+# through httpx[http2]. Negotiated via TLS ALPN, so plain http:// stays on HTTP/1.1
+HTTP2_ENABLED = importlib.util.find_spec('h2') is not None
+
+
+# Idle pooled connections live this long. Keep polling intervals (POLLING_MAX_INTERVAL,
+# AWAIT_JOB_POLLING.max_interval) below it so each status check finds a warm connection.
+KEEPALIVE_EXPIRY = 120.0
+
+# Status polls only need current_status / progress_percentage / is_ready_for_consultation.
+# Gateways that support it answer ?projection=minimal without the partial processes blob;
+# older gateways ignore the parameter and send the full body, which still decodes fine.
+STATUS_PROJECTION = "minimal"
+
+
+def _client_options() -> Dict[str, Any]:
+    """Transport options shared by the sync and async pools."""
+    return {
+        'headers': _DEFAULT_HEADERS,
+        'http2': HTTP2_ENABLED,
+        'timeout': httpx.Timeout(connect=10.0, read=30.0, write=10.0, pool=5.0),
+        'limits': httpx.Limits(
+            max_keepalive_connections=32,
+            max_connections=64,
+            keepalive_expiry=KEEPALIVE_EXPIRY
+        ),
+    }
+
+
+# AIDEV-NOTE: process-wide connection pools; WebJusticeClient.close() must not close them
+_shared_client: Optional[httpx.Client] = None
+_shared_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_shared_client_lock = threading.Lock()
+
+
+def _get_shared_client() -> httpx.Client:
+    """Get the process-wide HTTP client, creating it on first use."""
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                _shared_client = httpx.Client(**_client_options())
+    return _shared_client
+
+
+def _get_shared_async_client() -> httpx.AsyncClient:
+    """
+    Get the async HTTP client for the running event loop.
+    
+    Async connections are bound to the loop that opened them, so one client is kept per loop.
+    """
+    loop = asyncio.get_running_loop()
+    with _shared_client_lock:
+        client = _shared_async_clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(**_client_options())
+            _shared_async_clients[loop] = client
+    return client
+
+
+async def aclose_shared_async_client():
+    """
+    Close the running event loop's async HTTP client, if one was opened.
+    
+    Call this before a loop you created ends (e.g. at the end of the coroutine given to
+    asyncio.run): the client's open connections keep the loop referenced, so it would
+    otherwise never be released.
+    """
+    loop = asyncio.get_running_loop()
+    with _shared_client_lock:
+        client = _shared_async_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
+def close_shared_client():
+    """Close the process-wide HTTP client. Registered to run at interpreter exit."""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is not None:
+            _shared_client.close()
+            _shared_client = None
+
+
+atexit.register(close_shared_client)
+
+# Error bodies are cut to this many characters in messages and logs
+MAX_LOG_BODY = 2048
+
+
+def _response_body(response: httpx.Response) -> str:
+    """Response text for error messages, truncated to MAX_LOG_BODY characters."""
+    text = response.text
+    if len(text) > MAX_LOG_BODY:
+        return f"{text[:MAX_LOG_BODY]}... [{len(text) - MAX_LOG_BODY} more chars]"
+    return text
+
+
+def _decode(response: httpx.Response) -> Any:
+    """
+    Parse a JSON response body from its raw bytes.
+    
+    Response.json() decodes the body to str and parses it with the stdlib; orjson (when
+    installed) parses the bytes directly, which matters for the large processos payloads.
+    """
+    return loads(response.content)
+
+
+# Most jobs whose last status is kept for conditional polls; the least recently
+# updated job is forgotten first (its next poll is simply unconditional)
+MAX_STATUS_ETAGS = 256
+
+# Polling cadence for await_job: 0.5s, 1s, 2s, 4s, 4s, ...
+AWAIT_JOB_POLLING = PollingConfig(initial_interval=0.5, max_interval=4.0, backoff_multiplier=2.0)
+
 
 class WebJusticeAPIError(Exception):
     """Custom exception for Web Justice API errors."""
     pass
 
 
+class WebJusticeAuthError(WebJusticeAPIError):
+    """The API rejected the API key (HTTP 401/403)."""
+    pass
+
+
+# Status codes that mean the API key was rejected
+AUTH_FAILURE_STATUSES = (401, 403)
+
+
 class WebJusticeClient:
     """
     Client for interacting with Web Justice AI Agent API endpoints.
@@ -34,8 +171,9 @@ class WebJusticeClient:
             base_url: API base URL (defaults to environment variable)
             api_key: API authentication key (defaults to environment variable)
         """
-        self.base_url = base_url or os.getenv('WEB_JUSTICE_API_URL', 'http://localhost:8000')
-        self.api_key = api_key or os.getenv('WEB_JUSTICE_API_KEY')
+        settings = Settings.load()
+        self.base_url = base_url or settings.api_url
+        self.api_key = api_key or settings.api_key
         
         if not self.api_key:
             raise ValueError("API key is required. Set WEB_JUSTICE_API_KEY environment variable.")
@@ -43,15 +181,25 @@ class WebJusticeClient:
         # Remove trailing slash from base URL
         self.base_url = self.base_url.rstrip('/')
         
-        # Setup HTTP client with default headers
-        self.client = httpx.Client(
-            headers={
-                'X-API-Key': self.api_key,
-                'Content-Type': 'application/json',
-                'User-Agent': 'AI-Agent-Tools/1.0'
-            },
-            timeout=30.0
-        )
+        # Endpoint URLs are fixed for the client's lifetime; build them once. Fixed endpoints
+        # are pre-parsed httpx.URL objects, which httpx reuses without parsing the string again
+        # (the pool is shared by clients with different base URLs, so it has no base_url).
+        self._url_initiate = httpx.URL(f"{self.base_url}/api/ai-agent/initiate-search")
+        self._url_status_fmt = f"{self.base_url}/api/searches/{{}}/detailed-status?projection={STATUS_PROJECTION}"
+        self._url_processes_fmt = f"{self.base_url}/api/ai-agent/processos/{{}}"
+        self._url_test_auth = httpx.URL(f"{self.base_url}/api/ai-agent/test-auth")
+        self._url_health = httpx.URL(f"{self.base_url}/health")
+        
+        # job_id -> (ETag, last status body) for conditional status polls, oldest update
+        # first; bounded by MAX_STATUS_ETAGS and cleared by forget_job_status. Polls for
+        # different jobs run concurrently (submit_poll workers, event loops), so every
+        # access goes through the lock.
+        self._status_etags: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._status_etags_lock = threading.Lock()
+        
+        # Reuse the process-wide connection pool; authentication is sent per request
+        self.headers = {'X-API-Key': self.api_key}
+        self.client = _get_shared_client()
         
         logger.info(f"WebJusticeClient initialized with base URL: {self.base_url}")
     
@@ -69,7 +217,7 @@ class WebJusticeClient:
         Raises:
             WebJusticeAPIError: If the API request fails
         """
-        url = urljoin(self.base_url, '/api/ai-agent/initiate-search')
+        url = self._url_initiate
         
         payload = {
             "document": document,
@@ -78,21 +226,91 @@ class WebJusticeClient:
         
         try:
             logger.info(f"Initiating {search_type} search for: {document}")
-            response = self.client.post(url, json=payload)
+            response = self.client.post(url, json=payload, headers=self.headers)
             response.raise_for_status()
             
-            data = response.json()
+            data = _decode(response)
             logger.info(f"Search initiated successfully. Job ID: {data.get('job_id')}")
             return data
             
         except httpx.HTTPStatusError as e:
-            error_msg = f"HTTP {e.response.status_code}: {e.response.text}"
+            # No auth probe is made up front: a rejected key surfaces here on the first request
+            if e.response.status_code in AUTH_FAILURE_STATUSES:
+                logger.error(f"Search initiation rejected: HTTP {e.response.status_code}")
+                raise WebJusticeAuthError(
+                    f"Authentication failed (HTTP {e.response.status_code}) - check WEB_JUSTICE_API_KEY"
+                )
+            error_msg = f"HTTP {e.response.status_code}: {_response_body(e.response)}"
             logger.error(f"Search initiation failed: {error_msg}")
             raise WebJusticeAPIError(f"Failed to initiate search: {error_msg}")
         except httpx.RequestError as e:
             logger.error(f"Request failed: {str(e)}")
             raise WebJusticeAPIError(f"Request failed: {str(e)}")
     
+    def _status_headers(self, job_id: str) -> Tuple[Dict[str, str], Optional[Tuple[str, Dict[str, Any]]]]:
+        """
+        Request headers for a status poll, conditional when the last response had an ETag.
+        
+        Returns:
+            Tuple of (headers, cached entry the condition was built from); pass the entry to
+            _read_status so a 304 still finds its body if another poll evicts it meanwhile
+        """
+        with self._status_etags_lock:
+            cached = self._status_etags.get(job_id)
+        if cached is None:
+            return self.headers, None
+        return {**self.headers, 'If-None-Match': cached[0]}, cached
+    
+    def _read_status(self, job_id: str, response: httpx.Response,
+                     cached: Optional[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Decode a status poll response.
+        
+        A 304 means the job has not changed since the last poll: the previous body is
+        returned again, so polling simply continues without a progress signal.
+        
+        Args:
+            job_id: The search job identifier
+            response: Status poll response
+            cached: Entry returned by _status_headers for this request
+        
+        Raises:
+            httpx.HTTPStatusError: For error statuses
+        """
+        if response.status_code == 304 and cached is not None:
+            logger.debug(f"Job {job_id} status unchanged (304)")
+            return dict(cached[1])
+        
+        response.raise_for_status()
+        data = _decode(response)
+        logger.debug(f"Job {job_id} status: {data.get('current_status')} - {data.get('progress_percentage', 0)}%")
+        
+        etag = response.headers.get('ETag')
+        with self._status_etags_lock:
+            if etag and not data.get('is_ready_for_consultation', False):
+                # Move to the end so the dict stays ordered by last update
+                self._status_etags[job_id] = (etag, data)
+                self._status_etags.move_to_end(job_id)
+                if len(self._status_etags) > MAX_STATUS_ETAGS:
+                    self._status_etags.popitem(last=False)
+            else:
+                # Finished job (or no ETag support): nothing left to revalidate
+                self._status_etags.pop(job_id, None)
+        return dict(data)
+    
+    def forget_job_status(self, job_id: str):
+        """
+        Drop the status kept for a job's conditional polls.
+        
+        Called when polling a job ends for any reason (ready, timeout, error or
+        cancellation), so abandoned jobs don't stay in memory.
+        
+        Args:
+            job_id: The search job identifier
+        """
+        with self._status_etags_lock:
+            self._status_etags.pop(job_id, None)
+    
     def get_search_status(self, job_id: str) -> Dict[str, Any]:
         """
         Get detailed status of a search job.
@@ -106,24 +324,63 @@ class WebJusticeClient:
         Raises:
             WebJusticeAPIError: If the API request fails
         """
-        url = urljoin(self.base_url, f'/api/searches/{job_id}/detailed-status')
+        url = self._url_status_fmt.format(job_id)
         
         try:
-            response = self.client.get(url)
-            response.raise_for_status()
-            
-            data = response.json()
-            logger.debug(f"Job {job_id} status: {data.get('current_status')} - {data.get('progress_percentage', 0)}%")
-            return data
+            headers, cached = self._status_headers(job_id)
+            response = self.client.get(url, headers=headers)
+            return self._read_status(job_id, response, cached)
             
         except httpx.HTTPStatusError as e:
-            error_msg = f"HTTP {e.response.status_code}: {e.response.text}"
+            error_msg = f"HTTP {e.response.status_code}: {_response_body(e.response)}"
             logger.error(f"Status check failed for job {job_id}: {error_msg}")
             raise WebJusticeAPIError(f"Failed to get status: {error_msg}")
         except httpx.RequestError as e:
             logger.error(f"Request failed: {str(e)}")
             raise WebJusticeAPIError(f"Request failed: {str(e)}")
     
+    def _watch_request(self, job_id: str, timeout: float) -> Tuple[str, httpx.Timeout]:
+        """
+        URL and transport timeout for a watch request held up to `timeout` seconds.
+        
+        `wait` is appended to the status URL by hand: httpx `params=` would replace the
+        projection query instead of adding to it.
+        """
+        url = f"{self._url_status_fmt.format(job_id)}&wait={int(timeout)}"
+        return url, httpx.Timeout(connect=10.0, read=timeout + 10.0, write=10.0, pool=5.0)
+    
+    def watch_search_status(self, job_id: str, timeout: float = LONG_POLL_TIMEOUT) -> Dict[str, Any]:
+        """
+        Long-poll the status of a search job.
+        
+        The server holds the request until the job status changes (or `timeout` elapses)
+        instead of answering right away, so one request replaces a run of "not ready" polls.
+        
+        Args:
+            job_id: The search job identifier
+            timeout: Seconds the server may hold the request
+            
+        Returns:
+            Dict containing search status details
+            
+        Raises:
+            WebJusticeAPIError: If the API request fails
+        """
+        url, request_timeout = self._watch_request(job_id, timeout)
+        
+        try:
+            headers, cached = self._status_headers(job_id)
+            response = self.client.get(url, headers=headers, timeout=request_timeout)
+            return self._read_status(job_id, response, cached)
+            
+        except httpx.HTTPStatusError as e:
+            error_msg = f"HTTP {e.response.status_code}: {_response_body(e.response)}"
+            logger.error(f"Status watch failed for job {job_id}: {error_msg}")
+            raise WebJusticeAPIError(f"Failed to watch status: {error_msg}")
+        except httpx.RequestError as e:
+            logger.error(f"Request failed: {str(e)}")
+            raise WebJusticeAPIError(f"Request failed: {str(e)}")
+    
     def get_processes(self, document: str) -> Dict[str, Any]:
         """
         Get the results of a completed search.
@@ -137,26 +394,26 @@ class WebJusticeClient:
         Raises:
             WebJusticeAPIError: If the API request fails or search is not complete
         """
-        url = urljoin(self.base_url, f'/api/ai-agent/processos/{document}')
+        url = self._url_processes_fmt.format(document)
         
         try:
             logger.info(f"Retrieving results for: {document}")
-            response = self.client.get(url)
+            response = self.client.get(url, headers=self.headers)
             
             if response.status_code == 425:  # Too Early - search not complete
-                error_data = response.json()
+                error_data = _decode(response)
                 logger.warning(f"Search not complete for {document}: {error_data}")
                 raise WebJusticeAPIError(f"Search not complete: {error_data}")
             
             response.raise_for_status()
             
-            data = response.json()
-            logger.info(f"Retrieved {data.get('total_processos', 0)} processes for {document}")
-            logger.info(f"Full API response: {json.dumps(data, indent=2, ensure_ascii=False)}")
+            data = _decode(response)
+            logger.info("Retrieved %s processes for %s", data.get('total_processos', 0), document)
+            logger.debug("Full API response: %s", LazyJSON(data, pretty=False))
             return data
             
         except httpx.HTTPStatusError as e:
-            error_msg = f"HTTP {e.response.status_code}: {e.response.text}"
+            error_msg = f"HTTP {e.response.status_code}: {_response_body(e.response)}"
             logger.error(f"Failed to get results for {document}: {error_msg}")
             raise WebJusticeAPIError(f"Failed to get results: {error_msg}")
         except httpx.RequestError as e:
@@ -167,13 +424,16 @@ class WebJusticeClient:
         """
         Test if the API key is valid.
         
+        Explicit health probe only; consultations detect a bad key from the 401/403
+        of their first request instead.
+        
         Returns:
             True if authentication is successful, False otherwise
         """
-        url = urljoin(self.base_url, '/api/ai-agent/test-auth')
+        url = self._url_test_auth
         
         try:
-            response = self.client.get(url)
+            response = self.client.get(url, headers=self.headers)
             response.raise_for_status()
             logger.info("Authentication test successful")
             return True
@@ -188,19 +448,22 @@ class WebJusticeClient:
         Returns:
             Dict containing health status information
         """
-        url = urljoin(self.base_url, '/health')
+        url = self._url_health
         
         try:
-            response = self.client.get(url)
+            response = self.client.get(url, headers=self.headers)
             response.raise_for_status()
-            return response.json()
+            return _decode(response)
         except Exception as e:
             logger.error(f"Health check failed: {str(e)}")
             return {"status": "unhealthy", "error": str(e)}
     
     def close(self):
-        """Close the HTTP client."""
-        self.client.close()
+        """
+        Release the client. The shared connection pool stays open for other
+        instances and is closed at interpreter exit.
+        """
+        pass
     
     def __enter__(self):
         return self
@@ -208,6 +471,229 @@ class WebJusticeClient:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
+    # ------------------------------------------------------------------
+    # Async API
+    # ------------------------------------------------------------------
+    
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Shared async HTTP client for the running event loop."""
+        return _get_shared_async_client()
+    
+    async def ainitiate_search(self, document: str, search_type: str = "document") -> Dict[str, Any]:
+        """
+        Async version of initiate_search.
+        
+        Raises:
+            WebJusticeAPIError: If the API request fails
+        """
+        url = self._url_initiate
+        
+        payload = {
+            "document": document,
+            "search_type": search_type
+        }
+        
+        try:
+            logger.info(f"Initiating {search_type} search for: {document}")
+            response = await self.async_client.post(url, json=payload, headers=self.headers)
+            response.raise_for_status()
+            
+            data = _decode(response)
+            logger.info(f"Search initiated successfully. Job ID: {data.get('job_id')}")
+            return data
+            
+        except httpx.HTTPStatusError as e:
+            # No auth probe is made up front: a rejected key surfaces here on the first request
+            if e.response.status_code in AUTH_FAILURE_STATUSES:
+                logger.error(f"Search initiation rejected: HTTP {e.response.status_code}")
+                raise WebJusticeAuthError(
+                    f"Authentication failed (HTTP {e.response.status_code}) - check WEB_JUSTICE_API_KEY"
+                )
+            error_msg = f"HTTP {e.response.status_code}: {_response_body(e.response)}"
+            logger.error(f"Search initiation failed: {error_msg}")
+            raise WebJusticeAPIError(f"Failed to initiate search: {error_msg}")
+        except httpx.RequestError as e:
+            logger.error(f"Request failed: {str(e)}")
+            raise WebJusticeAPIError(f"Request failed: {str(e)}")
+    
+    async def aget_search_status(self, job_id: str) -> Dict[str, Any]:
+        """
+        Async version of get_search_status.
+        
+        Raises:
+            WebJusticeAPIError: If the API request fails
+        """
+        url = self._url_status_fmt.format(job_id)
+        
+        try:
+            headers, cached = self._status_headers(job_id)
+            response = await self.async_client.get(url, headers=headers)
+            return self._read_status(job_id, response, cached)
+            
+        except httpx.HTTPStatusError as e:
+            error_msg = f"HTTP {e.response.status_code}: {_response_body(e.response)}"
+            logger.error(f"Status check failed for job {job_id}: {error_msg}")
+            raise WebJusticeAPIError(f"Failed to get status: {error_msg}")
+        except httpx.RequestError as e:
+            logger.error(f"Request failed: {str(e)}")
+            raise WebJusticeAPIError(f"Request failed: {str(e)}")
+    
+    async def awatch_search_status(self, job_id: str, timeout: float = LONG_POLL_TIMEOUT) -> Dict[str, Any]:
+        """
+        Async version of watch_search_status.
+        
+        Raises:
+            WebJusticeAPIError: If the API request fails
+        """
+        url, request_timeout = self._watch_request(job_id, timeout)
+        
+        try:
+            headers, cached = self._status_headers(job_id)
+            response = await self.async_client.get(url, headers=headers, timeout=request_timeout)
+            return self._read_status(job_id, response, cached)
+            
+        except httpx.HTTPStatusError as e:
+            error_msg = f"HTTP {e.response.status_code}: {_response_body(e.response)}"
+            logger.error(f"Status watch failed for job {job_id}: {error_msg}")
+            raise WebJusticeAPIError(f"Failed to watch status: {error_msg}")
+        except httpx.RequestError as e:
+            logger.error(f"Request failed: {str(e)}")
+            raise WebJusticeAPIError(f"Request failed: {str(e)}")
+    
+    async def aget_processes(self, document: str) -> Dict[str, Any]:
+        """
+        Async version of get_processes.
+        
+        Raises:
+            WebJusticeAPIError: If the API request fails or search is not complete
+        """
+        url = self._url_processes_fmt.format(document)
+        
+        try:
+            logger.info(f"Retrieving results for: {document}")
+            response = await self.async_client.get(url, headers=self.headers)
+            
+            if response.status_code == 425:  # Too Early - search not complete
+                error_data = _decode(response)
+                logger.warning(f"Search not complete for {document}: {error_data}")
+                raise WebJusticeAPIError(f"Search not complete: {error_data}")
+            
+            response.raise_for_status()
+            
+            data = _decode(response)
+            logger.info("Retrieved %s processes for %s", data.get('total_processos', 0), document)
+            logger.debug("Full API response: %s", LazyJSON(data, pretty=False))
+            return data
+            
+        except httpx.HTTPStatusError as e:
+            error_msg = f"HTTP {e.response.status_code}: {_response_body(e.response)}"
+            logger.error(f"Failed to get results for {document}: {error_msg}")
+            raise WebJusticeAPIError(f"Failed to get results: {error_msg}")
+        except httpx.RequestError as e:
+            logger.error(f"Request failed: {str(e)}")
+            raise WebJusticeAPIError(f"Request failed: {str(e)}")
+    
+    async def atest_authentication(self) -> bool:
+        """
+        Async version of test_authentication.
+        
+        Returns:
+            True if authentication is successful, False otherwise
+        """
+        url = self._url_test_auth
+        
+        try:
+            response = await self.async_client.get(url, headers=self.headers)
+            response.raise_for_status()
+            logger.info("Authentication test successful")
+            return True
+        except Exception as e:
+            logger.error(f"Authentication test failed: {str(e)}")
+            return False
+    
+    async def await_job(
+        self, 
+        job_id: str, 
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        config: Optional[PollingConfig] = None
+    ) -> Dict[str, Any]:
+        """
+        Wait for a search job to become ready for consultation without blocking a thread.
+        
+        Args:
+            job_id: The search job identifier
+            progress_callback: Optional callback for progress updates
+            config: Polling configuration (defaults to AWAIT_JOB_POLLING: 0.5s doubling up to 4s)
+            
+        Returns:
+            Final search status
+            
+        Raises:
+            PollingTimeoutError: If the job does not complete in time
+        """
+        return await apoll_search_completion(
+            self, job_id, progress_callback, config or AWAIT_JOB_POLLING
+        )
+    
+    async def ainitiate_searches_batch(
+        self, 
+        searches: Sequence[Tuple[str, str]]
+    ) -> List[Union[Dict[str, Any], WebJusticeAPIError]]:
+        """
+        Initiate several searches at once; the backend queues them in parallel.
+        
+        Args:
+            searches: (document, search_type) pairs
+            
+        Returns:
+            One entry per search, in order: the initiation response, or the
+            WebJusticeAPIError raised for that search
+        """
+        responses = await asyncio.gather(
+            *(self.ainitiate_search(document, search_type) for document, search_type in searches),
+            return_exceptions=True
+        )
+        for response in responses:
+            if isinstance(response, BaseException) and not isinstance(response, WebJusticeAPIError):
+                raise response
+        return responses
+    
+    async def await_jobs(
+        self, 
+        job_ids: Sequence[str], 
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        config: Optional[PollingConfig] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Wait for several search jobs, checking all pending jobs on each poll tick.
+        
+        Args:
+            job_ids: Search job identifiers
+            progress_callback: Optional callback for progress updates
+            config: Polling configuration (defaults to AWAIT_JOB_POLLING)
+            
+        Returns:
+            Dict mapping each job_id to its final status
+            
+        Raises:
+            PollingTimeoutError: If any job does not complete in time
+        """
+        return await apoll_jobs_completion(
+            self, job_ids, progress_callback, config or AWAIT_JOB_POLLING
+        )
+    
+    async def aclose(self):
+        """Async counterpart of close(); the shared async pool stays open."""
+        pass
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+        self.close()
+
 
 # Utility function for creating a configured client
 def create_client() -> WebJusticeClient:
@@ -4,7 +4,7 @@ Ferramenta: Consulta de Processo (process_consultation)
 Descrição geral
 ----------------
 Esta ferramenta recebe um texto livre do usuário, extrai o primeiro número de processo no padrão CNJ
-(ex.: 0000000-00.2020.1.00.0000), inicia uma busca na API Web Justice, realiza polling até a
+(ex.: 0000000-13.2020.1.00.0000), inicia uma busca na API Web Justice, realiza polling até a
 conclusão e retorna um JSON estruturado com os processos e metadados.
 
 Quando usar
@@ -67,7 +67,9 @@ Saída (JSON serializável)
     "summary": {
       "total_processes": <int>,
       "document_searched": "<numero_processo>",
-      "search_completed_at": "<ISO datetime>"
+      "search_completed_at": "<ISO datetime>",
+      "from_cache": <bool>,  # true quando servido do cache de resultados
+      "cached_at": "<ISO datetime>" | null  # quando a resposta servida do cache foi obtida da API
     }
   }
 
@@ -98,29 +100,38 @@ Fluxo interno resumido
 1) Extrai e normaliza o número de processo (utils.process_validator).
 2) Inicia a busca via POST /api/ai-agent/initiate-search (integrations.web_justice_client).
 3) Faz polling de status via GET /api/searches/{job_id}/detailed-status até is_ready_for_consultation.
+   (A versão assíncrona, aconsult_process, faz o mesmo fluxo com httpx.AsyncClient.)
 4) Obtém o resultado consolidado via GET /api/ai-agent/processos/{processo}.
 
 Timeouts e robustez
 -------------------
-- Polling com backoff exponencial (1s → máx. 5s) até ~15 minutos (utils.polling_manager).
+- Polling com backoff exponencial com jitter (1s → máx. 20s, reinicia quando o progresso avança) até ~15 minutos (utils.polling_manager).
 - Se exceder o tempo, lança PollingTimeoutError e retorna erro amigável.
 - Requisições HTTP com timeouts e tratamento de status code (httpx).
 
 Performance e concorrência
 --------------------------
 - Polling evita sobrecarga, aumentando o intervalo entre tentativas.
-- Não mantém estado global; seguro para múltiplas invocações independentes.
+- aconsult_process_stream emite eventos de progresso durante o polling e um evento por
+  processo encontrado, permitindo agir no primeiro resultado sem esperar a resposta completa.
+- Com JUSTICE_AGENT_CACHE=1 (desligado por padrão: dados processuais mudam), respostas de sucesso
+  ficam em cache (utils.result_cache: LRU em memória + disco) por processo normalizado; consultas
+  repetidas dentro do TTL (JUSTICE_AGENT_CACHE_TTL, padrão 1h) não chamam a API e retornam
+  summary.from_cache = true e summary.cached_at. Use no_cache=True para forçar uma consulta nova.
+- Com WEB_JUSTICE_STALE_FALLBACK=1, falhas da API (fora do ar, 5xx, timeout de polling) retornam a
+  última resposta de sucesso do processo (até 24h) com summary.served_stale = true e
+  summary.stale_reason, em vez de CONSULTATION_ERROR. Desligado por padrão; requer o cache ligado.
 
 Exemplos de uso
 ---------------
 - Programático:
     from process_consultation import consult_process
-    result = consult_process("Preciso do processo 0000000-00.2020.1.00.0000")
+    result = consult_process("Preciso do processo 0000000-13.2020.1.00.0000")
 
 - CLI:
     WEB_JUSTICE_API_URL=http://localhost:8000 \
     WEB_JUSTICE_API_KEY=... \
-    python3 process_consultation.py "verifique o 0000000-00.2020.1.00.0000"
+    python3 process_consultation.py "verifique o 0000000-13.2020.1.00.0000"
 
 Limitações conhecidas
 ---------------------
@@ -134,23 +145,22 @@ Compatibilidade de resposta
 
 import os
 import sys
-import json
+import asyncio
 import logging
-from typing import Dict, Any, Optional
-from dataclasses import asdict
-
-# Add the tools directory to Python path for imports
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from .integrations.web_justice_client import WebJusticeClient, WebJusticeAPIError
+import functools
+import weakref
+import threading
+import concurrent.futures
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, Callable, AsyncIterator, List, Sequence, Union
+
+from .integrations.web_justice_client import WebJusticeClient, WebJusticeAPIError, aclose_shared_async_client
 from .utils.polling_manager import poll_search_completion, PollingTimeoutError, create_progress_logger
-from .utils.process_validator import extract_first_process, ProcessValidationError
-
-# Import Agno tool decorator
-from agno.tools import tool
+from .utils.process_validator import extract_first_process, extract_process_numbers, ProcessValidationError
+from .utils.result_cache import ResultCache, get_result_cache
+from .utils.timing import timed, format_timings
+from .utils.serialization import dumps_bytes, LazyJSON
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
@@ -159,40 +169,100 @@ class ProcessConsultationError(Exception):
     pass
 
 
+# Message prefix for API errors by the consultation phase that raised them
+PHASE_ERROR_MESSAGES = {
+    "client": "Failed to initialize API client",
+    "initiate": "Failed to initiate search",
+    "poll": "Error during polling",
+    "fetch": "Failed to retrieve results",
+}
+
+# Digits in a CNJ process number (NNNNNNN-DD.AAAA.J.TR.OOOO)
+CNJ_DIGITS = 20
+_DROP_DIGITS = str.maketrans('', '', '0123456789')
+
+# Exceptions whose message prefix does not depend on the phase
+ERROR_MAP = {
+    PollingTimeoutError: "Search timed out",
+}
+
+
+# AIDEV-NOTE: one API client per process; tools must not close it
+_SHARED_CLIENT: Optional[WebJusticeClient] = None
+_SHARED_CLIENT_LOCK = threading.Lock()
+
+
+def _get_shared_client() -> WebJusticeClient:
+    """
+    Get the process-wide API client, creating it on first use.
+    
+    No authentication probe is made: an invalid key surfaces as the 401 of the
+    first real request.
+    
+    Raises:
+        ProcessConsultationError: If the client cannot be created (e.g. missing API key)
+    """
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None:
+        with _SHARED_CLIENT_LOCK:
+            if _SHARED_CLIENT is None:
+                try:
+                    _SHARED_CLIENT = WebJusticeClient()
+                except Exception as e:
+                    raise ProcessConsultationError(f"Failed to initialize API client: {str(e)}")
+    return _SHARED_CLIENT
+
+
 class ProcessConsultationTool:
     """
     AI Agent tool for consulting legal process information via Web Justice API.
     """
     
-    def __init__(self):
-        """Initialize the process consultation tool."""
-        self.client = None
+    # AIDEV-NOTE: in-flight consultations are shared by every tool instance in the process,
+    # so duplicates coalesce even across tools (stream, hybrid search, the shared tool).
+    # process number -> result of the consultation currently running for it
+    _inflight: Dict[str, concurrent.futures.Future] = {}
+    _inflight_lock = threading.Lock()
+    # Async futures belong to one event loop, so the async map is kept per loop
+    _ainflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]]" = weakref.WeakKeyDictionary()
+    
+    def __init__(self, result_cache: Optional[ResultCache] = None, stale_fallback: Optional[bool] = None):
+        """
+        Initialize the process consultation tool.
+        
+        Args:
+            result_cache: Cache for successful responses (defaults to the shared on-disk cache)
+            stale_fallback: Serve the last good (expired) response when the API fails
+                (defaults to WEB_JUSTICE_STALE_FALLBACK == "1")
+        """
+        self.result_cache = result_cache or get_result_cache()
+        self.stale_fallback = (
+            stale_fallback if stale_fallback is not None
+            else os.getenv('WEB_JUSTICE_STALE_FALLBACK', '0') == '1'
+        )
         logger.info("ProcessConsultationTool initialized")
     
-    def _get_client(self) -> WebJusticeClient:
-        """Get or create API client."""
-        if not self.client:
-            try:
-                self.client = WebJusticeClient()
-                # Test authentication on first use
-                if not self.client.test_authentication():
-                    raise ProcessConsultationError("API authentication failed")
-            except Exception as e:
-                raise ProcessConsultationError(f"Failed to initialize API client: {str(e)}")
-        return self.client
-    
-    def consult_process(self, user_input: str) -> Dict[str, Any]:
+    @functools.cached_property
+    def client(self) -> WebJusticeClient:
+        """The shared API client, looked up on first use and then a plain attribute."""
+        return _get_shared_client()
+    
+    def consult_process(self, user_input: str, no_cache: bool = False) -> Dict[str, Any]:
         """
         Main method to consult a process based on user input.
         
+        Concurrent calls for the same process number, from any tool instance, run a
+        single search: later callers wait for the first one and receive the same response dict.
+        
         Args:
             user_input: User message containing process number
+            no_cache: Skip cached results and always run a fresh search
             
         Returns:
             Dict containing process information or error details
         """
         try:
-            logger.info(f"Processing consultation request: {user_input[:100]}...")
+            logger.info("Processing consultation request: %.100s...", user_input)
             
             # Extract process number from user input
             process_number = self._extract_process_number(user_input)
@@ -202,13 +272,61 @@ class ProcessConsultationTool:
                     "No valid process number found in your message. Please provide a process number in the format: NNNNNNN-DD.AAAA.J.TR.OOOO"
                 )
             
-            logger.info(f"Extracted process number: {process_number}")
+            logger.info("Extracted process number: %s", process_number)
+            
+            # Serve repeated consultations from the result cache
+            cached = None if no_cache else self.result_cache.get("process", process_number)
+            if cached is not None:
+                logger.info("Returning cached result for process %s", process_number)
+                cached['summary']['from_cache'] = True
+                return cached
+            
+            # Single-flight: concurrent callers for the same process share one search
+            with self._inflight_lock:
+                leader = self._inflight.get(process_number)
+                if leader is None:
+                    future = self._inflight[process_number] = concurrent.futures.Future()
+            if leader is not None:
+                logger.info("Joining in-flight consultation for process %s", process_number)
+                return leader.result()
+            
+            try:
+                response = self._consult(process_number)
+                future.set_result(response)
+                return response
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            finally:
+                with self._inflight_lock:
+                    del self._inflight[process_number]
+        except Exception as e:
+            logger.error(f"Unexpected error during process consultation: {str(e)}")
+            return self._create_error_response("UNEXPECTED_ERROR", f"An unexpected error occurred: {str(e)}")
+    
+    def _consult(self, process_number: str) -> Dict[str, Any]:
+        """
+        Run a fresh search for a process number: initiate, poll, fetch and cache.
+        
+        Args:
+            process_number: Normalized CNJ process number
+            
+        Returns:
+            Dict containing process information or error details
+        """
+        try:
+            # Per call: concurrent consultations share this tool (see get_tool)
+            phase_timings: Dict[str, float] = {}
             
             # Get API client
-            client = self._get_client()
+            phase = "client"
+            with timed(phase, phase_timings):
+                client = self.client
             
             # Initiate search
-            search_response = self._initiate_search(client, process_number)
+            phase = "initiate"
+            with timed(phase, phase_timings):
+                search_response = client.initiate_search(process_number, search_type="process")
             job_id = search_response.get('job_id')
             
             if not job_id:
@@ -218,59 +336,263 @@ class ProcessConsultationTool:
                 )
             
             # Poll for completion
-            final_status = self._poll_for_completion(client, job_id, process_number)
+            phase = "poll"
+            with timed(phase, phase_timings):
+                poll_search_completion(client, job_id, create_progress_logger(f"Process {process_number} search"))
             
             # Get results
-            results = self._get_search_results(client, process_number)
+            phase = "fetch"
+            with timed(phase, phase_timings):
+                results = client.get_processes(process_number)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Phase timings for %s: %s", process_number, format_timings(phase_timings))
             
             # Return structured response
             final_response = self._create_success_response(results, process_number, search_response)
-            logger.info(f"Final tool response: {json.dumps(final_response, indent=2, ensure_ascii=False)}")
+            self._cache_response(process_number, final_response)
+            logger.debug("Final tool response: %s", LazyJSON(final_response, pretty=False))
             return final_response
             
+        except (WebJusticeAPIError, PollingTimeoutError) as e:
+            message = f"{ERROR_MAP.get(type(e)) or PHASE_ERROR_MESSAGES[phase]}: {str(e)}"
+            logger.error("Process consultation error: %s", message)
+            return self._stale_response(process_number, message) or self._create_error_response("CONSULTATION_ERROR", message)
         except ProcessConsultationError as e:
             logger.error(f"Process consultation error: {str(e)}")
-            return self._create_error_response("CONSULTATION_ERROR", str(e))
+            return self._stale_response(process_number, str(e)) or self._create_error_response("CONSULTATION_ERROR", str(e))
         except Exception as e:
             logger.error(f"Unexpected error during process consultation: {str(e)}")
             return self._create_error_response("UNEXPECTED_ERROR", f"An unexpected error occurred: {str(e)}")
     
-    def _extract_process_number(self, user_input: str) -> Optional[str]:
-        """Extract process number from user input."""
+    async def aconsult_process(
+        self, 
+        user_input: str, 
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        no_cache: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Async version of consult_process. Polling waits on the event loop instead of
+        sleeping a thread, so many consultations can run concurrently.
+        
+        Coroutines asking for a process that is already being consulted on the same
+        event loop (by any tool) await that search; their progress_callback receives no updates.
+        
+        Args:
+            user_input: User message containing process number
+            progress_callback: Optional callback receiving each polled search status
+            no_cache: Skip cached results and always run a fresh search
+            
+        Returns:
+            Dict containing process information or error details
+        """
         try:
-            return extract_first_process(user_input)
-        except ProcessValidationError as e:
-            logger.warning(f"Process validation error: {str(e)}")
-            return None
+            logger.info("Processing consultation request: %.100s...", user_input)
+            
+            process_number = self._extract_process_number(user_input)
+            if not process_number:
+                return self._create_error_response(
+                    "NO_PROCESS_FOUND",
+                    "No valid process number found in your message. Please provide a process number in the format: NNNNNNN-DD.AAAA.J.TR.OOOO"
+                )
+            
+            logger.info("Extracted process number: %s", process_number)
+            
+            cached = None if no_cache else self.result_cache.get("process", process_number)
+            if cached is not None:
+                logger.info("Returning cached result for process %s", process_number)
+                cached['summary']['from_cache'] = True
+                return cached
+            
+            # Single-flight: coroutines on this loop asking for the same process share one search.
+            # No await between lookup and insert, so the map needs no lock.
+            loop = asyncio.get_running_loop()
+            while True:
+                inflight = self._ainflight.setdefault(loop, {})
+                leader = inflight.get(process_number)
+                if leader is None:
+                    break
+                logger.info("Joining in-flight consultation for process %s", process_number)
+                try:
+                    return await asyncio.shield(leader)
+                except asyncio.CancelledError:
+                    # Leader was cancelled (e.g. a closed stream): take over the search
+                    if not leader.cancelled():
+                        raise
+            
+            future = inflight[process_number] = loop.create_future()
+            try:
+                response = await self._aconsult(process_number, progress_callback)
+                future.set_result(response)
+                return response
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            finally:
+                del inflight[process_number]
+                # Drop the loop's map once idle so nothing keeps a finished loop referenced
+                if not inflight and self._ainflight.get(loop) is inflight:
+                    del self._ainflight[loop]
+        except Exception as e:
+            logger.error(f"Unexpected error during process consultation: {str(e)}")
+            return self._create_error_response("UNEXPECTED_ERROR", f"An unexpected error occurred: {str(e)}")
     
-    def _initiate_search(self, client: WebJusticeClient, process_number: str) -> Dict[str, Any]:
-        """Initiate search for the process number."""
+    async def _aconsult(
+        self,
+        process_number: str,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Async counterpart of _consult.
+        
+        Args:
+            process_number: Normalized CNJ process number
+            progress_callback: Optional callback receiving each polled search status
+            
+        Returns:
+            Dict containing process information or error details
+        """
         try:
-            return client.initiate_search(process_number, search_type="process")
-        except WebJusticeAPIError as e:
-            raise ProcessConsultationError(f"Failed to initiate search: {str(e)}")
+            # Per call: concurrent consultations share this tool (see get_tool)
+            phase_timings: Dict[str, float] = {}
+            
+            phase = "client"
+            with timed(phase, phase_timings):
+                client = self.client
+            
+            phase = "initiate"
+            with timed(phase, phase_timings):
+                search_response = await client.ainitiate_search(process_number, search_type="process")
+            job_id = search_response.get('job_id')
+            
+            if not job_id:
+                return self._create_error_response(
+                    "SEARCH_INITIATION_FAILED", 
+                    "Failed to initiate search - no job ID returned"
+                )
+            
+            log_progress = create_progress_logger(f"Process {process_number} search")
+            
+            def on_progress(status: Dict[str, Any]):
+                log_progress(status)
+                if progress_callback:
+                    progress_callback(status)
+            
+            phase = "poll"
+            with timed(phase, phase_timings):
+                await client.await_job(job_id, on_progress)
+            
+            phase = "fetch"
+            with timed(phase, phase_timings):
+                results = await client.aget_processes(process_number)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Phase timings for %s: %s", process_number, format_timings(phase_timings))
+            
+            final_response = self._create_success_response(results, process_number, search_response)
+            self._cache_response(process_number, final_response)
+            logger.debug("Final tool response: %s", LazyJSON(final_response, pretty=False))
+            return final_response
+            
+        except (WebJusticeAPIError, PollingTimeoutError) as e:
+            message = f"{ERROR_MAP.get(type(e)) or PHASE_ERROR_MESSAGES[phase]}: {str(e)}"
+            logger.error("Process consultation error: %s", message)
+            return self._stale_response(process_number, message) or self._create_error_response("CONSULTATION_ERROR", message)
+        except ProcessConsultationError as e:
+            logger.error(f"Process consultation error: {str(e)}")
+            return self._stale_response(process_number, str(e)) or self._create_error_response("CONSULTATION_ERROR", str(e))
+        except Exception as e:
+            logger.error(f"Unexpected error during process consultation: {str(e)}")
+            return self._create_error_response("UNEXPECTED_ERROR", f"An unexpected error occurred: {str(e)}")
+
     
-    def _poll_for_completion(self, client: WebJusticeClient, job_id: str, process_number: str) -> Dict[str, Any]:
-        """Poll for search completion."""
+    async def aconsult_process_stream(self, user_input: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a consultation as events instead of waiting for the full response.
+        
+        Events, in order:
+        - {"event": "progress", "status": {...}} for each polled search status
+        - {"event": "process", "process": {...}} for each process found
+        - {"event": "done", "response": {...}} with the complete response
+        Failures yield a single {"event": "error", "response": {...}} after any progress events.
+        
+        Callers can stop iterating at any point (e.g. after the first process);
+        an unfinished consultation is cancelled when the generator is closed.
+        
+        Args:
+            user_input: User message containing process number
+            
+        Yields:
+            Consultation events
+        """
+        progress: asyncio.Queue = asyncio.Queue()
+        consultation = asyncio.create_task(
+            self.aconsult_process(user_input, progress_callback=progress.put_nowait)
+        )
+        
         try:
-            progress_callback = create_progress_logger(f"Process {process_number} search")
-            return poll_search_completion(client, job_id, progress_callback)
-        except PollingTimeoutError as e:
-            raise ProcessConsultationError(f"Search timed out: {str(e)}")
-        except WebJusticeAPIError as e:
-            raise ProcessConsultationError(f"Error during polling: {str(e)}")
-    
-    def _get_search_results(self, client: WebJusticeClient, process_number: str) -> Dict[str, Any]:
-        """Get the final search results."""
+            while not consultation.done():
+                next_status = asyncio.ensure_future(progress.get())
+                await asyncio.wait({next_status, consultation}, return_when=asyncio.FIRST_COMPLETED)
+                if next_status.done():
+                    yield {"event": "progress", "status": next_status.result()}
+                else:
+                    next_status.cancel()
+            
+            while not progress.empty():
+                yield {"event": "progress", "status": progress.get_nowait()}
+            
+            response = consultation.result()
+        finally:
+            if not consultation.done():
+                consultation.cancel()
+        
+        if response.get('status') != 'success':
+            yield {"event": "error", "response": response}
+            return
+        
+        for process in self._iter_processes(response):
+            yield {"event": "process", "process": process}
+        
+        yield {"event": "done", "response": response}
+    
+    def _iter_processes(self, response: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Process entries of a success response (data_details or legacy data layout)."""
+        results = response.get('data_details') or {}
+        details = results.get('data_details') or results.get('data') or results
+        return details.get('processos') or []
+    
+    def _extract_process_number(self, user_input: str) -> Optional[str]:
+        """Extract process number from user input."""
+        # A CNJ number has 20 digits: skip the regex cascade on text that cannot hold one
+        # (counted in C via translate; non-ASCII text may carry other Unicode digits)
+        text = str(user_input)
+        if text.isascii() and len(text) - len(text.translate(_DROP_DIGITS)) < CNJ_DIGITS:
+            return None
         try:
-            return client.get_processes(process_number)
-        except WebJusticeAPIError as e:
-            raise ProcessConsultationError(f"Failed to retrieve results: {str(e)}")
+            return extract_first_process(text)
+        except ProcessValidationError as e:
+            logger.warning(f"Process validation error: {str(e)}")
+            return None
     
     def _create_success_response(self, results: Dict[str, Any], process_number: str, search_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a successful response structure."""
+        """
+        Create a successful response structure.
+        
+        The API payload is stored as-is under "data_details": it is the same dict
+        the client returned, not a copy.
+        """
         # Compat layer: API pode retornar data_details (novo) ou data (antigo)
         details = results.get('data_details') or results.get('data') or results
+        details_get = details.get
+        summary = {
+            "total_processes": details_get('total_processos', 0),
+            "document_searched": details_get('documento', process_number),
+            "search_completed_at": details_get('search_completed_at'),
+            "from_cache": False,
+            "cached_at": None
+        }
         return {
             "status": "success",
             "tool": "process_consultation",
@@ -284,13 +606,42 @@ class ProcessConsultationTool:
                 "user_role": search_info.get('user_role')
             },
             "data_details": results,
-            "summary": {
-                "total_processes": details.get('total_processos', 0),
-                "document_searched": details.get('documento', process_number),
-                "search_completed_at": details.get('search_completed_at')
-            }
+            "summary": summary
         }
     
+    def _cache_response(self, process_number: str, response: Dict[str, Any]):
+        """
+        Store a fresh success response, stamped with summary.cached_at.
+        
+        Only the stored copy carries the timestamp: a response served from the cache
+        later tells the model how old its data is, the fresh one keeps cached_at = None.
+        """
+        if not self.result_cache.enabled:
+            return
+        summary = {**response['summary'], 'cached_at': datetime.now(timezone.utc).isoformat()}
+        self.result_cache.set("process", process_number, {**response, 'summary': summary})
+    
+    def _stale_response(self, process_number: str, reason: str) -> Optional[Dict[str, Any]]:
+        """
+        Last successful response for the process, flagged as stale, if the fallback is enabled.
+        
+        Returns:
+            The stale response, or None when disabled or nothing was stored
+        """
+        if not self.stale_fallback:
+            return None
+        
+        stale = self.result_cache.get_stale("process", process_number)
+        if stale is None:
+            return None
+        
+        logger.warning("Serving stale result for process %s: %s", process_number, reason)
+        summary = stale['summary']
+        summary['from_cache'] = True
+        summary['served_stale'] = True
+        summary['stale_reason'] = reason
+        return stale
+    
     def _create_error_response(self, error_code: str, error_message: str) -> Dict[str, Any]:
         """Create an error response structure."""
         return {
@@ -304,60 +655,184 @@ class ProcessConsultationTool:
         }
     
     def close(self):
-        """Clean up resources."""
-        if self.client:
-            self.client.close()
+        """Release the tool. The shared API client stays open for later consultations."""
+        self.__dict__.pop('client', None)
+    
+    async def aclose(self):
+        """Async counterpart of close()."""
+        self.__dict__.pop('client', None)
 
 
 # Main function for CLI usage
+def _print_json(obj: Any, pretty: bool = False):
+    """Write JSON to stdout as UTF-8 bytes (orjson output goes out without a str round trip)."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(dumps_bytes(obj, pretty=pretty) + b"\n")
+    sys.stdout.buffer.flush()
+
+
 def main():
     """Main function for command-line usage."""
+    # Only the CLI configures logging; library and Agno hosts keep their own setup
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
     if len(sys.argv) < 2:
-        print(json.dumps({
+        _print_json({
             "status": "error",
             "error": {
                 "code": "MISSING_INPUT",
                 "message": "Please provide user input as command line argument"
             }
-        }))
+        })
         sys.exit(1)
     
     user_input = " ".join(sys.argv[1:])
     
-    tool = ProcessConsultationTool()
-    try:
-        result = tool.consult_process(user_input)
-        print(json.dumps(result, indent=2, ensure_ascii=False))
-    finally:
-        tool.close()
+    result = get_tool().consult_process(user_input)
+    _print_json(result, pretty=True)
+
+
+# Process-wide tool reused by consult_process and the Agno tool
+_TOOL: Optional[ProcessConsultationTool] = None
+_TOOL_LOCK = threading.Lock()
+
+
+def get_tool() -> ProcessConsultationTool:
+    """
+    Get the shared ProcessConsultationTool, creating it on first use.
+    
+    The tool holds no per-call state (phase timings are local to each consultation),
+    and its API client is closed at interpreter exit, so it is never closed here.
+    """
+    global _TOOL
+    if _TOOL is None:
+        with _TOOL_LOCK:
+            if _TOOL is None:
+                _TOOL = ProcessConsultationTool()
+    return _TOOL
 
 
 # Function for programmatic usage
-def consult_process(user_input: str) -> Dict[str, Any]:
+def consult_process(user_input: str, no_cache: bool = False) -> Dict[str, Any]:
     """
     Programmatic interface for process consultation.
     
     Args:
         user_input: User message containing process number
+        no_cache: Skip cached results and always run a fresh search
         
     Returns:
         Dict containing process information or error details
     """
+    return get_tool().consult_process(user_input, no_cache=no_cache)
+
+
+async def aconsult_process(user_input: str, no_cache: bool = False) -> Dict[str, Any]:
+    """
+    Async interface for process consultation.
+    
+    Independent consultations can be awaited concurrently (e.g. with asyncio.gather);
+    polling yields to the event loop instead of blocking a thread.
+    
+    Args:
+        user_input: User message containing process number
+        no_cache: Skip cached results and always run a fresh search
+        
+    Returns:
+        Dict containing process information or error details
+    """
+    return await get_tool().aconsult_process(user_input, no_cache=no_cache)
+
+
+async def aconsult_processes(
+    user_inputs: Union[str, Sequence[str]], 
+    concurrency: int = 20
+) -> List[Dict[str, Any]]:
+    """
+    Consult several processes concurrently on one event loop.
+    
+    Wall time is roughly that of the slowest search instead of the sum of all of them.
+    
+    Args:
+        user_inputs: User messages, each containing a process number, or a single
+            message: every distinct process number in it is consulted
+        concurrency: Maximum number of consultations in flight at once
+        
+    Returns:
+        One response dict per input (per process number for a single message), in the
+        same order (failures are error responses)
+    """
+    if isinstance(user_inputs, str):
+        # A message without any number still gets its NO_PROCESS_FOUND response
+        user_inputs = extract_process_numbers(user_inputs) or [user_inputs]
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def consult_one(user_input: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await aconsult_process(user_input)
+    
+    return list(await asyncio.gather(*(consult_one(user_input) for user_input in user_inputs)))
+
+
+def consult_processes(user_inputs: Union[str, Sequence[str]], concurrency: int = 20) -> List[Dict[str, Any]]:
+    """
+    Synchronous interface for consulting several processes concurrently.
+    
+    Runs aconsult_processes on a fresh event loop; when called from a thread that is
+    already running a loop, that loop is left alone and a worker thread is used instead.
+    
+    Args:
+        user_inputs: User messages, each containing a process number, or a single
+            message whose process numbers are all consulted
+        concurrency: Maximum number of consultations in flight at once
+        
+    Returns:
+        One response dict per input (per process number for a single message), in the
+        same order (failures are error responses)
+    """
+    async def run_batch() -> List[Dict[str, Any]]:
+        try:
+            return await aconsult_processes(user_inputs, concurrency)
+        finally:
+            # The loop ends with asyncio.run; its HTTP client would keep it alive otherwise
+            await aclose_shared_async_client()
+    
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(run_batch())
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, run_batch()).result()
+
+
+async def aconsult_process_stream(user_input: str) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Streaming interface for process consultation.
+    
+    Yields progress events while the search runs, one event per process found
+    and a final "done" (or "error") event; see ProcessConsultationTool.aconsult_process_stream.
+    
+    Args:
+        user_input: User message containing process number
+        
+    Yields:
+        Consultation events
+    """
     tool = ProcessConsultationTool()
     try:
-        return tool.consult_process(user_input)
+        async for event in tool.aconsult_process_stream(user_input):
+            yield event
     finally:
-        tool.close()
+        await tool.aclose()
 
 
-# Agno tool version
-@tool(
-    name="consult_legal_process",
-    description="Consulta informações de processo judicial usando número de processo CNJ. Extract process numbers from user input and return detailed legal process information including parties, movements, documents, and case status.",
-    instructions="Use this tool when the user provides or mentions a legal process number in CNJ format (e.g., 0000000-00.2020.1.00.0000). The tool will automatically extract the process number from the user's message and return comprehensive process information.",
-    show_result=False
-)
-def consult_legal_process_tool(user_input: str) -> Dict[str, Any]:
+# Agno tool versions. The plain functions need no agno; the decorated tools
+# (consult_legal_process_tool, consult_legal_processes_tool and their async
+# a* variants) are built on first attribute access, so the CLI and programmatic
+# API never import agno.
+def consult_legal_process_tool_impl(user_input: str) -> Dict[str, Any]:
     """
     Agno tool for consulting legal process information.
     
@@ -370,5 +845,88 @@ def consult_legal_process_tool(user_input: str) -> Dict[str, Any]:
     return consult_process(user_input)
 
 
+def consult_legal_processes_tool_impl(user_inputs: List[str]) -> List[Dict[str, Any]]:
+    """
+    Agno tool for consulting several legal processes concurrently.
+    
+    Args:
+        user_inputs: User messages or process numbers, one per process
+        
+    Returns:
+        One dict with process information or error details per input
+    """
+    return consult_processes(user_inputs)
+
+
+async def aconsult_legal_process_tool_impl(user_input: str) -> Dict[str, Any]:
+    """
+    Async Agno tool for consulting legal process information.
+    
+    For agents run with arun(): polling waits on the agent's event loop instead
+    of holding a worker thread for the whole search.
+    
+    Args:
+        user_input: User message containing process number
+        
+    Returns:
+        Dict containing process information or error details
+    """
+    return await aconsult_process(user_input)
+
+
+async def aconsult_legal_processes_tool_impl(user_inputs: List[str]) -> List[Dict[str, Any]]:
+    """
+    Async Agno tool for consulting several legal processes concurrently.
+    
+    Args:
+        user_inputs: User messages or process numbers, one per process
+        
+    Returns:
+        One dict with process information or error details per input
+    """
+    return await aconsult_processes(user_inputs)
+
+
+# @tool options shared by the sync and async variant of each tool
+_CONSULT_PROCESS_TOOL = dict(
+    name="consult_legal_process",
+    description="Consulta informações de processo judicial usando número de processo CNJ. Extract process numbers from user input and return detailed legal process information including parties, movements, documents, and case status.",
+    instructions="Use this tool when the user provides or mentions a legal process number in CNJ format (e.g., 0000000-13.2020.1.00.0000). The tool will automatically extract the process number from the user's message and return comprehensive process information.",
+    show_result=False
+)
+
+_CONSULT_PROCESSES_TOOL = dict(
+    name="consult_legal_processes",
+    description="Consulta vários processos judiciais de uma vez, em paralelo, usando números de processo CNJ. Takes a list of user messages or process numbers and returns one result per item, in the same order.",
+    instructions="Use this tool instead of calling consult_legal_process repeatedly when the user provides several legal process numbers in CNJ format (e.g., 0000000-13.2020.1.00.0000). Pass one item per process.",
+    show_result=False
+)
+
+# Exported tool name -> (agno @tool options, plain function)
+_AGNO_TOOLS = {
+    'consult_legal_process_tool': (_CONSULT_PROCESS_TOOL, consult_legal_process_tool_impl),
+    'consult_legal_processes_tool': (_CONSULT_PROCESSES_TOOL, consult_legal_processes_tool_impl),
+    'aconsult_legal_process_tool': (_CONSULT_PROCESS_TOOL, aconsult_legal_process_tool_impl),
+    'aconsult_legal_processes_tool': (_CONSULT_PROCESSES_TOOL, aconsult_legal_processes_tool_impl),
+}
+
+
+def __getattr__(name: str):
+    """
+    Build an Agno tool on first access (PEP 562).
+    
+    Raises:
+        ImportError: If agno is not installed
+    """
+    spec = _AGNO_TOOLS.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    from agno.tools import tool
+    options, function = spec
+    agno_tool = globals()[name] = tool(**options)(function)
+    return agno_tool
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,6 +1,6 @@
 """
 Utilities package for Justice Agent tools.
-Provides shared functionality for process and document validation, polling, and configuration.
+Provides shared functionality for process and document validation, polling, result caching, timing, serialization, and configuration.
 """
 
 from .process_validator import (
@@ -29,9 +29,29 @@ from .polling_manager import (
     PollingConfig,
     PollingTimeoutError,
     poll_search_completion,
+    submit_poll,
+    apoll_search_completion,
+    apoll_jobs_completion,
     create_progress_logger
 )
 
+from .result_cache import (
+    ResultCache,
+    get_result_cache
+)
+
+from .timing import (
+    timed,
+    format_timings
+)
+
+from .serialization import (
+    dumps,
+    dumps_bytes,
+    loads,
+    LazyJSON
+)
+
 __all__ = [
     # Process validation
     'extract_process_numbers',
@@ -57,5 +77,22 @@ __all__ = [
     'PollingConfig',
     'PollingTimeoutError', 
     'poll_search_completion',
-    'create_progress_logger'
+    'submit_poll',
+    'apoll_search_completion',
+    'apoll_jobs_completion',
+    'create_progress_logger',
+    
+    # Result caching
+    'ResultCache',
+    'get_result_cache',
+    
+    # Phase timing
+    'timed',
+    'format_timings',
+    
+    # JSON serialization
+    'dumps',
+    'dumps_bytes',
+    'loads',
+    'LazyJSON'
 ]
\ No newline at end of file
@@ -10,6 +10,52 @@ from typing import Optional, List, Union
 logger = logging.getLogger(__name__)
 
 
+class _KeepDigitsTable(dict):
+    """
+    str.translate table that keeps decimal digits and deletes every other character.
+    
+    Same result as re.sub(r'[^\\d]', '', s) (\\d also matches non-ASCII decimal digits),
+    but each character is a C-level dict lookup; entries are filled on first sight.
+    """
+    
+    def __missing__(self, code: int) -> Optional[int]:
+        value = code if chr(code).isdecimal() else None
+        self[code] = value
+        return value
+
+
+_NON_DIGIT_TABLE = _KeepDigitsTable()
+
+
+class _AsciiDigitsTable(dict):
+    """str.translate table mapping any decimal digit to its ASCII counterpart ('٣' -> '3')."""
+    
+    def __missing__(self, code: int) -> int:
+        value = 48 + int(chr(code))
+        self[code] = value
+        return value
+
+
+_ASCII_DIGIT_TABLE = _AsciiDigitsTable()
+
+
+def _ascii_digit_bytes(clean: str) -> bytes:
+    """
+    Digits-only string as ASCII bytes, so each digit is simply byte - 48.
+    
+    ASCII input (the normal case) is detected from the string's cached ASCII flag and
+    encoded directly; other decimal digits are mapped to 0-9 first.
+    """
+    if not clean.isascii():
+        clean = clean.translate(_ASCII_DIGIT_TABLE)
+    return clean.encode('ascii')
+
+
+# Checksum-valid but rejected numbers: the same digit repeated (b"00000000000", ...)
+_CPF_ALL_SAME = frozenset(bytes([digit]) * 11 for digit in b"0123456789")
+_CNPJ_ALL_SAME = frozenset(bytes([digit]) * 14 for digit in b"0123456789")
+
+
 class DocumentValidationError(Exception):
     """Raised when document validation fails."""
     pass
@@ -22,14 +68,24 @@ class DocumentValidator:
     
     # CPF patterns (11 digits)
     CPF_PATTERN = re.compile(r'(\d{3})\.?(\d{3})\.?(\d{3})-?(\d{2})')
-    CPF_NUMBERS_ONLY = re.compile(r'(\d{11})')
     
     # CNPJ patterns (14 digits) 
     CNPJ_PATTERN = re.compile(r'(\d{2})\.?(\d{3})\.?(\d{3})/?(\d{4})-?(\d{2})')
-    CNPJ_NUMBERS_ONLY = re.compile(r'(\d{14})')
     
-    # Combined pattern for any document
-    DOCUMENT_PATTERN = re.compile(r'\b\d{11,14}\b|\b\d{3}\.?\d{3}\.?\d{3}-?\d{2}\b|\b\d{2}\.?\d{3}\.?\d{3}/?0001-?\d{2}\b')
+    # Any digit (cheap pre-check before scanning for documents)
+    HAS_DIGIT_PATTERN = re.compile(r'\d')
+    
+    # Formatting characters
+    NON_DIGIT_PATTERN = re.compile(r'[^\d]')  # kept for callers; the validator uses _NON_DIGIT_TABLE
+    
+    # Single pattern used for all extraction: CNPJ or CPF, formatted or digits only,
+    # not embedded in a longer run of digits; m.lastgroup tells which one matched
+    DOCUMENT_SCAN_PATTERN = re.compile(
+        r'(?<!\d)(?:'
+        r'(?P<cnpj>\d{2}\.?\d{3}\.?\d{3}/?\d{4}-?\d{2})'
+        r'|(?P<cpf>\d{3}\.?\d{3}\.?\d{3}-?\d{2})'
+        r')(?!\d)'
+    )
     
     def __init__(self):
         """Initialize the document validator."""
@@ -39,81 +95,74 @@ class DocumentValidator:
         """
         Extract all potential CPF/CNPJ numbers from text.
         
+        Documents come back in the order they appear. A run of digits is matched as a
+        whole: an 11-digit window inside a longer number is not taken as a CPF.
+        
         Args:
             text: Text to search for documents
             
         Returns:
             List of potential documents found in the text
         """
-        documents = []
-        text = str(text).strip()
-        
-        # Look for CPF patterns
-        cpf_matches = self.CPF_PATTERN.findall(text)
-        for match in cpf_matches:
-            if len(match) == 4:  # (xxx, xxx, xxx, xx)
-                cpf = ''.join(match)
-                if self._is_valid_cpf_length(cpf):
-                    formatted = self._format_cpf(cpf)
-                    if formatted and self.validate_cpf(formatted):
-                        documents.append(formatted)
-        
-        # Look for CNPJ patterns
-        cnpj_matches = self.CNPJ_PATTERN.findall(text)
-        for match in cnpj_matches:
-            if len(match) == 5:  # (xx, xxx, xxx, xxxx, xx)
-                cnpj = ''.join(match)
-                if self._is_valid_cnpj_length(cnpj):
-                    formatted = self._format_cnpj(cnpj)
-                    if formatted and self.validate_cnpj(formatted):
-                        documents.append(formatted)
-        
-        # Look for numbers-only patterns
-        numbers = re.findall(r'\b\d{11,14}\b', text)
-        for number in numbers:
-            if len(number) == 11 and self.validate_cpf(number):
-                formatted = self._format_cpf(number)
-                if formatted not in documents:
-                    documents.append(formatted)
-            elif len(number) == 14 and self.validate_cnpj(number):
-                formatted = self._format_cnpj(number)
-                if formatted not in documents:
-                    documents.append(formatted)
-        
-        # Remove duplicates while preserving order
         unique_docs = []
+        # Digits-only form of every candidate already checked (valid or not)
         seen = set()
-        for doc in documents:
-            clean_doc = re.sub(r'[^\d]', '', doc)  # Remove formatting for comparison
-            if clean_doc not in seen:
-                unique_docs.append(doc)
-                seen.add(clean_doc)
+        # No strip(): surrounding whitespace cannot change what the scan finds
+        if not isinstance(text, str):
+            text = str(text)
+        
+        # Most chat messages carry no digits at all: skip the document scan
+        if not self.HAS_DIGIT_PATTERN.search(text):
+            return unique_docs
+        
+        # One scan for both document types, in text order
+        for match in self.DOCUMENT_SCAN_PATTERN.finditer(text):
+            clean = match.group().translate(_NON_DIGIT_TABLE)
+            
+            # Repeats are skipped before validation: each distinct number is checked once
+            if clean in seen:
+                continue
+            seen.add(clean)
+            
+            if match.lastgroup == 'cpf':
+                if self._validate_cpf_clean(clean):
+                    unique_docs.append(self._format_cpf_digits(clean))
+            elif self._validate_cnpj_clean(clean):
+                unique_docs.append(self._format_cnpj_digits(clean))
         
         logger.info(f"Extracted {len(unique_docs)} documents from text")
         return unique_docs
     
     def _is_valid_cpf_length(self, cpf: str) -> bool:
         """Check if CPF has correct length."""
-        clean_cpf = re.sub(r'[^\d]', '', cpf)
+        clean_cpf = cpf.translate(_NON_DIGIT_TABLE)
         return len(clean_cpf) == 11
     
     def _is_valid_cnpj_length(self, cnpj: str) -> bool:
         """Check if CNPJ has correct length."""
-        clean_cnpj = re.sub(r'[^\d]', '', cnpj)
+        clean_cnpj = cnpj.translate(_NON_DIGIT_TABLE)
         return len(clean_cnpj) == 14
     
     def _format_cpf(self, cpf: str) -> Optional[str]:
         """Format CPF to standard format: XXX.XXX.XXX-XX"""
-        clean_cpf = re.sub(r'[^\d]', '', cpf)
+        clean_cpf = cpf.translate(_NON_DIGIT_TABLE)
         if len(clean_cpf) != 11:
             return None
+        return self._format_cpf_digits(clean_cpf)
+    
+    def _format_cpf_digits(self, clean_cpf: str) -> str:
+        """Format the 11 digits of a CPF as XXX.XXX.XXX-XX"""
         return f"{clean_cpf[:3]}.{clean_cpf[3:6]}.{clean_cpf[6:9]}-{clean_cpf[9:11]}"
     
     def _format_cnpj(self, cnpj: str) -> Optional[str]:
         """Format CNPJ to standard format: XX.XXX.XXX/XXXX-XX"""
-        clean_cnpj = re.sub(r'[^\d]', '', cnpj)
+        clean_cnpj = cnpj.translate(_NON_DIGIT_TABLE)
         if len(clean_cnpj) != 14:
             return None
+        return self._format_cnpj_digits(clean_cnpj)
+    
+    def _format_cnpj_digits(self, clean_cnpj: str) -> str:
+        """Format the 14 digits of a CNPJ as XX.XXX.XXX/XXXX-XX"""
         return f"{clean_cnpj[:2]}.{clean_cnpj[2:5]}.{clean_cnpj[5:8]}/{clean_cnpj[8:12]}-{clean_cnpj[12:14]}"
     
     def validate_cpf(self, cpf: str) -> bool:
@@ -126,31 +175,33 @@ class DocumentValidator:
         Returns:
             True if valid, False otherwise
         """
-        try:
-            # Remove formatting
-            clean_cpf = re.sub(r'[^\d]', '', cpf)
-            
-            # Check length
-            if len(clean_cpf) != 11:
-                return False
-            
-            # Check for invalid patterns (all same digits)
-            if clean_cpf == clean_cpf[0] * 11:
-                return False
-            
-            # Calculate first verification digit
-            sum1 = sum(int(clean_cpf[i]) * (10 - i) for i in range(9))
-            digit1 = ((sum1 * 10) % 11) % 10
-            
-            # Calculate second verification digit
-            sum2 = sum(int(clean_cpf[i]) * (11 - i) for i in range(10))
-            digit2 = ((sum2 * 10) % 11) % 10
-            
-            # Check if calculated digits match
-            return digit1 == int(clean_cpf[9]) and digit2 == int(clean_cpf[10])
-            
-        except (ValueError, IndexError):
+        return self._validate_cpf_clean(cpf.translate(_NON_DIGIT_TABLE))
+    
+    def _validate_cpf_clean(self, clean_cpf: str) -> bool:
+        """validate_cpf for a CPF already reduced to its digits."""
+        # Check length
+        if len(clean_cpf) != 11:
+            return False
+        
+        # Checksums run on ASCII bytes: each digit is byte - 48, no int() per character
+        b = _ascii_digit_bytes(clean_cpf)
+        
+        # Check for invalid patterns (all same digits)
+        if b in _CPF_ALL_SAME:
             return False
+        
+        # Calculate first verification digit
+        sum1 = ((b[0] - 48) * 10 + (b[1] - 48) * 9 + (b[2] - 48) * 8 + (b[3] - 48) * 7 + (b[4] - 48) * 6 +
+                (b[5] - 48) * 5 + (b[6] - 48) * 4 + (b[7] - 48) * 3 + (b[8] - 48) * 2)
+        digit1 = ((sum1 * 10) % 11) % 10
+        
+        # Calculate second verification digit
+        sum2 = ((b[0] - 48) * 11 + (b[1] - 48) * 10 + (b[2] - 48) * 9 + (b[3] - 48) * 8 + (b[4] - 48) * 7 +
+                (b[5] - 48) * 6 + (b[6] - 48) * 5 + (b[7] - 48) * 4 + (b[8] - 48) * 3 + (b[9] - 48) * 2)
+        digit2 = ((sum2 * 10) % 11) % 10
+        
+        # Check if calculated digits match
+        return digit1 == b[9] - 48 and digit2 == b[10] - 48
     
     def validate_cnpj(self, cnpj: str) -> bool:
         """
@@ -162,33 +213,35 @@ class DocumentValidator:
         Returns:
             True if valid, False otherwise
         """
-        try:
-            # Remove formatting
-            clean_cnpj = re.sub(r'[^\d]', '', cnpj)
-            
-            # Check length
-            if len(clean_cnpj) != 14:
-                return False
-            
-            # Check for invalid patterns (all same digits)
-            if clean_cnpj == clean_cnpj[0] * 14:
-                return False
-            
-            # Calculate first verification digit
-            weights1 = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-            sum1 = sum(int(clean_cnpj[i]) * weights1[i] for i in range(12))
-            digit1 = 11 - (sum1 % 11) if sum1 % 11 >= 2 else 0
-            
-            # Calculate second verification digit
-            weights2 = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-            sum2 = sum(int(clean_cnpj[i]) * weights2[i] for i in range(13))
-            digit2 = 11 - (sum2 % 11) if sum2 % 11 >= 2 else 0
-            
-            # Check if calculated digits match
-            return digit1 == int(clean_cnpj[12]) and digit2 == int(clean_cnpj[13])
-            
-        except (ValueError, IndexError):
+        return self._validate_cnpj_clean(cnpj.translate(_NON_DIGIT_TABLE))
+    
+    def _validate_cnpj_clean(self, clean_cnpj: str) -> bool:
+        """validate_cnpj for a CNPJ already reduced to its digits."""
+        # Check length
+        if len(clean_cnpj) != 14:
+            return False
+        
+        b = _ascii_digit_bytes(clean_cnpj)
+        
+        # Check for invalid patterns (all same digits)
+        if b in _CNPJ_ALL_SAME:
             return False
+        
+        # Calculate first verification digit (weights 5,4,3,2,9,8,7,6,5,4,3,2)
+        sum1 = ((b[0] - 48) * 5 + (b[1] - 48) * 4 + (b[2] - 48) * 3 + (b[3] - 48) * 2 +
+                (b[4] - 48) * 9 + (b[5] - 48) * 8 + (b[6] - 48) * 7 + (b[7] - 48) * 6 +
+                (b[8] - 48) * 5 + (b[9] - 48) * 4 + (b[10] - 48) * 3 + (b[11] - 48) * 2)
+        digit1 = 11 - (sum1 % 11) if sum1 % 11 >= 2 else 0
+        
+        # Calculate second verification digit (weights 6,5,4,3,2,9,8,7,6,5,4,3,2)
+        sum2 = ((b[0] - 48) * 6 + (b[1] - 48) * 5 + (b[2] - 48) * 4 + (b[3] - 48) * 3 +
+                (b[4] - 48) * 2 + (b[5] - 48) * 9 + (b[6] - 48) * 8 + (b[7] - 48) * 7 +
+                (b[8] - 48) * 6 + (b[9] - 48) * 5 + (b[10] - 48) * 4 + (b[11] - 48) * 3 +
+                (b[12] - 48) * 2)
+        digit2 = 11 - (sum2 % 11) if sum2 % 11 >= 2 else 0
+        
+        # Check if calculated digits match
+        return digit1 == b[12] - 48 and digit2 == b[13] - 48
     
     def identify_document_type(self, document: str) -> Optional[str]:
         """
@@ -200,12 +253,14 @@ class DocumentValidator:
         Returns:
             'CPF', 'CNPJ', or None if invalid
         """
-        clean_doc = re.sub(r'[^\d]', '', document)
-        
+        return self._identify_clean(document.translate(_NON_DIGIT_TABLE))
+    
+    def _identify_clean(self, clean_doc: str) -> Optional[str]:
+        """identify_document_type for a document already reduced to its digits."""
         if len(clean_doc) == 11:
-            return 'CPF' if self.validate_cpf(document) else None
+            return 'CPF' if self._validate_cpf_clean(clean_doc) else None
         elif len(clean_doc) == 14:
-            return 'CNPJ' if self.validate_cnpj(document) else None
+            return 'CNPJ' if self._validate_cnpj_clean(clean_doc) else None
         else:
             return None
     
@@ -222,18 +277,14 @@ class DocumentValidator:
         Raises:
             DocumentValidationError: If document is invalid
         """
-        doc_type = self.identify_document_type(document)
+        # Clean once; type check and formatting both work on the digits
+        clean_doc = document.translate(_NON_DIGIT_TABLE)
+        doc_type = self._identify_clean(clean_doc)
         
         if doc_type == 'CPF':
-            formatted = self._format_cpf(document)
-            if not formatted:
-                raise DocumentValidationError(f"Invalid CPF format: {document}")
-            return formatted
+            return self._format_cpf_digits(clean_doc)
         elif doc_type == 'CNPJ':
-            formatted = self._format_cnpj(document)
-            if not formatted:
-                raise DocumentValidationError(f"Invalid CNPJ format: {document}")
-            return formatted
+            return self._format_cnpj_digits(clean_doc)
         else:
             raise DocumentValidationError(f"Invalid document: {document}")
     
@@ -247,6 +298,19 @@ class DocumentValidator:
         Returns:
             First valid document or None if none found
         """
+        # Fast path: input is exactly one CPF or CNPJ (formatted or digits only)
+        candidate = text if isinstance(text, str) else str(text)
+        if candidate and (candidate[0].isspace() or candidate[-1].isspace()):
+            candidate = candidate.strip()
+        match = self.DOCUMENT_SCAN_PATTERN.fullmatch(candidate)
+        if match:
+            clean = candidate.translate(_NON_DIGIT_TABLE)
+            if match.lastgroup == 'cpf':
+                if self._validate_cpf_clean(clean):
+                    return self._format_cpf_digits(clean)
+            elif self._validate_cnpj_clean(clean):
+                return self._format_cnpj_digits(clean)
+        
         extracted = self.extract_documents(text)
         return extracted[0] if extracted else None
     
@@ -260,7 +324,7 @@ class DocumentValidator:
         Returns:
             Document with only numbers
         """
-        return re.sub(r'[^\d]', '', document)
+        return document.translate(_NON_DIGIT_TABLE)
 
 
 # Module-level convenience functions
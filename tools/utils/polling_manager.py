@@ -1,11 +1,27 @@
 """
 Polling manager for Web Justice API operations.
 Handles smart polling with exponential backoff for search status monitoring.
+
+The first few waits (fast_poll_threshold) stay around initial_interval so short
+jobs are noticed quickly. After that, each wait is drawn uniformly between
+initial_interval and the current backoff ceiling (decorrelated jitter), and the
+ceiling drops back to initial_interval whenever the job reports more progress, so
+active jobs keep polling fast while stalled ones back off towards max_interval.
+When the status carries an `estimated_completion` hint from the server, the next
+wait follows the hint instead.
+
+Jobs whose status reports `supports_long_poll` are not polled on a timer at all:
+the next request is a watch that the server holds until the status changes.
 """
 
 import time
+import random
+import asyncio
 import logging
-from typing import Dict, Any, Optional, Callable
+import threading
+import concurrent.futures
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, Callable, Awaitable, Iterable
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -15,12 +31,53 @@ logger = logging.getLogger(__name__)
 class PollingConfig:
     """Configuration for polling behavior."""
     initial_interval: float = 1.0      # Start with 1 second
-    max_interval: float = 5.0         # Maximum 30 seconds between polls
+    max_interval: float = 20.0         # Maximum 20 seconds between polls
     backoff_multiplier: float = 1.5    # Exponential backoff factor
+    jitter: bool = True                # Randomize each wait in [initial_interval, ceiling]
+    fast_poll_threshold: int = 5       # First waits stay around initial_interval, no backoff
     max_wait_time: float = 900.0       # Maximum total wait time (15 minutes)
     timeout_buffer: float = 30.0       # Buffer before timeout to allow graceful completion
 
 
+def _seconds_until(estimated_completion: Any) -> Optional[float]:
+    """
+    Seconds until a server-estimated completion.
+    
+    Args:
+        estimated_completion: Seconds remaining (number) or ISO-8601 completion time;
+            naive timestamps are taken as UTC
+        
+    Returns:
+        Non-negative seconds, or None if the hint is missing or unreadable
+    """
+    if isinstance(estimated_completion, bool) or estimated_completion is None:
+        return None
+    if isinstance(estimated_completion, (int, float)):
+        return max(0.0, float(estimated_completion))
+    if isinstance(estimated_completion, str):
+        try:
+            eta = datetime.fromisoformat(estimated_completion.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+        if eta.tzinfo is None:
+            eta = eta.replace(tzinfo=timezone.utc)
+        return max(0.0, (eta - datetime.now(timezone.utc)).total_seconds())
+    return None
+
+
+# Longest a watch (long-poll) status request asks the server to hold the response.
+# Only used for jobs whose status reports supports_long_poll; capped by the time left.
+LONG_POLL_TIMEOUT = 60.0
+
+# Below this many seconds before the deadline, polling stops watching and goes back to
+# timed polls (whose waits are clamped to the deadline)
+MIN_WATCH_TIMEOUT = 1.0
+
+# Per-poll status lines are logged at INFO once every this many polls (DEBUG otherwise),
+# so thousands of concurrent jobs don't flood the log
+POLL_LOG_EVERY = 5
+
+
 class PollingTimeoutError(Exception):
     """Raised when polling times out."""
     pass
@@ -39,13 +96,40 @@ class PollingManager:
             config: Polling configuration (uses defaults if not provided)
         """
         self.config = config or PollingConfig()
+        # Own generator per manager: concurrent pollers don't share the module-level
+        # random state, and each is seeded independently from os.urandom
+        self._random = random.Random()
         self.reset()
     
     def reset(self):
         """Reset polling state for a new operation."""
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+        # Monotonic time at which polling gives up, leaving timeout_buffer for the caller
+        self.deadline = self.start_time + self.config.max_wait_time - self.config.timeout_buffer
         self.current_interval = self.config.initial_interval
         self.poll_count = 0
+        self.last_progress: Dict[Any, float] = {}
+        self.hinted_delay: Optional[float] = None
+    
+    def remaining_time(self) -> float:
+        """
+        Seconds left before the polling deadline (max_wait_time minus timeout_buffer).
+        
+        Returns:
+            Remaining seconds, negative once the deadline has passed
+        """
+        return self.deadline - time.monotonic()
+    
+    def watch_timeout(self) -> Optional[float]:
+        """
+        How long the next long-poll may be held by the server.
+        
+        Returns:
+            LONG_POLL_TIMEOUT capped by the time left before the deadline, or None when
+            less than MIN_WATCH_TIMEOUT remains
+        """
+        timeout = min(LONG_POLL_TIMEOUT, self.remaining_time())
+        return timeout if timeout >= MIN_WATCH_TIMEOUT else None
     
     def should_continue_polling(self) -> bool:
         """
@@ -54,22 +138,97 @@ class PollingManager:
         Returns:
             True if polling should continue, False if timeout reached
         """
-        elapsed = time.time() - self.start_time
-        return elapsed < (self.config.max_wait_time - self.config.timeout_buffer)
+        return time.monotonic() < self.deadline
     
-    def wait_for_next_poll(self):
+    def note_progress(self, status: Dict[str, Any], key: Any = None):
         """
-        Wait for the appropriate interval before next poll and update interval.
+        Restart the backoff when a job reports more progress than on its previous poll,
+        and record the server's estimated_completion hint for the next wait.
+        
+        Args:
+            status: Status returned by the last poll
+            key: Job identifier when one manager polls several jobs
         """
-        logger.debug(f"Waiting {self.current_interval:.1f}s before next poll (attempt {self.poll_count + 1})")
-        time.sleep(self.current_interval)
+        hint = _seconds_until(status.get('estimated_completion'))
+        if hint is not None:
+            # Several jobs: wake up for the one expected to finish first
+            self.hinted_delay = hint if self.hinted_delay is None else min(self.hinted_delay, hint)
         
-        # Update interval for next poll with exponential backoff
-        self.current_interval = min(
-            self.current_interval * self.config.backoff_multiplier,
-            self.config.max_interval
-        )
+        progress = status.get('progress_percentage')
+        if not isinstance(progress, (int, float)):
+            return
+        previous = self.last_progress.get(key)
+        if previous is not None and progress > previous:
+            self.current_interval = self.config.initial_interval
+        self.last_progress[key] = progress
+    
+    def next_delay(self) -> float:
+        """
+        Pick the wait before the next poll and advance the backoff ceiling.
+        
+        The first fast_poll_threshold waits stay around initial_interval (0.5x-1.5x with
+        jitter) so quick jobs are noticed right away; the backoff only starts after them.
+        
+        Returns:
+            Seconds to wait: the server hint when one was seen since the last wait,
+            else uniform in [initial_interval, ceiling] with jitter, the ceiling itself without
+        """
+        ceiling = self.current_interval
+        initial = self.config.initial_interval
+        fast = self.poll_count < self.config.fast_poll_threshold
+        if self.hinted_delay is not None:
+            # Server hint, bounded by the configured interval range
+            delay = min(max(self.hinted_delay, initial), self.config.max_interval)
+            self.hinted_delay = None
+        elif fast:
+            delay = self._random.uniform(0.5 * initial, 1.5 * initial) if self.config.jitter else initial
+        elif self.config.jitter:
+            delay = self._random.uniform(initial, ceiling)
+        else:
+            delay = ceiling
+        
+        # Update ceiling for next poll with exponential backoff (after the fast phase)
+        if not fast:
+            self.current_interval = min(
+                ceiling * self.config.backoff_multiplier,
+                self.config.max_interval
+            )
         self.poll_count += 1
+        return delay
+    
+    def _clamp_to_deadline(self, delay: float) -> float:
+        """Cut a wait short so it never sleeps past the polling deadline."""
+        return max(0.0, min(delay, self.remaining_time()))
+    
+    def wait_for_next_poll(self):
+        """
+        Wait for the appropriate interval before next poll and update interval.
+        
+        The wait ends at the polling deadline at the latest, so a job that times out
+        is reported right away instead of after one more full interval.
+        """
+        delay = self._clamp_to_deadline(self.next_delay())
+        logger.debug("Waiting %.1fs before next poll (attempt %d)", delay, self.poll_count)
+        time.sleep(delay)
+    
+    async def await_next_poll(self):
+        """
+        Async counterpart of wait_for_next_poll; yields to the event loop while waiting.
+        """
+        delay = self._clamp_to_deadline(self.next_delay())
+        logger.debug("Waiting %.1fs before next poll (attempt %d)", delay, self.poll_count)
+        await asyncio.sleep(delay)
+    
+    def _log_poll(self, status: Dict[str, Any]):
+        """Log a poll result: every POLL_LOG_EVERY-th poll at INFO, the others at DEBUG."""
+        level = logging.INFO if self.poll_count % POLL_LOG_EVERY == 0 else logging.DEBUG
+        if logger.isEnabledFor(level):
+            logger.log(
+                level, "Poll #%d: %s - %s%% (%s)", self.poll_count + 1,
+                status.get('current_status', 'Unknown'),
+                status.get('progress_percentage', 0),
+                status.get('current_phase', 'Unknown')
+            )
     
     def get_polling_stats(self) -> Dict[str, Any]:
         """
@@ -78,7 +237,7 @@ class PollingManager:
         Returns:
             Dict with polling statistics
         """
-        elapsed = time.time() - self.start_time
+        elapsed = time.monotonic() - self.start_time
         return {
             "elapsed_time": elapsed,
             "poll_count": self.poll_count,
@@ -86,11 +245,18 @@ class PollingManager:
             "time_remaining": max(0, self.config.max_wait_time - elapsed)
         }
     
+    def _next_watch_timeout(self, watch_checker: Optional[Callable], status: Dict[str, Any]) -> Optional[float]:
+        """Long-poll timeout for the next request, or None to wait and poll normally."""
+        if watch_checker is None or not status.get('supports_long_poll'):
+            return None
+        return self.watch_timeout()
+    
     def poll_until_complete(
         self, 
         status_checker: Callable[[], Dict[str, Any]], 
         completion_checker: Callable[[Dict[str, Any]], bool],
-        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        watch_checker: Optional[Callable[[float], Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """
         Poll for completion using provided checker functions.
@@ -99,6 +265,9 @@ class PollingManager:
             status_checker: Function that returns current status
             completion_checker: Function that checks if status indicates completion
             progress_callback: Optional callback for progress updates
+            watch_checker: Optional long-poll status function taking the seconds the
+                server may hold the request, used instead of waiting while the last status
+                reports supports_long_poll
             
         Returns:
             Final status when completion is detected
@@ -107,19 +276,22 @@ class PollingManager:
             PollingTimeoutError: If maximum wait time is exceeded
         """
         self.reset()
-        logger.info(f"Starting polling with max wait time: {self.config.max_wait_time}s")
+        logger.info("Starting polling with max wait time: %ss", self.config.max_wait_time)
+        watch_timeout = None
         
         while self.should_continue_polling():
             try:
-                # Get current status
-                status = status_checker()
+                # Get current status (a watch blocks server-side until it changes)
+                if watch_timeout is not None:
+                    self.poll_count += 1
+                    status = watch_checker(watch_timeout)
+                else:
+                    status = status_checker()
                 
                 # Log current status
-                current_status = status.get('current_status', 'Unknown')
-                progress = status.get('progress_percentage', 0)
-                phase = status.get('current_phase', 'Unknown')
+                self._log_poll(status)
                 
-                logger.info(f"Poll #{self.poll_count + 1}: {current_status} - {progress}% ({phase})")
+                self.note_progress(status)
                 
                 # Call progress callback if provided
                 if progress_callback:
@@ -128,15 +300,18 @@ class PollingManager:
                 # Check if complete
                 if completion_checker(status):
                     stats = self.get_polling_stats()
-                    logger.info(f"Polling completed after {stats['elapsed_time']:.1f}s and {stats['poll_count']} attempts")
+                    logger.info("Polling completed after %.1fs and %d attempts", stats['elapsed_time'], stats['poll_count'])
                     return status
                 
-                # Wait before next poll
-                self.wait_for_next_poll()
+                # Wait before next poll, unless the server can hold the next request
+                watch_timeout = self._next_watch_timeout(watch_checker, status)
+                if watch_timeout is None:
+                    self.wait_for_next_poll()
                 
             except Exception as e:
-                logger.error(f"Error during polling attempt {self.poll_count + 1}: {str(e)}")
-                # Still wait before retrying to avoid hammering the API
+                logger.error("Error during polling attempt %d: %s", self.poll_count + 1, e)
+                # Back to timed polling; still wait before retrying to avoid hammering the API
+                watch_timeout = None
                 self.wait_for_next_poll()
         
         # Timeout reached
@@ -144,6 +319,69 @@ class PollingManager:
         error_msg = f"Polling timeout after {stats['elapsed_time']:.1f}s and {stats['poll_count']} attempts"
         logger.error(error_msg)
         raise PollingTimeoutError(error_msg)
+    
+    async def apoll_until_complete(
+        self, 
+        status_checker: Callable[[], Awaitable[Dict[str, Any]]], 
+        completion_checker: Callable[[Dict[str, Any]], bool],
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        watch_checker: Optional[Callable[[float], Awaitable[Dict[str, Any]]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Async version of poll_until_complete. Many jobs can be polled on a single
+        event loop since waiting between polls does not block a thread.
+        
+        Args:
+            status_checker: Coroutine function that returns current status
+            completion_checker: Function that checks if status indicates completion
+            progress_callback: Optional callback for progress updates
+            watch_checker: Optional long-poll coroutine function taking the seconds the
+                server may hold the request, used instead of waiting while the last status
+                reports supports_long_poll
+            
+        Returns:
+            Final status when completion is detected
+            
+        Raises:
+            PollingTimeoutError: If maximum wait time is exceeded
+        """
+        self.reset()
+        logger.info("Starting async polling with max wait time: %ss", self.config.max_wait_time)
+        watch_timeout = None
+        
+        while self.should_continue_polling():
+            try:
+                if watch_timeout is not None:
+                    self.poll_count += 1
+                    status = await watch_checker(watch_timeout)
+                else:
+                    status = await status_checker()
+                
+                self._log_poll(status)
+                
+                self.note_progress(status)
+                
+                if progress_callback:
+                    progress_callback(status)
+                
+                if completion_checker(status):
+                    stats = self.get_polling_stats()
+                    logger.info("Polling completed after %.1fs and %d attempts", stats['elapsed_time'], stats['poll_count'])
+                    return status
+                
+                watch_timeout = self._next_watch_timeout(watch_checker, status)
+                if watch_timeout is None:
+                    await self.await_next_poll()
+                
+            except Exception as e:
+                logger.error("Error during polling attempt %d: %s", self.poll_count + 1, e)
+                watch_timeout = None
+                await self.await_next_poll()
+        
+        stats = self.get_polling_stats()
+        error_msg = f"Polling timeout after {stats['elapsed_time']:.1f}s and {stats['poll_count']} attempts"
+        logger.error(error_msg)
+        raise PollingTimeoutError(error_msg)
 
 
 def poll_search_completion(client, job_id: str, progress_callback: Optional[Callable] = None) -> Dict[str, Any]:
@@ -166,31 +404,216 @@ def poll_search_completion(client, job_id: str, progress_callback: Optional[Call
     def status_checker():
         return client.get_search_status(job_id)
     
+    def watch_checker(timeout):
+        return client.watch_search_status(job_id, timeout=timeout)
+    
     def completion_checker(status):
         return status.get('is_ready_for_consultation', False)
     
-    return polling_manager.poll_until_complete(
-        status_checker=status_checker,
-        completion_checker=completion_checker,
-        progress_callback=progress_callback
+    try:
+        return polling_manager.poll_until_complete(
+            status_checker=status_checker,
+            completion_checker=completion_checker,
+            progress_callback=progress_callback,
+            watch_checker=watch_checker
+        )
+    finally:
+        client.forget_job_status(job_id)
+
+
+# Worker threads of the shared pool behind submit_poll (each blocks on one job's polling)
+POLL_EXECUTOR_WORKERS = 32
+
+# AIDEV-NOTE: process-wide pool for submit_poll; created on first use, never shut down here
+_poll_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_poll_executor_lock = threading.Lock()
+
+
+def _get_poll_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Get the shared polling thread pool, creating it on first use."""
+    global _poll_executor
+    if _poll_executor is None:
+        with _poll_executor_lock:
+            if _poll_executor is None:
+                _poll_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=POLL_EXECUTOR_WORKERS, thread_name_prefix="justice-poll"
+                )
+    return _poll_executor
+
+
+def submit_poll(
+    client, 
+    job_id: str, 
+    progress_callback: Optional[Callable] = None,
+    executor: Optional[concurrent.futures.Executor] = None
+) -> "concurrent.futures.Future[Dict[str, Any]]":
+    """
+    Run poll_search_completion for a job on a thread pool.
+    
+    Lets synchronous callers wait on several jobs at once (e.g. with
+    concurrent.futures.wait / as_completed) without managing threads; async callers
+    should use apoll_search_completion or apoll_jobs_completion instead.
+    
+    Args:
+        client: WebJusticeClient instance
+        job_id: Search job identifier
+        progress_callback: Optional callback for progress updates (called on the worker thread)
+        executor: Executor to run on (defaults to the shared POLL_EXECUTOR_WORKERS pool)
+        
+    Returns:
+        Future resolving to the final search status, or raising PollingTimeoutError
+    """
+    return (executor or _get_poll_executor()).submit(
+        poll_search_completion, client, job_id, progress_callback
     )
 
 
+async def apoll_search_completion(
+    client, 
+    job_id: str, 
+    progress_callback: Optional[Callable] = None,
+    config: Optional[PollingConfig] = None
+) -> Dict[str, Any]:
+    """
+    Async convenience function to poll for search completion.
+    
+    Args:
+        client: WebJusticeClient instance
+        job_id: Search job identifier
+        progress_callback: Optional callback for progress updates
+        config: Polling configuration (uses defaults if not provided)
+        
+    Returns:
+        Final search status when complete
+        
+    Raises:
+        PollingTimeoutError: If polling times out
+    """
+    polling_manager = PollingManager(config)
+    
+    async def status_checker():
+        return await client.aget_search_status(job_id)
+    
+    async def watch_checker(timeout):
+        return await client.awatch_search_status(job_id, timeout=timeout)
+    
+    def completion_checker(status):
+        return status.get('is_ready_for_consultation', False)
+    
+    try:
+        return await polling_manager.apoll_until_complete(
+            status_checker=status_checker,
+            completion_checker=completion_checker,
+            progress_callback=progress_callback,
+            watch_checker=watch_checker
+        )
+    finally:
+        client.forget_job_status(job_id)
+
+
+async def apoll_jobs_completion(
+    client, 
+    job_ids: Iterable[str], 
+    progress_callback: Optional[Callable] = None,
+    config: Optional[PollingConfig] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Async polling of several search jobs with a shared cadence.
+    
+    Each tick checks every pending job concurrently, then all remaining jobs wait
+    the same backoff interval; finished jobs drop out of the next tick.
+    
+    Args:
+        client: WebJusticeClient instance
+        job_ids: Search job identifiers
+        progress_callback: Optional callback for progress updates (called per job status)
+        config: Polling configuration (uses defaults if not provided)
+        
+    Returns:
+        Dict mapping each job_id to its final status
+        
+    Raises:
+        PollingTimeoutError: If any job is still pending when polling times out
+    """
+    polling_manager = PollingManager(config)
+    pending = list(dict.fromkeys(job_ids))
+    completed: Dict[str, Dict[str, Any]] = {}
+    logger.info("Starting batch polling of %d jobs with max wait time: %ss", len(pending), polling_manager.config.max_wait_time)
+    
+    job_list = list(pending)
+    try:
+        while pending and polling_manager.should_continue_polling():
+            statuses = await asyncio.gather(
+                *(client.aget_search_status(job_id) for job_id in pending),
+                return_exceptions=True
+            )
+            
+            still_pending = []
+            for job_id, status in zip(pending, statuses):
+                if isinstance(status, Exception):
+                    logger.error("Error polling job %s (attempt %d): %s", job_id, polling_manager.poll_count + 1, status)
+                    still_pending.append(job_id)
+                    continue
+                
+                polling_manager.note_progress(status, job_id)
+                
+                if progress_callback:
+                    progress_callback(status)
+                
+                if status.get('is_ready_for_consultation', False):
+                    completed[job_id] = status
+                else:
+                    still_pending.append(job_id)
+            
+            pending = still_pending
+            logger.info("Poll #%d: %d ready, %d pending", polling_manager.poll_count + 1, len(completed), len(pending))
+            
+            if pending:
+                await polling_manager.await_next_poll()
+        
+        stats = polling_manager.get_polling_stats()
+        if pending:
+            error_msg = f"Polling timeout after {stats['elapsed_time']:.1f}s with {len(pending)} jobs pending: {', '.join(pending)}"
+            logger.error(error_msg)
+            raise PollingTimeoutError(error_msg)
+        
+        logger.info("Batch polling completed after %.1fs and %d attempts", stats['elapsed_time'], stats['poll_count'])
+        return completed
+    finally:
+        # Statuses kept for conditional polls are no longer needed, whatever the outcome
+        for job_id in job_list:
+            client.forget_job_status(job_id)
+
+
 def create_progress_logger(job_description: str = "Search") -> Callable:
     """
     Create a progress callback that logs updates.
     
+    Like the per-poll lines of PollingManager, updates are logged at INFO once every
+    POLL_LOG_EVERY calls (and when the job is ready), at DEBUG otherwise.
+    
     Args:
         job_description: Description of the job being polled
         
     Returns:
         Progress callback function
     """
+    calls = 0
+    
     def progress_callback(status: Dict[str, Any]):
-        current_status = status.get('current_status', 'Unknown')
-        progress = status.get('progress_percentage', 0)
-        phase = status.get('current_phase', 'Unknown')
-        
-        logger.info(f"{job_description} progress: {current_status} - {progress}% ({phase})")
+        nonlocal calls
+        level = (
+            logging.INFO
+            if calls % POLL_LOG_EVERY == 0 or status.get('is_ready_for_consultation', False)
+            else logging.DEBUG
+        )
+        calls += 1
+        if logger.isEnabledFor(level):
+            logger.log(
+                level, "%s progress: %s - %s%% (%s)", job_description,
+                status.get('current_status', 'Unknown'),
+                status.get('progress_percentage', 0),
+                status.get('current_phase', 'Unknown')
+            )
     
     return progress_callback
\ No newline at end of file
@@ -5,7 +5,13 @@ Handles extraction, validation, and formatting of legal process numbers.
 
 import re
 import logging
-from typing import Optional, List, Tuple
+import functools
+from typing import Optional, List, Tuple, Iterator
+
+try:
+    import re2
+except ImportError:  # optional linear-time engine (google-re2) for scanning long texts
+    re2 = None
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +27,7 @@ class ProcessValidator:
     CNJ Format: NNNNNNN-DD.AAAA.J.TR.OOOO
     Where:
     - NNNNNNN: Sequential number (7 digits)
-    - DD: Verification digits (2 digits) 
+    - DD: Check digits (2 digits, ISO 7064 mod 97-10 over the other 18 digits)
     - AAAA: Year of registration (4 digits)
     - J: Judicial segment (1 digit)
     - TR: Court (2 digits)
@@ -30,23 +36,58 @@ class ProcessValidator:
     
     # CNJ format regex patterns
     CNJ_FULL_PATTERN = re.compile(r'(\d{7})-?(\d{2})\.?(\d{4})\.?(\d)\.?(\d{2})\.?(\d{4})')
+    CNJ_STRICT_PATTERN = re.compile(r'(\d{7})-(\d{2})\.(\d{4})\.(\d)\.(\d{2})\.(\d{4})')
     CNJ_LOOSE_PATTERN = re.compile(r'(\d{7,})[-.]?(\d{2})[-.]?(\d{4})[-.]?(\d)[-.]?(\d{2})[-.]?(\d{4})')
     
-    # Alternative patterns for various formats
-    ALTERNATIVE_PATTERNS = [
-        re.compile(r'(\d{7})\s*-?\s*(\d{2})\s*\.?\s*(\d{4})\s*\.?\s*(\d)\s*\.?\s*(\d{2})\s*\.?\s*(\d{4})'),
-        re.compile(r'(\d{20})'),  # 20 consecutive digits
-    ]
+    # 20 consecutive digits, split into the CNJ parts by the regex itself
+    CNJ_DIGITS_PATTERN = re.compile(r'(\d{7})(\d{2})(\d{4})(\d)(\d{2})(\d{4})')
+    
+    # Scan order for extract_process_numbers: each pattern only runs when the previous
+    # ones found nothing valid. The 20-digit pattern still matters as a last resort:
+    # its matches are aligned differently from the main pattern's in long digit runs.
+    EXTRACTION_PATTERNS = (CNJ_FULL_PATTERN, CNJ_LOOSE_PATTERN, CNJ_DIGITS_PATTERN)
+    
+    # Same patterns on RE2 (DFA, no backtracking) when google-re2 is installed. RE2's \d
+    # only matches ASCII digits, so it is used for ASCII texts only, where both engines
+    # find exactly the same matches.
+    EXTRACTION_PATTERNS_RE2 = (
+        tuple(re2.compile(p.pattern) for p in EXTRACTION_PATTERNS) if re2 is not None else None
+    )
     
     # Validation ranges
-    VALID_YEARS = range(1998, 2050)  # CNJ system started in 1998
-    VALID_SEGMENTS = [1, 2, 3, 4, 6, 8, 9]  # Valid judicial segments
+    MIN_YEAR, MAX_YEAR = 1998, 2049  # CNJ system started in 1998
+    VALID_SEGMENTS = frozenset({1, 2, 3, 4, 6, 8, 9})  # Valid judicial segments
     
-    def __init__(self):
-        """Initialize the process validator."""
-        pass
+    @classmethod
+    def _extraction_patterns(cls, text: str) -> tuple:
+        """Extraction patterns for the text: RE2 for ASCII texts when available, else re."""
+        if cls.EXTRACTION_PATTERNS_RE2 is not None and text.isascii():
+            return cls.EXTRACTION_PATTERNS_RE2
+        return cls.EXTRACTION_PATTERNS
     
-    def extract_process_numbers(self, text: str) -> List[str]:
+    @classmethod
+    def _iter_process_numbers(cls, text: str) -> Iterator[str]:
+        """
+        Yield valid process numbers in text order, duplicates included.
+        
+        Patterns are tried in EXTRACTION_PATTERNS order; a pattern only runs when the
+        previous ones yielded nothing, so consumers that stop early scan no further.
+        
+        Args:
+            text: Stripped text to search
+        """
+        for pattern in cls._extraction_patterns(text):
+            found = False
+            for match in pattern.finditer(text):
+                formatted = cls._format_process_parts(match.groups())
+                if formatted:
+                    found = True
+                    yield formatted
+            if found:
+                return
+    
+    @classmethod
+    def extract_process_numbers(cls, text: str) -> List[str]:
         """
         Extract all potential process numbers from text.
         
@@ -56,55 +97,16 @@ class ProcessValidator:
         Returns:
             List of potential process numbers found in the text
         """
-        process_numbers = []
         text = str(text).strip()
         
-        # Try main CNJ pattern first
-        matches = self.CNJ_FULL_PATTERN.findall(text)
-        for match in matches:
-            formatted = self._format_process_parts(match)
-            if formatted:
-                process_numbers.append(formatted)
-        
-        # Try loose pattern for numbers with missing separators
-        if not process_numbers:
-            matches = self.CNJ_LOOSE_PATTERN.findall(text)
-            for match in matches:
-                formatted = self._format_process_parts(match)
-                if formatted:
-                    process_numbers.append(formatted)
-        
-        # Try alternative patterns
-        if not process_numbers:
-            for pattern in self.ALTERNATIVE_PATTERNS:
-                matches = pattern.findall(text)
-                for match in matches:
-                    if isinstance(match, str) and len(match) == 20:
-                        # 20-digit format: break into CNJ parts
-                        parts = (
-                            match[0:7],   # NNNNNNN
-                            match[7:9],   # DD
-                            match[9:13],  # AAAA
-                            match[13:14], # J
-                            match[14:16], # TR
-                            match[16:20]  # OOOO
-                        )
-                        formatted = self._format_process_parts(parts)
-                        if formatted:
-                            process_numbers.append(formatted)
-        
         # Remove duplicates while preserving order
-        unique_processes = []
-        seen = set()
-        for proc in process_numbers:
-            if proc not in seen:
-                unique_processes.append(proc)
-                seen.add(proc)
+        unique_processes = list(dict.fromkeys(cls._iter_process_numbers(text)))
         
         logger.info(f"Extracted {len(unique_processes)} process numbers from text")
         return unique_processes
     
-    def _format_process_parts(self, parts: Tuple[str, ...]) -> Optional[str]:
+    @classmethod
+    def _format_process_parts(cls, parts: Tuple[str, ...]) -> Optional[str]:
         """
         Format process number parts into standard CNJ format.
         
@@ -132,13 +134,19 @@ class ProcessValidator:
             year_int = int(year)
             segment_int = int(segment)
             
-            if year_int not in self.VALID_YEARS:
+            if not (cls.MIN_YEAR <= year_int <= cls.MAX_YEAR):
                 logger.debug(f"Invalid year: {year}")
                 return None
             
-            if segment_int not in self.VALID_SEGMENTS:
+            if segment_int not in cls.VALID_SEGMENTS:
                 logger.debug(f"Invalid segment: {segment}")
                 return None
+            
+            # CNJ Resolution 65/2008: DD = 98 - (NNNNNNNAAAAJTROOOO * 100 mod 97)
+            expected = 98 - int(sequential + year + segment + court + origin) * 100 % 97
+            if int(check_digits) != expected:
+                logger.debug(f"Invalid check digits: {check_digits} (expected {expected:02d})")
+                return None
                 
         except ValueError:
             logger.debug(f"Invalid numeric parts in process number")
@@ -148,7 +156,8 @@ class ProcessValidator:
         formatted = f"{sequential}-{check_digits}.{year}.{segment}.{court}.{origin}"
         return formatted
     
-    def validate_process_number(self, process_number: str) -> bool:
+    @classmethod
+    def validate_process_number(cls, process_number: str) -> bool:
         """
         Validate a process number according to CNJ rules.
         
@@ -159,20 +168,25 @@ class ProcessValidator:
             True if valid, False otherwise
         """
         try:
+            # Fast path: the whole input is one CNJ number, no extraction pass needed
+            match = cls.CNJ_FULL_PATTERN.fullmatch(str(process_number).strip())
+            if match and cls._format_process_parts(match.groups()):
+                return True
+            
             # Extract and reformat to ensure consistency
-            extracted = self.extract_process_numbers(process_number)
+            extracted = cls.extract_process_numbers(process_number)
             if not extracted:
                 return False
             
-            # Additional validation could include check digit verification
-            # For now, we rely on format validation
+            # Check digits are verified while formatting each candidate
             return len(extracted) == 1
             
         except Exception as e:
             logger.debug(f"Validation failed for {process_number}: {str(e)}")
             return False
     
-    def normalize_process_number(self, process_number: str) -> str:
+    @classmethod
+    def normalize_process_number(cls, process_number: str) -> str:
         """
         Normalize a process number to standard CNJ format.
         
@@ -185,7 +199,7 @@ class ProcessValidator:
         Raises:
             ProcessValidationError: If process number is invalid
         """
-        extracted = self.extract_process_numbers(process_number)
+        extracted = cls.extract_process_numbers(process_number)
         
         if not extracted:
             raise ProcessValidationError(f"No valid process number found in: {process_number}")
@@ -195,7 +209,8 @@ class ProcessValidator:
         
         return extracted[0]
     
-    def extract_first_valid_process(self, text: str) -> Optional[str]:
+    @classmethod
+    def extract_first_valid_process(cls, text: str) -> Optional[str]:
         """
         Extract the first valid process number from text.
         
@@ -205,25 +220,60 @@ class ProcessValidator:
         Returns:
             First valid process number or None if none found
         """
-        extracted = self.extract_process_numbers(text)
-        return extracted[0] if extracted else None
+        text = str(text).strip()
+        
+        # Fast path: input is exactly one formatted CNJ number (the common tool call)
+        match = cls.CNJ_STRICT_PATTERN.fullmatch(text)
+        if match:
+            formatted = cls._format_process_parts(match.groups())
+            if formatted:
+                return formatted
+        
+        # Stop at the first valid match instead of collecting every one
+        return next(cls._iter_process_numbers(text), None)
+
 
+# Module-level convenience functions (the validator is stateless: no instance needed)
+# Inputs up to this many characters are memoized by extract_first_process and
+# validate_process_number; longer pasted texts are rarely repeated verbatim and
+# would pin memory in the cache
+EXTRACT_CACHE_MAX_TEXT = 4096
 
-# Module-level convenience functions
-_validator = ProcessValidator()
+# extract_process_numbers keeps a copy of every number found, so only short inputs
+# (single identifiers, short messages) are memoized
+EXTRACT_ALL_CACHE_MAX_TEXT = 256
+
+@functools.lru_cache(maxsize=1024)
+def _extract_process_numbers_cached(text: str) -> Tuple[str, ...]:
+    return tuple(ProcessValidator.extract_process_numbers(text))
 
 def extract_process_numbers(text: str) -> List[str]:
-    """Extract process numbers from text."""
-    return _validator.extract_process_numbers(text)
+    """Extract process numbers from text (memoized for repeated short inputs)."""
+    if isinstance(text, str) and len(text) <= EXTRACT_ALL_CACHE_MAX_TEXT:
+        # Fresh list per call: callers may modify the result
+        return list(_extract_process_numbers_cached(text))
+    return ProcessValidator.extract_process_numbers(text)
+
+@functools.lru_cache(maxsize=4096)
+def _validate_process_number_cached(process_number: str) -> bool:
+    return ProcessValidator.validate_process_number(process_number)
 
 def validate_process_number(process_number: str) -> bool:
-    """Validate a process number."""
-    return _validator.validate_process_number(process_number)
+    """Validate a process number (memoized for repeated inputs)."""
+    if isinstance(process_number, str) and len(process_number) <= EXTRACT_CACHE_MAX_TEXT:
+        return _validate_process_number_cached(process_number)
+    return ProcessValidator.validate_process_number(process_number)
 
 def normalize_process_number(process_number: str) -> str:
     """Normalize a process number to standard format."""
-    return _validator.normalize_process_number(process_number)
+    return ProcessValidator.normalize_process_number(process_number)
+
+@functools.lru_cache(maxsize=4096)
+def _extract_first_process_cached(text: str) -> Optional[str]:
+    return ProcessValidator.extract_first_valid_process(text)
 
 def extract_first_process(text: str) -> Optional[str]:
-    """Extract the first valid process number from text."""
-    return _validator.extract_first_valid_process(text)
\ No newline at end of file
+    """Extract the first valid process number from text (memoized for repeated short inputs)."""
+    if isinstance(text, str) and len(text) <= EXTRACT_CACHE_MAX_TEXT:
+        return _extract_first_process_cached(text)
+    return ProcessValidator.extract_first_valid_process(text)
@@ -0,0 +1,196 @@
+"""
+Persistent result cache for Justice Agent tools.
+Stores successful consultation responses on disk, keyed by (kind, normalized identifier),
+so repeated consultations of the same process/document skip the remote search and polling.
+A bounded in-memory LRU layer in front of the files serves repeats within one process
+without touching the disk.
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+from .serialization import dumps_bytes, loads
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = "~/.cache/justice-agent"
+DEFAULT_CACHE_TTL = 3600.0  # 1 hour
+DEFAULT_MEMORY_ENTRIES = 256
+DEFAULT_STALE_MAX_AGE = 86400.0  # 24 hours
+
+
+class ResultCache:
+    """
+    File-backed cache with a time-to-live, one JSON file per entry.
+
+    Entries expire based on the file modification time; writes are atomic
+    (temp file + rename) so concurrent processes never read partial entries.
+    Recently used entries are also kept in memory (as serialized bytes, so every
+    hit returns a fresh object) with the same TTL, evicting the least recently used.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        ttl: Optional[float] = None,
+        enabled: Optional[bool] = None,
+        memory_entries: Optional[int] = None
+    ):
+        """
+        Initialize the result cache.
+
+        Args:
+            cache_dir: Directory for cache entries (defaults to JUSTICE_AGENT_CACHE_DIR)
+            ttl: Entry lifetime in seconds (defaults to JUSTICE_AGENT_CACHE_TTL)
+            enabled: Whether caching is active (defaults to JUSTICE_AGENT_CACHE == "1"; off unless opted in)
+            memory_entries: In-memory LRU size (defaults to JUSTICE_AGENT_CACHE_MEMORY_ENTRIES; 0 disables it)
+        """
+        self.cache_dir = Path(os.path.expanduser(
+            cache_dir or os.getenv('JUSTICE_AGENT_CACHE_DIR', DEFAULT_CACHE_DIR)
+        ))
+        self.ttl = ttl if ttl is not None else float(os.getenv('JUSTICE_AGENT_CACHE_TTL', DEFAULT_CACHE_TTL))
+        self.enabled = enabled if enabled is not None else os.getenv('JUSTICE_AGENT_CACHE', '0') == '1'
+        self.memory_entries = (
+            memory_entries if memory_entries is not None
+            else int(os.getenv('JUSTICE_AGENT_CACHE_MEMORY_ENTRIES', DEFAULT_MEMORY_ENTRIES))
+        )
+        # key -> (expiry on the monotonic clock, serialized value)
+        self._memory: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+
+    @staticmethod
+    def cache_key(kind: str, identifier: str) -> str:
+        """
+        Build a stable cache key for a consultation.
+
+        Args:
+            kind: Consultation kind (e.g. "process", "document")
+            identifier: Normalized process number or document
+
+        Returns:
+            SHA-256 hex digest of the canonical (kind, identifier) pair
+        """
+        raw = json.dumps({"kind": kind, "identifier": identifier}, sort_keys=True)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _remember(self, key: str, data: bytes, expires_at: float):
+        """Keep a serialized entry in the in-memory LRU."""
+        if self.memory_entries <= 0:
+            return
+        with self._memory_lock:
+            self._memory[key] = (expires_at, data)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def _recall(self, key: str) -> Optional[bytes]:
+        """Get a live in-memory entry, marking it as recently used."""
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry[0]:
+                del self._memory[key]
+                return None
+            self._memory.move_to_end(key)
+            return entry[1]
+
+    def get(self, kind: str, identifier: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached result, or None on miss, expiry or when disabled.
+        """
+        if not self.enabled:
+            return None
+
+        key = self.cache_key(kind, identifier)
+        data = self._recall(key)
+        if data is not None:
+            return loads(data)
+
+        path = self._entry_path(key)
+        try:
+            age = time.time() - path.stat().st_mtime
+            if age > self.ttl:
+                return None
+            with open(path, 'rb') as f:
+                data = f.read()
+            value = loads(data)
+            self._remember(key, data, time.monotonic() + self.ttl - age)
+            return value
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {path.name}: {str(e)}")
+            return None
+
+    def get_stale(
+        self,
+        kind: str,
+        identifier: str,
+        max_age: float = DEFAULT_STALE_MAX_AGE
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the last stored result even if its TTL has passed, up to max_age seconds old.
+        
+        Meant as a fallback when a live consultation fails; None on miss or when disabled.
+        """
+        if not self.enabled:
+            return None
+
+        path = self._entry_path(self.cache_key(kind, identifier))
+        try:
+            if time.time() - path.stat().st_mtime > max_age:
+                return None
+            with open(path, 'rb') as f:
+                return loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {path.name}: {str(e)}")
+            return None
+
+    def set(self, kind: str, identifier: str, value: Dict[str, Any]):
+        """
+        Store a result. Failures are logged and never propagated to the caller.
+        """
+        if not self.enabled:
+            return
+
+        key = self.cache_key(kind, identifier)
+        path = self._entry_path(key)
+        try:
+            data = dumps_bytes(value)
+            self._remember(key, data, time.monotonic() + self.ttl)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write cache entry for {kind} {identifier}: {str(e)}")
+
+
+# Module-level shared cache
+_result_cache: Optional[ResultCache] = None
+
+def get_result_cache() -> ResultCache:
+    """Get the shared result cache configured from the environment."""
+    global _result_cache
+    if _result_cache is None:
+        _result_cache = ResultCache()
+    return _result_cache
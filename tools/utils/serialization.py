@@ -0,0 +1,83 @@
+"""
+JSON serialization helpers for Justice Agent tools.
+Uses orjson when it is installed and falls back to the standard library otherwise;
+both paths produce UTF-8 output without ASCII escaping.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+def dumps_bytes(obj: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+    
+    Args:
+        obj: JSON-serializable object
+        pretty: Indent with 2 spaces
+        
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(obj, indent=2 if pretty else None, ensure_ascii=False).encode('utf-8')
+
+
+def dumps(obj: Any, pretty: bool = False) -> str:
+    """
+    Serialize an object to a JSON string.
+    
+    Args:
+        obj: JSON-serializable object
+        pretty: Indent with 2 spaces
+        
+    Returns:
+        JSON document as str
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode('utf-8')
+    return json.dumps(obj, indent=2 if pretty else None, ensure_ascii=False)
+
+
+class LazyJSON:
+    """
+    Defers JSON serialization until the object is converted to str.
+    
+    Meant for logging arguments: logger.info("Response: %s", LazyJSON(data)) only
+    serializes if the record is actually emitted by a handler.
+    """
+    
+    __slots__ = ('obj', 'pretty')
+    
+    def __init__(self, obj: Any, pretty: bool = True):
+        """
+        Args:
+            obj: JSON-serializable object
+            pretty: Indent with 2 spaces
+        """
+        self.obj = obj
+        self.pretty = pretty
+    
+    def __str__(self) -> str:
+        return dumps(self.obj, pretty=self.pretty)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document.
+    
+    Args:
+        data: JSON as str or bytes
+        
+    Returns:
+        Parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,40 @@
+"""
+Phase timing helpers for Justice Agent tools and test scripts.
+Uses the monotonic high-resolution perf counter so sub-millisecond phases are measurable.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+
+@contextmanager
+def timed(label: str, out: Dict[str, float]) -> Iterator[None]:
+    """
+    Measure the wall-clock duration of a block.
+    
+    The elapsed time (in seconds) is stored in out[label] even if the block raises,
+    so failed phases still show up in the breakdown.
+    
+    Args:
+        label: Phase name (e.g. "initiate", "poll", "fetch")
+        out: Dict that receives the measurement
+    """
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        out[label] = (time.perf_counter_ns() - start) / 1e9
+
+
+def format_timings(timings: Dict[str, float]) -> str:
+    """
+    Format a phase breakdown for logs and test output.
+    
+    Args:
+        timings: Phase name -> seconds
+        
+    Returns:
+        String like "initiate=0.120s poll=3.504s fetch=0.210s"
+    """
+    return " ".join(f"{label}={seconds:.3f}s" for label, seconds in timings.items())